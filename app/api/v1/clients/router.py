@@ -1107,7 +1107,7 @@ async def get_currently_scheduled_clients(
     logger.info(f"Active shifts found: {len(active_shifts)}")
 
     # Get unique client IDs from active shifts
-    client_ids = list(set([shift.client_id for shift in active_shifts if shift.client_id]))
+    client_ids = {shift.client_id for shift in active_shifts if shift.client_id}
 
     if not client_ids:
         logger.info("No active shifts with clients found, returning empty list")
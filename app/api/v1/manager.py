@@ -1,19 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, and_, or_, desc
-from datetime import datetime, timezone, date, timedelta
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse, ORJSONResponse
+from sqlalchemy.orm import Session, defaultload, joinedload, raiseload, selectinload
+from sqlalchemy import func, and_, or_, desc, select, insert, update, union_all, literal, tuple_, case
+from datetime import datetime, timezone, date, time, timedelta
 from typing import Optional, List
-from app.core.database import get_db
-from app.core.dependencies import get_manager_or_above
+from functools import lru_cache
+import base64
+import logging
+import uuid
+from urllib.parse import urlencode
+import orjson
+from app.core.database import SessionLocal, begin_read_only_snapshot
+from app.core.dependencies import get_manager_or_above, get_org_scoped_db
 from app.services.email_service import EmailService
 from app.core.config import settings
+from app.core.errors import handle_errors
+from app.core.cache import (
+    cache_get_json, cache_set_json, approval_count_key, invalidate_approval_counts, cert_alerts_key,
+    training_due_soon_key, invalidate_training_due_soon
+)
 from app.models.user import User
-from app.models.client import Client, CarePlan
+from app.models.client import Client, CarePlan, ClientAssignment, ClientLocation
 from app.models.staff import (
     Staff, StaffAssignment, TimeOffRequest, TimeOffStatus,
     StaffCertification, TrainingRecord, TrainingProgram, CertificationStatus, TrainingStatus
 )
-from app.models.scheduling import Shift, Appointment, AppointmentStatus, ShiftExchangeRequest, ShiftExchangeStatus
+from app.models.scheduling import (
+    Shift, Appointment, AppointmentStatus, ShiftExchangeRequest, ShiftExchangeStatus, SHIFT_EXCHANGE_STATUSES
+)
 from app.models.location import Location
 from app.schemas.scheduling import (
     ShiftExchangeRequestResponse,
@@ -57,6 +71,8 @@ from app.schemas.manager import (
 from app.schemas.staff import TrainingProgramCreate, TrainingProgramResponse
 from pydantic import BaseModel, Field
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -67,10 +83,13 @@ class ApprovalCountResponse(BaseModel):
     total_pending: int = Field(..., description="Total pending approvals")
 
 
+APPROVAL_COUNT_CACHE_TTL = 10  # seconds; the sidebar badge polls this endpoint
+
+
 @router.get("/approvals/count", response_model=ApprovalCountResponse)
-async def get_approval_counts(
+def get_approval_counts(
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
     """
     Get counts of pending approvals for sidebar badge indicator.
@@ -78,510 +97,485 @@ async def get_approval_counts(
     """
     org_id = current_user.organization_id
 
+    cache_key = approval_count_key(org_id)
+    cached = cache_get_json(cache_key)
+    if cached is not None:
+        return ApprovalCountResponse(**cached)
+
     # Count pending time-off requests
-    time_off_pending = db.query(TimeOffRequest).join(Staff).filter(
+    time_off_count = select(func.count()).select_from(TimeOffRequest).join(
+        Staff, TimeOffRequest.staff_id == Staff.id
+    ).where(
         Staff.organization_id == org_id,
         TimeOffRequest.status == TimeOffStatus.PENDING
-    ).count()
+    ).scalar_subquery()
 
     # Count pending shift exchange requests (pending_manager status)
-    shift_exchange_pending = db.query(ShiftExchangeRequest).filter(
+    shift_exchange_count = select(func.count()).select_from(ShiftExchangeRequest).where(
         ShiftExchangeRequest.organization_id == org_id,
         ShiftExchangeRequest.status == ShiftExchangeStatus.PENDING_MANAGER
-    ).count()
+    ).scalar_subquery()
+
+    # Both counts in a single round-trip
+    time_off_pending, shift_exchange_pending = db.execute(
+        select(time_off_count, shift_exchange_count)
+    ).one()
 
     total_pending = time_off_pending + shift_exchange_pending
 
-    return ApprovalCountResponse(
+    response = ApprovalCountResponse(
         time_off_pending=time_off_pending,
         shift_exchange_pending=shift_exchange_pending,
         total_pending=total_pending
     )
+    cache_set_json(cache_key, response.model_dump(), APPROVAL_COUNT_CACHE_TTL)
+
+    return response
 
 @router.get("/dashboard", response_model=ManagerDashboardOverview)
-async def get_manager_dashboard(
+@handle_errors("retrieve manager dashboard")
+def get_manager_dashboard(
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
     """
     Get comprehensive manager dashboard overview
     Managers see data for their organization and supervised staff
     """
-    try:
-        org_id = current_user.organization_id
-
-        # Get staff under supervision (all staff in organization for managers)
-        # In a more complex system, you'd filter by supervisor_id
-        staff_query = db.query(Staff).filter(Staff.organization_id == org_id)
-        total_staff = staff_query.count()
-        active_staff = staff_query.filter(Staff.employment_status == "ACTIVE").count()
-        on_leave_staff = staff_query.filter(Staff.employment_status == "ON_LEAVE").count()
-
-        # Get clients
-        client_query = db.query(Client).filter(Client.organization_id == org_id)
-        total_clients = client_query.count()
-        active_clients = client_query.filter(Client.status == "active").count()
-
-        team_stats = TeamStats(
-            total_staff=total_staff,
-            active_staff=active_staff,
-            on_leave_staff=on_leave_staff,
-            total_clients=total_clients,
-            active_clients=active_clients
-        )
+    org_id = current_user.organization_id
 
-        # Documentation metrics - count actual documentation records in last 7 days
-        seven_days_ago = datetime.utcnow() - timedelta(days=7)
+    # Run every aggregate below against a single read-only snapshot
+    begin_read_only_snapshot(db)
+
+    # Resolve the reporting window once so every aggregate binds the same timestamps
+    now = datetime.now(timezone.utc)
+    today = now.date()
+    seven_days_ago = now - timedelta(days=7)
+    thirty_days_ago = now - timedelta(days=30)
+    # Meal and activity dates are naive UTC columns; bind the window naive too
+    seven_days_ago_naive = seven_days_ago.replace(tzinfo=None)
+
+    # Get staff under supervision (all staff in organization for managers)
+    # In a more complex system, you'd filter by supervisor_id
+    staff_count = select(func.count()).select_from(Staff).where(Staff.organization_id == org_id)
+    total_staff = db.execute(staff_count).scalar_one()
+    active_staff = db.execute(staff_count.where(Staff.employment_status == "ACTIVE")).scalar_one()
+    on_leave_staff = db.execute(staff_count.where(Staff.employment_status == "ON_LEAVE")).scalar_one()
+
+    # Get clients
+    client_count = select(func.count()).select_from(Client).where(Client.organization_id == org_id)
+    total_clients = db.execute(client_count).scalar_one()
+    active_clients = db.execute(client_count.where(Client.status == "active")).scalar_one()
+
+    team_stats = TeamStats(
+        total_staff=total_staff,
+        active_staff=active_staff,
+        on_leave_staff=on_leave_staff,
+        total_clients=total_clients,
+        active_clients=active_clients
+    )
 
-        # Count all documentation types created in the last 7 days
-        shift_notes_count = db.query(ShiftNote).filter(
+    # Documentation metrics - count actual documentation records in last 7 days
+    # Count all documentation types created in the last 7 days in a single round-trip
+    documentation_counts = db.execute(union_all(
+        select(literal("shift_notes"), func.count()).select_from(ShiftNote).where(
             ShiftNote.organization_id == org_id,
             ShiftNote.created_at >= seven_days_ago
-        ).count()
-
-        vitals_count = db.query(VitalsLog).filter(
+        ),
+        select(literal("vitals"), func.count()).select_from(VitalsLog).where(
             VitalsLog.organization_id == org_id,
             VitalsLog.recorded_at >= seven_days_ago
-        ).count()
-
-        meals_count = db.query(MealLog).filter(
+        ),
+        select(literal("meals"), func.count()).select_from(MealLog).where(
             MealLog.organization_id == org_id,
-            MealLog.meal_date >= seven_days_ago
-        ).count()
-
-        activities_count = db.query(ActivityLog).filter(
+            MealLog.meal_date >= seven_days_ago_naive
+        ),
+        select(literal("activities"), func.count()).select_from(ActivityLog).where(
             ActivityLog.organization_id == org_id,
-            ActivityLog.activity_date >= seven_days_ago
-        ).count()
-
-        incidents_count = db.query(IncidentReport).filter(
+            ActivityLog.activity_date >= seven_days_ago_naive
+        ),
+        select(literal("incidents"), func.count()).select_from(IncidentReport).where(
             IncidentReport.organization_id == org_id,
             IncidentReport.incident_date >= seven_days_ago.date()
-        ).count()
-
-        completed = shift_notes_count + vitals_count + meals_count + activities_count + incidents_count
+        )
+    )).all()
 
-        # Calculate pending tasks for documentation
-        pending = db.query(Task).filter(
-            Task.organization_id == org_id,
-            Task.status == TaskStatusEnum.PENDING,
-            Task.due_date >= seven_days_ago
-        ).count()
+    completed = sum(count for _, count in documentation_counts)
 
-        total_required = completed + pending
-        completion_rate = (completed / total_required * 100) if total_required > 0 else 100.0
+    # Calculate pending tasks for documentation
+    pending = db.execute(select(func.count()).select_from(Task).where(
+        Task.organization_id == org_id,
+        Task.status == TaskStatusEnum.PENDING,
+        Task.due_date >= seven_days_ago
+    )).scalar_one()
 
-        documentation_metrics = DocumentationMetrics(
-            total_required=total_required,
-            completed=completed,
-            pending=pending,
-            completion_rate=completion_rate
-        )
+    total_required = completed + pending
+    completion_rate = (completed / total_required * 100) if total_required > 0 else 100.0
 
-        # Incident metrics
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        incidents_query = db.query(IncidentReport).filter(
-            IncidentReport.organization_id == org_id,
-            IncidentReport.incident_date >= thirty_days_ago.date()
-        )
-        total_incidents = incidents_query.count()
-        resolved = incidents_query.filter(IncidentReport.status == IncidentStatusEnum.RESOLVED).count()
-        pending_review = incidents_query.filter(IncidentReport.status == IncidentStatusEnum.UNDER_REVIEW).count()
-        critical = incidents_query.filter(IncidentReport.severity == IncidentSeverityEnum.CRITICAL).count()
-
-        incident_metrics = IncidentMetrics(
-            total_incidents=total_incidents,
-            resolved=resolved,
-            pending_review=pending_review,
-            critical=critical
-        )
+    documentation_metrics = DocumentationMetrics(
+        total_required=total_required,
+        completed=completed,
+        pending=pending,
+        completion_rate=completion_rate
+    )
 
-        # Pending approvals
-        pending_approvals = []
+    # Incident metrics
+    incidents_count = select(func.count()).select_from(IncidentReport).where(
+        IncidentReport.organization_id == org_id,
+        IncidentReport.incident_date >= thirty_days_ago.date()
+    )
+    total_incidents = db.execute(incidents_count).scalar_one()
+    resolved = db.execute(incidents_count.where(IncidentReport.status == IncidentStatusEnum.RESOLVED)).scalar_one()
+    pending_review = db.execute(incidents_count.where(IncidentReport.status == IncidentStatusEnum.UNDER_REVIEW)).scalar_one()
+    critical = db.execute(incidents_count.where(IncidentReport.severity == IncidentSeverityEnum.CRITICAL)).scalar_one()
+
+    incident_metrics = IncidentMetrics(
+        total_incidents=total_incidents,
+        resolved=resolved,
+        pending_review=pending_review,
+        critical=critical
+    )
 
-        # Time off requests pending approval
-        time_off_requests = db.query(TimeOffRequest).join(Staff).filter(
-            Staff.organization_id == org_id,
-            TimeOffRequest.status == TimeOffStatus.PENDING
-        ).order_by(TimeOffRequest.requested_date).limit(10).all()
-
-        for request in time_off_requests:
-            pending_approvals.append(PendingApproval(
-                id=str(request.id),
-                type="time_off",
-                staff_id=str(request.staff_id),
-                staff_name=request.staff.full_name if request.staff else "Unknown",
-                title=f"{request.request_type.value.title()} Request",
-                description=f"{request.start_date} to {request.end_date}",
-                submitted_at=request.requested_date,
-                priority="normal",
-                metadata={
-                    "start_date": str(request.start_date),
-                    "end_date": str(request.end_date),
-                    "type": request.request_type.value
-                }
-            ))
-
-        # Shift exchange requests pending manager approval
-        pending_exchanges = db.query(ShiftExchangeRequest).filter(
-            ShiftExchangeRequest.organization_id == org_id,
-            ShiftExchangeRequest.status == ShiftExchangeStatus.PENDING_MANAGER
-        ).order_by(ShiftExchangeRequest.requested_at).limit(10).all()
-
-        for exchange in pending_exchanges:
-            requester_name = exchange.requester_staff.full_name if exchange.requester_staff else "Unknown"
-            target_name = exchange.target_staff.full_name if exchange.target_staff else "Unknown"
-            pending_approvals.append(PendingApproval(
-                id=str(exchange.id),
-                type="shift_exchange",
-                staff_id=str(exchange.requester_staff_id),
-                staff_name=requester_name,
-                title="Shift Exchange Request",
-                description=f"{requester_name} wants to exchange shifts with {target_name}",
-                submitted_at=exchange.requested_at,
-                priority="normal",
-                metadata={
-                    "requester_name": requester_name,
-                    "target_name": target_name,
-                    "requester_shift_id": str(exchange.requester_shift_id),
-                    "target_shift_id": str(exchange.target_shift_id),
-                    "peer_accepted_at": str(exchange.peer_responded_at) if exchange.peer_responded_at else None
-                }
-            ))
-
-        # Recent shift notes (last 7 days) - for manager review
-        seven_days_ago = datetime.utcnow() - timedelta(days=7)
-        recent_shift_notes = db.query(ShiftNote).filter(
-            ShiftNote.organization_id == org_id,
-            ShiftNote.created_at >= seven_days_ago
-        ).order_by(ShiftNote.created_at.desc()).limit(5).all()
-
-        for note in recent_shift_notes:
-            staff_name = "Unknown"
-            if note.staff:
-                staff_name = f"{note.staff.first_name} {note.staff.last_name}"
-
-            pending_approvals.append(PendingApproval(
-                id=str(note.id),
-                type="shift_note",
-                staff_id=str(note.staff_id),
-                staff_name=staff_name,
-                title="Recent Shift Note",
-                description=f"Client: {note.client.first_name} {note.client.last_name}" if note.client else "N/A",
-                submitted_at=note.created_at,
-                priority="normal"
-            ))
-
-        # Staff on shift currently (shifts in progress for today)
-        from app.models.scheduling import ShiftStatus
-        today = date.today()
-        staff_on_shift = db.query(Shift).join(Staff).filter(
-            Staff.organization_id == org_id,
-            Shift.shift_date == today,
-            Shift.status == ShiftStatus.IN_PROGRESS
-        ).count()
+    # Pending approvals
+    pending_approvals = []
 
-        # Appointments today
-        today = date.today()
-        appointments_today = db.query(Appointment).filter(
-            Appointment.organization_id == org_id,
-            func.date(Appointment.start_datetime) == today
-        ).count()
-
-        # Overdue tasks
-        tasks_overdue = db.query(Task).filter(
-            Task.organization_id == org_id,
-            Task.due_date < today,
-            Task.status != TaskStatusEnum.COMPLETED
-        ).count()
-
-        return ManagerDashboardOverview(
-            team_stats=team_stats,
-            documentation_metrics=documentation_metrics,
-            incident_metrics=incident_metrics,
-            pending_approvals=pending_approvals,
-            staff_on_shift=staff_on_shift,
-            appointments_today=appointments_today,
-            tasks_overdue=tasks_overdue,
-            last_updated=datetime.utcnow()
-        )
+    # Time off requests pending approval
+    time_off_requests = db.query(TimeOffRequest).join(Staff).options(
+        selectinload(TimeOffRequest.staff).selectinload(Staff.user)
+    ).filter(
+        Staff.organization_id == org_id,
+        TimeOffRequest.status == TimeOffStatus.PENDING
+    ).order_by(TimeOffRequest.requested_date).limit(10).all()
+
+    for request in time_off_requests:
+        pending_approvals.append(PendingApproval(
+            id=str(request.id),
+            type="time_off",
+            staff_id=str(request.staff_id),
+            staff_name=request.staff.full_name if request.staff else "Unknown",
+            title=f"{request.request_type.value.title()} Request",
+            description=f"{request.start_date} to {request.end_date}",
+            submitted_at=request.requested_date,
+            priority="normal",
+            metadata={
+                "start_date": str(request.start_date),
+                "end_date": str(request.end_date),
+                "type": request.request_type.value
+            }
+        ))
 
-    except Exception as e:
-        import traceback
-        print(f"ERROR in manager dashboard: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve manager dashboard: {str(e)}"
-        )
+    # Shift exchange requests pending manager approval
+    pending_exchanges = db.query(ShiftExchangeRequest).options(
+        selectinload(ShiftExchangeRequest.requester_staff).selectinload(Staff.user),
+        selectinload(ShiftExchangeRequest.target_staff).selectinload(Staff.user)
+    ).filter(
+        ShiftExchangeRequest.organization_id == org_id,
+        ShiftExchangeRequest.status == ShiftExchangeStatus.PENDING_MANAGER
+    ).order_by(ShiftExchangeRequest.requested_at).limit(10).all()
+
+    for exchange in pending_exchanges:
+        requester_name = exchange.requester_staff.full_name if exchange.requester_staff else "Unknown"
+        target_name = exchange.target_staff.full_name if exchange.target_staff else "Unknown"
+        pending_approvals.append(PendingApproval(
+            id=str(exchange.id),
+            type="shift_exchange",
+            staff_id=str(exchange.requester_staff_id),
+            staff_name=requester_name,
+            title="Shift Exchange Request",
+            description=f"{requester_name} wants to exchange shifts with {target_name}",
+            submitted_at=exchange.requested_at,
+            priority="normal",
+            metadata={
+                "requester_name": requester_name,
+                "target_name": target_name,
+                "requester_shift_id": str(exchange.requester_shift_id),
+                "target_shift_id": str(exchange.target_shift_id),
+                "peer_accepted_at": str(exchange.peer_responded_at) if exchange.peer_responded_at else None
+            }
+        ))
+
+    # Recent shift notes (last 7 days) - for manager review
+    recent_shift_notes = db.query(ShiftNote).options(
+        selectinload(ShiftNote.staff),
+        selectinload(ShiftNote.client)
+    ).filter(
+        ShiftNote.organization_id == org_id,
+        ShiftNote.created_at >= seven_days_ago
+    ).order_by(ShiftNote.created_at.desc()).limit(5).all()
+
+    for note in recent_shift_notes:
+        staff_name = "Unknown"
+        if note.staff:
+            staff_name = f"{note.staff.first_name} {note.staff.last_name}"
+
+        pending_approvals.append(PendingApproval(
+            id=str(note.id),
+            type="shift_note",
+            staff_id=str(note.staff_id),
+            staff_name=staff_name,
+            title="Recent Shift Note",
+            description=f"Client: {note.client.first_name} {note.client.last_name}" if note.client else "N/A",
+            submitted_at=note.created_at,
+            priority="normal"
+        ))
+
+    # Staff on shift currently (shifts in progress for today)
+    from app.models.scheduling import ShiftStatus
+    staff_on_shift = db.execute(select(func.count()).select_from(Shift).join(Staff).where(
+        Staff.organization_id == org_id,
+        Shift.shift_date == today,
+        Shift.status == ShiftStatus.IN_PROGRESS
+    )).scalar_one()
+
+    # Appointments today (half-open range keeps start_datetime index-usable)
+    day_start = datetime.combine(today, time.min)
+    day_end = day_start + timedelta(days=1)
+    appointments_today = db.execute(select(func.count()).select_from(Appointment).where(
+        Appointment.organization_id == org_id,
+        Appointment.start_datetime >= day_start,
+        Appointment.start_datetime < day_end
+    )).scalar_one()
+
+    # Overdue tasks
+    tasks_overdue = db.execute(select(func.count()).select_from(Task).where(
+        Task.organization_id == org_id,
+        Task.due_date < today,
+        Task.status != TaskStatusEnum.COMPLETED
+    )).scalar_one()
+
+    return ManagerDashboardOverview(
+        team_stats=team_stats,
+        documentation_metrics=documentation_metrics,
+        incident_metrics=incident_metrics,
+        pending_approvals=pending_approvals,
+        staff_on_shift=staff_on_shift,
+        appointments_today=appointments_today,
+        tasks_overdue=tasks_overdue,
+        last_updated=now
+    )
 
 @router.get("/staff", response_model=List[StaffMemberSummary])
-async def get_staff_list(
+@handle_errors("retrieve staff list")
+def get_staff_list(
+    request: Request,
+    response: Response,
     status: Optional[str] = Query(None, description="Filter by employment status"),
     search: Optional[str] = Query(None, description="Search by name or employee ID"),
-    limit: int = Query(50, le=100),
+    limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0),
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
     """
     Get list of staff members under supervision with oversight metrics
     """
-    try:
-        org_id = current_user.organization_id
+    org_id = current_user.organization_id
 
-        query = db.query(Staff).join(User, Staff.user_id == User.id).filter(
-            Staff.organization_id == org_id,
-            Staff.user_id != current_user.id  # Exclude the currently logged in user
-        )
+    query = db.query(
+        Staff.id,
+        Staff.user_id,
+        Staff.employee_id,
+        Staff.job_title,
+        Staff.department,
+        Staff.employment_status,
+        User.first_name,
+        User.last_name
+    ).join(User, Staff.user_id == User.id).filter(
+        Staff.organization_id == org_id,
+        Staff.user_id != current_user.id  # Exclude the currently logged in user
+    )
 
-        if status:
-            query = query.filter(Staff.employment_status == status.upper())
+    if status:
+        query = query.filter(Staff.employment_status == status.upper())
 
-        if search:
-            query = query.filter(
-                or_(
-                    User.first_name.ilike(f"%{search}%"),
-                    User.last_name.ilike(f"%{search}%"),
-                    Staff.employee_id.ilike(f"%{search}%")
-                )
+    if search:
+        query = query.filter(
+            or_(
+                User.full_name.ilike(f"%{search}%"),
+                Staff.employee_id.ilike(f"%{search}%")
             )
+        )
 
-        staff_list = query.order_by(User.last_name).offset(offset).limit(limit).all()
-
-        results = []
-        for staff in staff_list:
-            # Count assigned clients
-            clients_assigned = db.query(StaffAssignment).filter(
-                StaffAssignment.staff_id == staff.id,
-                StaffAssignment.is_active == True
-            ).count()
-
-            # Count certifications expiring in next 60 days
-            sixty_days_from_now = date.today() + timedelta(days=60)
-            certifications_expiring = db.query(StaffCertification).filter(
-                StaffCertification.staff_id == staff.id,
-                StaffCertification.expiry_date.isnot(None),
-                StaffCertification.expiry_date <= sixty_days_from_now,
-                StaffCertification.expiry_date >= date.today(),
-                StaffCertification.status == CertificationStatus.ACTIVE
-            ).count()
-
-            # Calculate training completion rate
-            total_training = db.query(TrainingRecord).filter(
-                TrainingRecord.staff_id == staff.id
-            ).count()
-            completed_training = db.query(TrainingRecord).filter(
-                TrainingRecord.staff_id == staff.id,
-                TrainingRecord.status == TrainingStatus.COMPLETED
-            ).count()
-            training_completion = (completed_training / total_training * 100) if total_training > 0 else 0.0
-
-            # Last activity (last shift date)
-            last_shift = db.query(Shift).filter(
-                Shift.staff_id == staff.id
-            ).order_by(Shift.shift_date.desc()).first()
-            # Combine shift_date and start_time into a datetime for last_active
-            if last_shift:
-                last_active = datetime.combine(last_shift.shift_date, last_shift.start_time)
-            else:
-                last_active = None
-
-            results.append(StaffMemberSummary(
-                staff_id=str(staff.id),
-                user_id=str(staff.user_id),
-                full_name=staff.full_name,
-                employee_id=staff.employee_id,
-                job_title=staff.job_title,
-                department=staff.department,
-                employment_status=staff.employment_status.value,
-                clients_assigned=clients_assigned,
-                certifications_expiring=certifications_expiring,
-                training_completion=training_completion,
-                last_active=last_active
-            ))
-
-        return results
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve staff list: {str(e)}"
+    staff_list = query.order_by(User.last_name).offset(offset).limit(limit + 1).all()
+    if len(staff_list) > limit:
+        staff_list = staff_list[:limit]
+        response.headers.update(_next_offset_headers(offset, limit, request.query_params))
+
+    # Last shift per staff member for the page in one DISTINCT ON query
+    last_shifts = {}
+    staff_ids = [staff.id for staff in staff_list]
+    if staff_ids:
+        last_shifts = {
+            shift.staff_id: shift
+            for shift in db.query(
+                Shift.staff_id, Shift.shift_date, Shift.start_time
+            ).distinct(Shift.staff_id).filter(
+                Shift.staff_id.in_(staff_ids)
+            ).order_by(Shift.staff_id, Shift.shift_date.desc()).all()
+        }
+
+    # Certifications expiring in the next 60 days, counted for the whole page at once
+    certifications_expiring_counts = {}
+    if staff_ids:
+        today = date.today()
+        sixty_days_from_now = today + timedelta(days=60)
+        certifications_expiring_counts = dict(
+            db.query(
+                StaffCertification.staff_id,
+                func.count(StaffCertification.id)
+            ).filter(
+                StaffCertification.staff_id.in_(staff_ids),
+                StaffCertification.status == CertificationStatus.ACTIVE,
+                StaffCertification.expiry_date.between(today, sixty_days_from_now)
+            ).group_by(StaffCertification.staff_id).all()
         )
 
+    results = []
+    for staff in staff_list:
+        # Count assigned clients
+        clients_assigned = db.execute(select(func.count()).select_from(StaffAssignment).where(
+            StaffAssignment.staff_id == staff.id,
+            StaffAssignment.is_active == True
+        )).scalar_one()
+
+        certifications_expiring = certifications_expiring_counts.get(staff.id, 0)
+
+        # Calculate training completion rate
+        total_training = db.execute(select(func.count()).select_from(TrainingRecord).where(
+            TrainingRecord.staff_id == staff.id
+        )).scalar_one()
+        completed_training = db.execute(select(func.count()).select_from(TrainingRecord).where(
+            TrainingRecord.staff_id == staff.id,
+            TrainingRecord.status == TrainingStatus.COMPLETED
+        )).scalar_one()
+        training_completion = (completed_training / total_training * 100) if total_training > 0 else 0.0
+
+        # Last activity (last shift date)
+        last_shift = last_shifts.get(staff.id)
+        # Combine shift_date and start_time into a datetime for last_active
+        if last_shift:
+            last_active = datetime.combine(last_shift.shift_date, last_shift.start_time)
+        else:
+            last_active = None
+
+        results.append(StaffMemberSummary(
+            staff_id=str(staff.id),
+            user_id=str(staff.user_id),
+            full_name=f"{staff.first_name} {staff.last_name}",
+            employee_id=staff.employee_id,
+            job_title=staff.job_title,
+            department=staff.department,
+            employment_status=staff.employment_status.value,
+            clients_assigned=clients_assigned,
+            certifications_expiring=certifications_expiring,
+            training_completion=training_completion,
+            last_active=last_active
+        ))
+
+    return results
+
 @router.get("/clients", response_model=List[ClientOversightSummary])
-async def get_clients_oversight(
+@handle_errors("retrieve clients")
+def get_clients_oversight(
+    request: Request,
+    response: Response,
     status: Optional[str] = Query(None, description="Filter by client status"),
     location: Optional[str] = Query(None, description="Filter by location"),
     search: Optional[str] = Query(None, description="Search by name or client code"),
-    limit: int = Query(50, le=100),
+    limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0),
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
     """
     Get list of clients with oversight metrics
     """
-    try:
-        org_id = current_user.organization_id
-
-        query = db.query(Client).filter(Client.organization_id == org_id)
-
-        if status:
-            query = query.filter(Client.status == status)
+    org_id = current_user.organization_id
 
-        if search:
-            query = query.filter(
-                or_(
-                    Client.first_name.ilike(f"%{search}%"),
-                    Client.last_name.ilike(f"%{search}%"),
-                    Client.client_id.ilike(f"%{search}%")
-                )
+    query = db.query(
+        Client.id,
+        Client.client_id,
+        Client.user_id,
+        Client.first_name,
+        Client.last_name,
+        Client.status,
+        Client.location_id,
+        Client.required_documentation,
+        Location.name.label("location_name")
+    ).outerjoin(
+        Location, Client.location_id == Location.id
+    ).filter(Client.organization_id == org_id)
+
+    if status:
+        query = query.filter(Client.status == status)
+
+    if search:
+        query = query.filter(
+            or_(
+                Client.full_name.ilike(f"%{search}%"),
+                Client.client_id.ilike(f"%{search}%")
             )
+        )
 
-        clients = query.order_by(Client.last_name).offset(offset).limit(limit).all()
-
-        results = []
-        for client in clients:
-            # Count assigned staff
-            assigned_staff_count = db.query(StaffAssignment).filter(
-                StaffAssignment.client_id == client.id,
-                StaffAssignment.is_active == True
-            ).count()
-
-            # Calculate documentation completion based on tasks
-            client_tasks_total = db.query(Task).filter(
-                Task.client_id == client.id
-            ).count()
-
-            client_tasks_completed = db.query(Task).filter(
-                Task.client_id == client.id,
-                Task.status == TaskStatusEnum.COMPLETED
-            ).count()
-
-            documentation_completion = (
-                (client_tasks_completed / client_tasks_total * 100)
-                if client_tasks_total > 0 else 100.0
-            )
+    clients = query.order_by(Client.last_name).offset(offset).limit(limit + 1).all()
+    if len(clients) > limit:
+        clients = clients[:limit]
+        response.headers.update(_next_offset_headers(offset, limit, request.query_params))
+
+    # Fallback locations from current client assignments (legacy), one query for the page
+    assignment_locations = {}
+    unlocated_ids = [client.id for client in clients if not client.location_name]
+    if unlocated_ids:
+        assignment_locations = dict(
+            db.query(ClientAssignment.client_id, ClientLocation.name).join(
+                ClientLocation, ClientAssignment.location_id == ClientLocation.id
+            ).filter(
+                ClientAssignment.client_id.in_(unlocated_ids),
+                ClientAssignment.is_current == True
+            ).all()
+        )
 
-            # Count incidents in last 30 days
-            thirty_days_ago = date.today() - timedelta(days=30)
-            incidents_count = db.query(IncidentReport).filter(
-                IncidentReport.client_id == client.id,
-                IncidentReport.incident_date >= thirty_days_ago
-            ).count()
-
-            # Last shift note
-            last_shift_note = db.query(ShiftNote).filter(
-                ShiftNote.client_id == client.id
-            ).order_by(ShiftNote.created_at.desc()).first()
-            last_shift_note_time = last_shift_note.created_at if last_shift_note else None
-
-            # Get actual care plan status
-            latest_care_plan = db.query(CarePlan).filter(
-                CarePlan.client_id == client.id
-            ).order_by(CarePlan.created_at.desc()).first()
-            care_plan_status = latest_care_plan.status if latest_care_plan else "none"
-
-            # Get location - Priority order:
-            # 1. Client's direct location_id field
-            # 2. Client assignment (legacy)
-            location_name = None
-            if client.location_id:
-                from app.models.location import Location
-                location = db.query(Location).filter(
-                    Location.id == client.location_id
-                ).first()
-                if location:
-                    location_name = location.name
-
-            # Fallback to client assignment if no direct location
-            if not location_name:
-                from app.models.client import ClientAssignment, ClientLocation
-                current_assignment = db.query(ClientAssignment).filter(
-                    ClientAssignment.client_id == client.id,
-                    ClientAssignment.is_current == True
-                ).first()
-                if current_assignment and current_assignment.location_id:
-                    location = db.query(ClientLocation).filter(
-                        ClientLocation.id == current_assignment.location_id
-                    ).first()
-                    if location:
-                        location_name = location.name
-
-            # Get next appointment
-            next_appointment = db.query(Appointment).filter(
-                Appointment.client_id == client.id,
+    # Latest shift note, care plan and next appointment per client in one query each
+    last_shift_note_times = {}
+    care_plan_statuses = {}
+    next_appointments = {}
+    client_ids = [client.id for client in clients]
+    if client_ids:
+        last_shift_note_times = dict(
+            db.query(ShiftNote.client_id, func.max(ShiftNote.created_at)).filter(
+                ShiftNote.client_id.in_(client_ids)
+            ).group_by(ShiftNote.client_id).all()
+        )
+        care_plan_statuses = dict(
+            db.query(CarePlan.client_id, CarePlan.status).distinct(CarePlan.client_id).filter(
+                CarePlan.client_id.in_(client_ids)
+            ).order_by(CarePlan.client_id, CarePlan.created_at.desc()).all()
+        )
+        next_appointments = dict(
+            db.query(Appointment.client_id, Appointment.start_datetime).distinct(Appointment.client_id).filter(
+                Appointment.client_id.in_(client_ids),
                 Appointment.start_datetime > datetime.utcnow(),
                 Appointment.status != AppointmentStatus.CANCELLED
-            ).order_by(Appointment.start_datetime.asc()).first()
-
-            results.append(ClientOversightSummary(
-                id=str(client.id),
-                client_id=client.client_id,  # Human readable client code
-                user_id=str(client.user_id) if client.user_id else None,
-                full_name=f"{client.first_name} {client.last_name}",
-                status=client.status,
-                location_id=str(client.location_id) if client.location_id else None,
-                location_name=location_name,
-                assigned_staff_count=assigned_staff_count,
-                documentation_completion=documentation_completion,
-                risk_level=client.risk_level if hasattr(client, 'risk_level') else None,
-                recent_incidents=incidents_count,
-                last_service_date=last_shift_note_time,
-                next_appointment=next_appointment.start_datetime if next_appointment else None,
-                care_plan_status=care_plan_status,
-                required_documentation=client.required_documentation if hasattr(client, 'required_documentation') else None
-            ))
-
-        return results
-
-    except Exception as e:
-        import traceback
-        print(f"ERROR in get_clients_oversight: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve clients: {str(e)}"
+            ).order_by(Appointment.client_id, Appointment.start_datetime.asc()).all()
         )
 
-
-@router.get("/clients/{client_id}", response_model=ClientDetailResponse)
-async def get_client_details(
-    client_id: str,
-    current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
-):
-    """
-    Get detailed information about a specific client
-    """
-    try:
-        org_id = current_user.organization_id
-
-        # Fetch the client
-        client = db.query(Client).filter(
-            Client.id == client_id,
-            Client.organization_id == org_id
-        ).first()
-
-        if not client:
-            raise HTTPException(status_code=404, detail="Client not found")
-
+    results = []
+    for client in clients:
         # Count assigned staff
-        assigned_staff_count = db.query(StaffAssignment).filter(
+        assigned_staff_count = db.execute(select(func.count()).select_from(StaffAssignment).where(
             StaffAssignment.client_id == client.id,
             StaffAssignment.is_active == True
-        ).count()
+        )).scalar_one()
 
         # Calculate documentation completion based on tasks
-        client_tasks_total = db.query(Task).filter(
+        client_tasks_total = db.execute(select(func.count()).select_from(Task).where(
             Task.client_id == client.id
-        ).count()
+        )).scalar_one()
 
-        client_tasks_completed = db.query(Task).filter(
+        client_tasks_completed = db.execute(select(func.count()).select_from(Task).where(
             Task.client_id == client.id,
             Task.status == TaskStatusEnum.COMPLETED
-        ).count()
+        )).scalar_one()
 
         documentation_completion = (
             (client_tasks_completed / client_tasks_total * 100)
@@ -590,1347 +584,1617 @@ async def get_client_details(
 
         # Count incidents in last 30 days
         thirty_days_ago = date.today() - timedelta(days=30)
-        incidents_count = db.query(IncidentReport).filter(
+        incidents_count = db.execute(select(func.count()).select_from(IncidentReport).where(
             IncidentReport.client_id == client.id,
             IncidentReport.incident_date >= thirty_days_ago
-        ).count()
-
-        # Last shift note
-        last_shift_note = db.query(ShiftNote).filter(
-            ShiftNote.client_id == client.id
-        ).order_by(ShiftNote.created_at.desc()).first()
-        last_shift_note_time = last_shift_note.created_at if last_shift_note else None
-
-        # Get actual care plan status
-        latest_care_plan = db.query(CarePlan).filter(
-            CarePlan.client_id == client.id
-        ).order_by(CarePlan.created_at.desc()).first()
-        care_plan_status = latest_care_plan.status if latest_care_plan else "none"
-
-        # Get location
-        location_name = None
-        if client.location_id:
-            location = db.query(Location).filter(
-                Location.id == client.location_id
-            ).first()
-            if location:
-                location_name = location.name
-
-        # Fallback to client assignment if no direct location
-        if not location_name:
-            from app.models.client import ClientAssignment, ClientLocation
-            current_assignment = db.query(ClientAssignment).filter(
-                ClientAssignment.client_id == client.id,
-                ClientAssignment.is_current == True
-            ).first()
-            if current_assignment and current_assignment.location_id:
-                loc = db.query(ClientLocation).filter(
-                    ClientLocation.id == current_assignment.location_id
-                ).first()
-                if loc:
-                    location_name = loc.name
-
-        # Get next appointment
-        next_appointment = db.query(Appointment).filter(
-            Appointment.client_id == client.id,
-            Appointment.start_datetime > datetime.utcnow(),
-            Appointment.status != AppointmentStatus.CANCELLED
-        ).order_by(Appointment.start_datetime.asc()).first()
-
-        # Get organization name
-        from app.models.user import Organization
-        organization = db.query(Organization).filter(
-            Organization.id == client.organization_id
-        ).first()
-        organization_name = organization.name if organization else None
+        )).scalar_one()
 
-        return ClientDetailResponse(
+        # Get location - Priority order:
+        # 1. Client's direct location_id field
+        # 2. Client assignment (legacy)
+        location_name = client.location_name or assignment_locations.get(client.id)
+
+        results.append(ClientOversightSummary(
             id=str(client.id),
-            client_id=client.client_id,
+            client_id=client.client_id,  # Human readable client code
             user_id=str(client.user_id) if client.user_id else None,
             full_name=f"{client.first_name} {client.last_name}",
-            first_name=client.first_name,
-            last_name=client.last_name,
             status=client.status,
-            date_of_birth=client.date_of_birth if hasattr(client, 'date_of_birth') else None,
-            gender=client.gender if hasattr(client, 'gender') else None,
-            email=client.email if hasattr(client, 'email') else None,
-            phone=client.phone if hasattr(client, 'phone') else None,
-            address=client.address if hasattr(client, 'address') else None,
-            emergency_contact_name=client.emergency_contact_name if hasattr(client, 'emergency_contact_name') else None,
-            emergency_contact_phone=client.emergency_contact_phone if hasattr(client, 'emergency_contact_phone') else None,
             location_id=str(client.location_id) if client.location_id else None,
             location_name=location_name,
-            organization_name=organization_name,
             assigned_staff_count=assigned_staff_count,
             documentation_completion=documentation_completion,
-            risk_level=client.risk_level if hasattr(client, 'risk_level') else None,
+            risk_level=None,
             recent_incidents=incidents_count,
-            last_service_date=last_shift_note_time,
-            next_appointment=next_appointment.start_datetime if next_appointment else None,
-            care_plan_status=care_plan_status,
-            required_documentation=client.required_documentation if hasattr(client, 'required_documentation') else None,
-            created_at=client.created_at if hasattr(client, 'created_at') else None
-        )
+            last_service_date=last_shift_note_times.get(client.id),
+            next_appointment=next_appointments.get(client.id),
+            care_plan_status=care_plan_statuses.get(client.id, "none"),
+            required_documentation=client.required_documentation
+        ))
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        import traceback
-        print(f"ERROR in get_client_details: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve client details: {str(e)}"
-        )
+    return results
 
 
-@router.get("/clients/{client_id}/vitals")
-async def get_client_vitals(
+@router.get("/clients/{client_id}", response_model=ClientDetailResponse)
+@handle_errors("retrieve client details")
+def get_client_details(
     client_id: str,
-    limit: int = Query(50, le=100),
-    offset: int = Query(0),
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
-    """Get vitals logs for a specific client"""
-    try:
-        org_id = current_user.organization_id
+    """
+    Get detailed information about a specific client
+    """
+    org_id = current_user.organization_id
 
-        # Verify client exists and belongs to organization
-        client = db.query(Client).filter(
-            Client.id == client_id,
-            Client.organization_id == org_id
-        ).first()
+    # Fetch the client
+    client = db.query(Client).filter(
+        Client.id == client_id,
+        Client.organization_id == org_id
+    ).first()
+
+    if not client:
+        raise HTTPException(status_code=404, detail="Client not found")
+
+    # Count assigned staff
+    assigned_staff_count = db.execute(select(func.count()).select_from(StaffAssignment).where(
+        StaffAssignment.client_id == client.id,
+        StaffAssignment.is_active == True
+    )).scalar_one()
+
+    # Calculate documentation completion based on tasks
+    client_tasks_total = db.execute(select(func.count()).select_from(Task).where(
+        Task.client_id == client.id
+    )).scalar_one()
+
+    client_tasks_completed = db.execute(select(func.count()).select_from(Task).where(
+        Task.client_id == client.id,
+        Task.status == TaskStatusEnum.COMPLETED
+    )).scalar_one()
+
+    documentation_completion = (
+        (client_tasks_completed / client_tasks_total * 100)
+        if client_tasks_total > 0 else 100.0
+    )
 
-        if not client:
-            raise HTTPException(status_code=404, detail="Client not found")
+    # Count incidents in last 30 days
+    thirty_days_ago = date.today() - timedelta(days=30)
+    incidents_count = db.execute(select(func.count()).select_from(IncidentReport).where(
+        IncidentReport.client_id == client.id,
+        IncidentReport.incident_date >= thirty_days_ago
+    )).scalar_one()
+
+    # Last shift note
+    last_shift_note = db.query(ShiftNote).filter(
+        ShiftNote.client_id == client.id
+    ).order_by(ShiftNote.created_at.desc()).first()
+    last_shift_note_time = last_shift_note.created_at if last_shift_note else None
+
+    # Get actual care plan status
+    latest_care_plan = db.query(CarePlan).filter(
+        CarePlan.client_id == client.id
+    ).order_by(CarePlan.created_at.desc()).first()
+    care_plan_status = latest_care_plan.status if latest_care_plan else "none"
+
+    # Get location
+    location_name = None
+    if client.location_id:
+        location = db.query(Location).filter(
+            Location.id == client.location_id
+        ).first()
+        if location:
+            location_name = location.name
 
-        vitals = db.query(VitalsLog).filter(
-            VitalsLog.client_id == client_id,
-            VitalsLog.organization_id == org_id
-        ).order_by(desc(VitalsLog.recorded_at)).offset(offset).limit(limit).all()
+    # Fallback to client assignment if no direct location
+    if not location_name:
+        from app.models.client import ClientAssignment, ClientLocation
+        current_assignment = db.query(ClientAssignment).filter(
+            ClientAssignment.client_id == client.id,
+            ClientAssignment.is_current == True
+        ).first()
+        if current_assignment and current_assignment.location_id:
+            loc = db.query(ClientLocation).filter(
+                ClientLocation.id == current_assignment.location_id
+            ).first()
+            if loc:
+                location_name = loc.name
+
+    # Get next appointment
+    next_appointment = db.query(Appointment).filter(
+        Appointment.client_id == client.id,
+        Appointment.start_datetime > datetime.utcnow(),
+        Appointment.status != AppointmentStatus.CANCELLED
+    ).order_by(Appointment.start_datetime.asc()).first()
+
+    # Get organization name
+    from app.models.user import Organization
+    organization = db.query(Organization).filter(
+        Organization.id == client.organization_id
+    ).first()
+    organization_name = organization.name if organization else None
+
+    return ClientDetailResponse(
+        id=str(client.id),
+        client_id=client.client_id,
+        user_id=str(client.user_id) if client.user_id else None,
+        full_name=f"{client.first_name} {client.last_name}",
+        first_name=client.first_name,
+        last_name=client.last_name,
+        status=client.status,
+        date_of_birth=client.date_of_birth if hasattr(client, 'date_of_birth') else None,
+        gender=client.gender if hasattr(client, 'gender') else None,
+        email=client.email if hasattr(client, 'email') else None,
+        phone=client.phone if hasattr(client, 'phone') else None,
+        address=client.address if hasattr(client, 'address') else None,
+        emergency_contact_name=client.emergency_contact_name if hasattr(client, 'emergency_contact_name') else None,
+        emergency_contact_phone=client.emergency_contact_phone if hasattr(client, 'emergency_contact_phone') else None,
+        location_id=str(client.location_id) if client.location_id else None,
+        location_name=location_name,
+        organization_name=organization_name,
+        assigned_staff_count=assigned_staff_count,
+        documentation_completion=documentation_completion,
+        risk_level=client.risk_level if hasattr(client, 'risk_level') else None,
+        recent_incidents=incidents_count,
+        last_service_date=last_shift_note_time,
+        next_appointment=next_appointment.start_datetime if next_appointment else None,
+        care_plan_status=care_plan_status,
+        required_documentation=client.required_documentation if hasattr(client, 'required_documentation') else None,
+        created_at=client.created_at if hasattr(client, 'created_at') else None
+    )
 
-        # Get staff names
-        staff_ids = list(set([str(v.staff_id) for v in vitals if v.staff_id]))
-        staff_map = {}
-        if staff_ids:
-            staff_users = db.query(User).filter(User.id.in_(staff_ids)).all()
-            staff_map = {str(u.id): u.full_name for u in staff_users}
 
-        return [
-            {
-                "id": str(v.id),
-                "client_id": str(v.client_id),
-                "staff_id": str(v.staff_id),
-                "staff_name": staff_map.get(str(v.staff_id), "Unknown"),
-                "temperature": v.temperature,
-                "blood_pressure_systolic": v.blood_pressure_systolic,
-                "blood_pressure_diastolic": v.blood_pressure_diastolic,
-                "blood_sugar": v.blood_sugar,
-                "weight": v.weight,
-                "heart_rate": v.heart_rate,
-                "oxygen_saturation": v.oxygen_saturation,
-                "notes": v.notes,
-                "recorded_at": v.recorded_at.isoformat() if v.recorded_at else None,
-                "created_at": v.created_at.isoformat() if v.created_at else None
-            }
-            for v in vitals
-        ]
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve vitals: {str(e)}")
+def _encode_cursor(*key) -> str:
+    """Opaque keyset cursor pointing at a row's position in its sort order"""
+    raw = "|".join(
+        value.isoformat() if hasattr(value, "isoformat") else str(value)
+        for value in key
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode()
 
 
-@router.get("/clients/{client_id}/meals")
-async def get_client_meals(
-    client_id: str,
-    limit: int = Query(50, le=100),
-    offset: int = Query(0),
-    current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
-):
-    """Get meal logs for a specific client"""
+def _decode_cursor(cursor: str, *parsers) -> tuple:
+    """Inverse of _encode_cursor; one parser per key column restores its type"""
     try:
-        org_id = current_user.organization_id
+        parts = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        if len(parts) != len(parsers):
+            raise ValueError("cursor has the wrong number of parts")
+        return tuple(parse(part) for parse, part in zip(parsers, parts))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-        client = db.query(Client).filter(
-            Client.id == client_id,
-            Client.organization_id == org_id
-        ).first()
 
-        if not client:
-            raise HTTPException(status_code=404, detail="Client not found")
+def _next_link(query_params, **page) -> str:
+    """
+    Link header value for the next page. It is relative to the request URL,
+    so it works unchanged behind any prefix, and carries the request's
+    filters over with the paging parameters replaced by `page`.
+    """
+    params = [
+        (name, value) for name, value in (query_params.multi_items() if query_params else [])
+        if name not in ("limit", "offset", "cursor")
+    ]
+    return f'<?{urlencode(params + list(page.items()))}>; rel="next"'
 
-        meals = db.query(MealLog).filter(
-            MealLog.client_id == client_id,
-            MealLog.organization_id == org_id
-        ).order_by(desc(MealLog.meal_date)).offset(offset).limit(limit).all()
 
-        # Get staff names
-        staff_ids = list(set([str(m.staff_id) for m in meals if m.staff_id]))
-        staff_map = {}
-        if staff_ids:
-            staff_users = db.query(User).filter(User.id.in_(staff_ids)).all()
-            staff_map = {str(u.id): u.full_name for u in staff_users}
+def _next_page_headers(key: tuple, limit: int, query_params=None) -> dict:
+    """Headers pointing at the page after the row whose sort key is `key`"""
+    next_cursor = _encode_cursor(*key)
+    return {
+        "X-Next-Cursor": next_cursor,
+        "Link": _next_link(query_params, limit=limit, cursor=next_cursor)
+    }
 
-        return [
-            {
-                "id": str(m.id),
-                "client_id": str(m.client_id),
-                "staff_id": str(m.staff_id) if m.staff_id else None,
-                "staff_name": staff_map.get(str(m.staff_id), "Unknown") if m.staff_id else "Unknown",
-                "meal_type": m.meal_type.value if m.meal_type else None,
-                "meal_time": m.meal_time,
-                "food_items": m.food_items,
-                "intake_amount": m.intake_amount.value if m.intake_amount else None,
-                "percentage_consumed": m.percentage_consumed,
-                "calories": m.calories,
-                "water_intake_ml": m.water_intake_ml,
-                "other_fluids": m.other_fluids,
-                "appetite_level": m.appetite_level,
-                "assistance_required": m.assistance_required,
-                "assistance_type": m.assistance_type,
-                "refusals": m.refusals,
-                "notes": m.notes,
-                "recorded_at": m.meal_date.isoformat() if m.meal_date else None,
-                "created_at": m.created_at.isoformat() if m.created_at else None
-            }
-            for m in meals
-        ]
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve meals: {str(e)}")
 
+def _next_offset_headers(offset: int, limit: int, query_params=None) -> dict:
+    """
+    Link to the next page of an offset-paginated list. Callers fetch limit + 1
+    rows and send this only when the extra row came back, so no list has to
+    COUNT(*) its filtered query to tell whether there is more.
+    """
+    return {"Link": _next_link(query_params, limit=limit, offset=offset + limit)}
 
-@router.get("/clients/{client_id}/sleep-logs")
-async def get_client_sleep_logs(
-    client_id: str,
-    limit: int = Query(50, le=100),
-    offset: int = Query(0),
-    current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
-):
-    """Get sleep logs for a specific client"""
-    try:
-        org_id = current_user.organization_id
 
-        client = db.query(Client).filter(
-            Client.id == client_id,
-            Client.organization_id == org_id
-        ).first()
+def _keyset_before(date_col, id_col, cursor: str):
+    """WHERE clause selecting rows that sort after the cursor in (date DESC, id DESC) order"""
+    sort_value, row_id = _decode_cursor(cursor, datetime.fromisoformat, uuid.UUID)
+    return tuple_(date_col, id_col) < tuple_(sort_value, row_id)
 
-        if not client:
-            raise HTTPException(status_code=404, detail="Client not found")
 
-        sleep_logs = db.query(SleepLog).filter(
-            SleepLog.client_id == client_id,
-            SleepLog.organization_id == org_id
-        ).order_by(desc(SleepLog.recorded_at)).offset(offset).limit(limit).all()
+def _client_in_org(client_id: str, org_id):
+    """EXISTS clause that is true when the client belongs to the organization"""
+    return select(literal(1)).where(
+        Client.id == client_id,
+        Client.organization_id == org_id
+    ).exists()
 
-        # Get staff names
-        staff_ids = list(set([str(s.staff_id) for s in sleep_logs if s.staff_id]))
-        staff_map = {}
-        if staff_ids:
-            staff_users = db.query(User).filter(User.id.in_(staff_ids)).all()
-            staff_map = {str(u.id): u.full_name for u in staff_users}
 
-        return [
-            {
-                "id": str(s.id),
-                "client_id": str(s.client_id),
-                "staff_id": str(s.staff_id),
-                "staff_name": staff_map.get(str(s.staff_id), "Unknown"),
-                "shift_date": s.shift_date.isoformat() if s.shift_date else None,
-                "sleep_periods": s.sleep_periods,
-                "total_sleep_minutes": s.total_sleep_minutes,
-                "notes": s.notes,
-                "recorded_at": s.recorded_at.isoformat() if s.recorded_at else None,
-                "created_at": s.created_at.isoformat() if s.created_at else None
-            }
-            for s in sleep_logs
-        ]
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve sleep logs: {str(e)}")
+def _ensure_client_in_org(db: Session, client_id: str, org_id) -> None:
+    if not db.query(_client_in_org(client_id, org_id)).scalar():
+        raise HTTPException(status_code=404, detail="Client not found")
 
 
-@router.get("/clients/{client_id}/bowel-movements")
-async def get_client_bowel_movements(
+def _fetch_with_staff(
+    db: Session,
+    model,
+    columns: list,
+    date_col,
     client_id: str,
-    limit: int = Query(50, le=100),
-    offset: int = Query(0),
-    current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    org_id,
+    limit: int,
+    offset: int,
+    cursor: Optional[str]
 ):
-    """Get bowel movement logs for a specific client"""
-    try:
-        org_id = current_user.organization_id
-
-        client = db.query(Client).filter(
-            Client.id == client_id,
-            Client.organization_id == org_id
-        ).first()
+    """
+    Page through a client's log rows, projecting only the given columns plus
+    the staff member's name (as staff_name) from a single JOIN. Raises 404
+    when the client does not belong to the organization.
+
+    With a cursor the page is fetched by keyset instead of OFFSET, so deep pages
+    cost the same as the first one. Returns (rows, headers); when more rows
+    follow, the headers carry the next page's cursor in X-Next-Cursor and a
+    Link: rel="next" URL. No total is computed.
+    """
+    query = db.query(*columns, User.full_name.label("staff_name")).outerjoin(
+        User, model.staff_id == User.id
+    ).filter(
+        model.client_id == client_id,
+        model.organization_id == org_id,
+        _client_in_org(client_id, org_id)
+    )
 
-        if not client:
-            raise HTTPException(status_code=404, detail="Client not found")
+    if cursor:
+        query = query.filter(_keyset_before(date_col, model.id, cursor))
 
-        bowel_logs = db.query(BowelMovementLog).filter(
-            BowelMovementLog.client_id == client_id,
-            BowelMovementLog.organization_id == org_id
-        ).order_by(desc(BowelMovementLog.recorded_at)).offset(offset).limit(limit).all()
+    query = query.order_by(desc(date_col), desc(model.id))
+    if not cursor:
+        query = query.offset(offset)
 
-        # Get staff names
-        staff_ids = list(set([str(b.staff_id) for b in bowel_logs if b.staff_id]))
-        staff_map = {}
-        if staff_ids:
-            staff_users = db.query(User).filter(User.id.in_(staff_ids)).all()
-            staff_map = {str(u.id): u.full_name for u in staff_users}
+    # One extra row tells whether another page exists without a COUNT(*)
+    rows = query.limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
 
-        return [
-            {
-                "id": str(b.id),
-                "client_id": str(b.client_id),
-                "staff_id": str(b.staff_id),
-                "staff_name": staff_map.get(str(b.staff_id), "Unknown"),
-                "stool_type": b.stool_type,
-                "stool_color": b.stool_color,
-                "additional_information": b.additional_information,
-                "recorded_at": b.recorded_at.isoformat() if b.recorded_at else None,
-                "created_at": b.created_at.isoformat() if b.created_at else None
-            }
-            for b in bowel_logs
-        ]
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve bowel movements: {str(e)}")
+    # The ownership check rides along in the page query; only an empty page
+    # needs a second look to tell "unknown client" from "no rows"
+    if not rows:
+        _ensure_client_in_org(db, client_id, org_id)
 
+    headers = {}
+    if has_more:
+        last = rows[-1]
+        headers = _next_page_headers((getattr(last, date_col.key), last.id), limit)
 
-@router.get("/clients/{client_id}/activities")
-async def get_client_activities(
-    client_id: str,
-    limit: int = Query(50, le=100),
-    offset: int = Query(0),
-    current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
-):
-    """Get activity logs for a specific client"""
-    try:
-        org_id = current_user.organization_id
+    return rows, headers
 
-        client = db.query(Client).filter(
-            Client.id == client_id,
-            Client.organization_id == org_id
-        ).first()
 
-        if not client:
-            raise HTTPException(status_code=404, detail="Client not found")
+STREAM_BATCH_SIZE = 50
 
-        activities = db.query(ActivityLog).filter(
-            ActivityLog.client_id == client_id,
-            ActivityLog.organization_id == org_id
-        ).order_by(desc(ActivityLog.activity_date)).offset(offset).limit(limit).all()
 
-        # Get staff names
-        staff_ids = list(set([str(a.staff_id) for a in activities if a.staff_id]))
-        staff_map = {}
-        if staff_ids:
-            staff_users = db.query(User).filter(User.id.in_(staff_ids)).all()
-            staff_map = {str(u.id): u.full_name for u in staff_users}
+def _stream_json_array(stmt, serialize):
+    """
+    Yield the rows of stmt as a JSON array, one orjson-encoded row at a time,
+    fetching through a server-side cursor in batches so neither the result set
+    nor the encoded body is ever held in memory whole.
 
-        return [
-            {
-                "id": str(a.id),
-                "client_id": str(a.client_id),
-                "staff_id": str(a.staff_id) if a.staff_id else None,
-                "staff_name": staff_map.get(str(a.staff_id), "Unknown") if a.staff_id else "Unknown",
-                "activity_type": a.activity_type.value if a.activity_type else None,
-                "activity_name": a.activity_name,
-                "duration_minutes": a.duration_minutes,
-                "participation_level": a.participation_level.value if a.participation_level else None,
-                "mood_before": a.mood_before.value if a.mood_before else None,
-                "mood_after": a.mood_after.value if a.mood_after else None,
-                "notes": a.staff_notes,
-                "recorded_at": a.activity_date.isoformat() if a.activity_date else None,
-                "created_at": a.created_at.isoformat() if a.created_at else None
-            }
-            for a in activities
-        ]
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve activities: {str(e)}")
+    The request-scoped session is closed before the response body is sent,
+    so the generator owns its own session for the lifetime of the stream.
+    """
+    db = SessionLocal()
+    try:
+        result = db.execute(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+        yield b"["
+        separator = b""
+        for batch in result.partitions():
+            for row in batch:
+                yield separator + orjson.dumps(serialize(row))
+                separator = b","
+        yield b"]"
+    finally:
+        db.close()
+
+
+def _vitals_page_filter(client_id: str, org_id, cursor: Optional[str]) -> list:
+    criteria = [
+        VitalsLog.client_id == client_id,
+        VitalsLog.organization_id == org_id,
+        _client_in_org(client_id, org_id)
+    ]
+    if cursor:
+        criteria.append(_keyset_before(VitalsLog.recorded_at, VitalsLog.id, cursor))
+    return criteria
+
+
+def _serialize_vitals(v) -> dict:
+    return {
+        "id": str(v.id),
+        "client_id": str(v.client_id),
+        "staff_id": str(v.staff_id),
+        "staff_name": v.staff_name or "Unknown",
+        "temperature": v.temperature,
+        "blood_pressure_systolic": v.blood_pressure_systolic,
+        "blood_pressure_diastolic": v.blood_pressure_diastolic,
+        "blood_sugar": v.blood_sugar,
+        "weight": v.weight,
+        "heart_rate": v.heart_rate,
+        "oxygen_saturation": v.oxygen_saturation,
+        "notes": v.notes,
+        "recorded_at": v.recorded_at,
+        "created_at": v.created_at
+    }
+
+
+def _list_client_logs(
+    db: Session,
+    model,
+    columns: list,
+    date_col,
+    serialize,
+    client_id: str,
+    org_id,
+    limit: int,
+    offset: int,
+    cursor: Optional[str]
+) -> ORJSONResponse:
+    """
+    Shared body of the client log listing endpoints: fetch one page with the
+    staff name joined in, serialize each row and hand the list to orjson,
+    which encodes datetimes, dates and enums (as their values) natively.
+    """
+    rows, headers = _fetch_with_staff(
+        db, model, columns, date_col, client_id, org_id, limit, offset, cursor
+    )
+    return ORJSONResponse([serialize(row) for row in rows], headers=headers)
+
+
+MEAL_LOG_COLUMNS = [
+    MealLog.id,
+    MealLog.client_id,
+    MealLog.staff_id,
+    MealLog.meal_type,
+    MealLog.meal_time,
+    MealLog.food_items,
+    MealLog.intake_amount,
+    MealLog.percentage_consumed,
+    MealLog.calories,
+    MealLog.water_intake_ml,
+    MealLog.other_fluids,
+    MealLog.appetite_level,
+    MealLog.assistance_required,
+    MealLog.assistance_type,
+    MealLog.refusals,
+    MealLog.notes,
+    MealLog.meal_date,
+    MealLog.created_at
+]
+
+
+def _serialize_meal(m) -> dict:
+    return {
+        "id": str(m.id),
+        "client_id": str(m.client_id),
+        "staff_id": str(m.staff_id) if m.staff_id else None,
+        "staff_name": m.staff_name or "Unknown",
+        "meal_type": m.meal_type,
+        "meal_time": m.meal_time,
+        "food_items": m.food_items,
+        "intake_amount": m.intake_amount,
+        "percentage_consumed": m.percentage_consumed,
+        "calories": m.calories,
+        "water_intake_ml": m.water_intake_ml,
+        "other_fluids": m.other_fluids,
+        "appetite_level": m.appetite_level,
+        "assistance_required": m.assistance_required,
+        "assistance_type": m.assistance_type,
+        "refusals": m.refusals,
+        "notes": m.notes,
+        "recorded_at": m.meal_date,
+        "created_at": m.created_at
+    }
+
+
+SLEEP_LOG_COLUMNS = [
+    SleepLog.id,
+    SleepLog.client_id,
+    SleepLog.staff_id,
+    SleepLog.shift_date,
+    SleepLog.sleep_periods,
+    SleepLog.total_sleep_minutes,
+    SleepLog.notes,
+    SleepLog.recorded_at,
+    SleepLog.created_at
+]
+
+
+def _serialize_sleep_log(s) -> dict:
+    return {
+        "id": str(s.id),
+        "client_id": str(s.client_id),
+        "staff_id": str(s.staff_id),
+        "staff_name": s.staff_name or "Unknown",
+        "shift_date": s.shift_date,
+        "sleep_periods": s.sleep_periods,
+        "total_sleep_minutes": s.total_sleep_minutes,
+        "notes": s.notes,
+        "recorded_at": s.recorded_at,
+        "created_at": s.created_at
+    }
+
+
+BOWEL_MOVEMENT_LOG_COLUMNS = [
+    BowelMovementLog.id,
+    BowelMovementLog.client_id,
+    BowelMovementLog.staff_id,
+    BowelMovementLog.stool_type,
+    BowelMovementLog.stool_color,
+    BowelMovementLog.additional_information,
+    BowelMovementLog.recorded_at,
+    BowelMovementLog.created_at
+]
+
+
+def _serialize_bowel_movement(b) -> dict:
+    return {
+        "id": str(b.id),
+        "client_id": str(b.client_id),
+        "staff_id": str(b.staff_id),
+        "staff_name": b.staff_name or "Unknown",
+        "stool_type": b.stool_type,
+        "stool_color": b.stool_color,
+        "additional_information": b.additional_information,
+        "recorded_at": b.recorded_at,
+        "created_at": b.created_at
+    }
+
+
+ACTIVITY_LOG_COLUMNS = [
+    ActivityLog.id,
+    ActivityLog.client_id,
+    ActivityLog.staff_id,
+    ActivityLog.activity_type,
+    ActivityLog.activity_name,
+    ActivityLog.duration_minutes,
+    ActivityLog.participation_level,
+    ActivityLog.mood_before,
+    ActivityLog.mood_after,
+    ActivityLog.staff_notes,
+    ActivityLog.activity_date,
+    ActivityLog.created_at
+]
+
+
+def _serialize_activity(a) -> dict:
+    return {
+        "id": str(a.id),
+        "client_id": str(a.client_id),
+        "staff_id": str(a.staff_id) if a.staff_id else None,
+        "staff_name": a.staff_name or "Unknown",
+        "activity_type": a.activity_type,
+        "activity_name": a.activity_name,
+        "duration_minutes": a.duration_minutes,
+        "participation_level": a.participation_level,
+        "mood_before": a.mood_before,
+        "mood_after": a.mood_after,
+        "notes": a.staff_notes,
+        "recorded_at": a.activity_date,
+        "created_at": a.created_at
+    }
+
+
+SHIFT_NOTE_COLUMNS = [
+    ShiftNote.id,
+    ShiftNote.client_id,
+    ShiftNote.staff_id,
+    ShiftNote.shift_date,
+    ShiftNote.shift_time,
+    ShiftNote.narrative,
+    ShiftNote.challenges_faced,
+    ShiftNote.support_required,
+    ShiftNote.observations,
+    ShiftNote.created_at
+]
+
+
+def _serialize_shift_note(sn) -> dict:
+    return {
+        "id": str(sn.id),
+        "client_id": str(sn.client_id),
+        "staff_id": str(sn.staff_id) if sn.staff_id else None,
+        "staff_name": sn.staff_name or "Unknown",
+        "shift_date": sn.shift_date,
+        "shift_time": sn.shift_time,
+        "narrative": sn.narrative,
+        "challenges_faced": sn.challenges_faced,
+        "support_required": sn.support_required,
+        "observations": sn.observations,
+        "created_at": sn.created_at
+    }
+
+
+INCIDENT_REPORT_COLUMNS = [
+    IncidentReport.id,
+    IncidentReport.client_id,
+    IncidentReport.staff_id,
+    IncidentReport.incident_date,
+    IncidentReport.incident_time,
+    IncidentReport.incident_type,
+    IncidentReport.severity,
+    IncidentReport.status,
+    IncidentReport.description,
+    IncidentReport.action_taken,
+    IncidentReport.location,
+    IncidentReport.witnesses,
+    IncidentReport.follow_up_required,
+    IncidentReport.follow_up_notes,
+    IncidentReport.created_at,
+    IncidentReport.resolved_at
+]
+
+
+def _serialize_incident(i) -> dict:
+    return {
+        "id": str(i.id),
+        "client_id": str(i.client_id),
+        "staff_id": str(i.staff_id) if i.staff_id else None,
+        "reporter_name": i.staff_name or "Unknown",
+        "incident_date": i.incident_date,
+        "incident_time": i.incident_time,
+        "incident_type": i.incident_type,
+        "severity": i.severity,
+        "status": i.status,
+        "description": i.description,
+        "action_taken": i.action_taken,
+        "location": i.location,
+        "witnesses": i.witnesses,
+        "follow_up_required": i.follow_up_required,
+        "follow_up_notes": i.follow_up_notes,
+        "created_at": i.created_at,
+        "resolved_at": i.resolved_at
+    }
 
 
-@router.get("/clients/{client_id}/shift-notes")
-async def get_client_shift_notes(
+@router.get("/clients/{client_id}/vitals")
+@handle_errors("retrieve vitals")
+def get_client_vitals(
     client_id: str,
-    limit: int = Query(50, le=100),
+    limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor or Link header"),
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
-    """Get shift notes for a specific client"""
-    try:
-        org_id = current_user.organization_id
+    """Get vitals logs for a specific client"""
+    org_id = current_user.organization_id
 
-        client = db.query(Client).filter(
-            Client.id == client_id,
-            Client.organization_id == org_id
-        ).first()
+    # Headers go out before the body, so look up the page's last row and
+    # the one after it up front: a second row means another page exists.
+    # A hit also proves the client belongs to the organization.
+    headers = {}
+    boundary = db.query(VitalsLog.recorded_at, VitalsLog.id).filter(
+        *_vitals_page_filter(client_id, org_id, cursor)
+    ).order_by(
+        desc(VitalsLog.recorded_at), desc(VitalsLog.id)
+    ).offset((0 if cursor else offset) + limit - 1).limit(2).all()
+    if len(boundary) > 1:
+        last = boundary[0]
+        headers = _next_page_headers((last.recorded_at, last.id), limit)
+    elif not boundary:
+        _ensure_client_in_org(db, client_id, org_id)
+
+    stmt = select(
+        VitalsLog.id,
+        VitalsLog.client_id,
+        VitalsLog.staff_id,
+        VitalsLog.temperature,
+        VitalsLog.blood_pressure_systolic,
+        VitalsLog.blood_pressure_diastolic,
+        VitalsLog.blood_sugar,
+        VitalsLog.weight,
+        VitalsLog.heart_rate,
+        VitalsLog.oxygen_saturation,
+        VitalsLog.notes,
+        VitalsLog.recorded_at,
+        VitalsLog.created_at,
+        User.full_name.label("staff_name")
+    ).outerjoin(
+        User, VitalsLog.staff_id == User.id
+    ).where(
+        *_vitals_page_filter(client_id, org_id, cursor)
+    ).order_by(
+        desc(VitalsLog.recorded_at), desc(VitalsLog.id)
+    ).offset(0 if cursor else offset).limit(limit)
+
+    return StreamingResponse(
+        _stream_json_array(stmt, _serialize_vitals),
+        media_type="application/json",
+        headers=headers
+    )
 
-        if not client:
-            raise HTTPException(status_code=404, detail="Client not found")
 
-        shift_notes = db.query(ShiftNote).filter(
-            ShiftNote.client_id == client_id,
-            ShiftNote.organization_id == org_id
-        ).order_by(desc(ShiftNote.created_at)).offset(offset).limit(limit).all()
+@router.get("/clients/{client_id}/meals", response_class=ORJSONResponse)
+@handle_errors("retrieve meals")
+def get_client_meals(
+    client_id: str,
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor or Link header"),
+    current_user: User = Depends(get_manager_or_above),
+    db: Session = Depends(get_org_scoped_db)
+):
+    """Get meal logs for a specific client"""
+    return _list_client_logs(
+        db, MealLog, MEAL_LOG_COLUMNS, MealLog.meal_date, _serialize_meal,
+        client_id, current_user.organization_id, limit, offset, cursor
+    )
 
-        # Get staff names for shift notes
-        staff_ids = list(set([str(sn.staff_id) for sn in shift_notes if sn.staff_id]))
-        staff_map = {}
-        if staff_ids:
-            staff_users = db.query(User).filter(User.id.in_(staff_ids)).all()
-            staff_map = {str(u.id): u.full_name for u in staff_users}
 
-        return [
-            {
-                "id": str(sn.id),
-                "client_id": str(sn.client_id),
-                "staff_id": str(sn.staff_id) if sn.staff_id else None,
-                "staff_name": staff_map.get(str(sn.staff_id), "Unknown"),
-                "shift_date": sn.shift_date.isoformat() if sn.shift_date else None,
-                "shift_time": sn.shift_time if hasattr(sn, 'shift_time') else None,
-                "narrative": sn.narrative if hasattr(sn, 'narrative') else None,
-                "challenges_faced": sn.challenges_faced if hasattr(sn, 'challenges_faced') else None,
-                "support_required": sn.support_required if hasattr(sn, 'support_required') else None,
-                "observations": sn.observations if hasattr(sn, 'observations') else None,
-                "created_at": sn.created_at.isoformat() if sn.created_at else None
-            }
-            for sn in shift_notes
-        ]
-    except HTTPException:
-        raise
-    except Exception as e:
-        import traceback
-        print(f"ERROR in get_client_shift_notes: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve shift notes: {str(e)}")
+@router.get("/clients/{client_id}/sleep-logs", response_class=ORJSONResponse)
+@handle_errors("retrieve sleep logs")
+def get_client_sleep_logs(
+    client_id: str,
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor or Link header"),
+    current_user: User = Depends(get_manager_or_above),
+    db: Session = Depends(get_org_scoped_db)
+):
+    """Get sleep logs for a specific client"""
+    return _list_client_logs(
+        db, SleepLog, SLEEP_LOG_COLUMNS, SleepLog.recorded_at, _serialize_sleep_log,
+        client_id, current_user.organization_id, limit, offset, cursor
+    )
 
 
-@router.get("/clients/{client_id}/incidents")
-async def get_client_incidents(
+@router.get("/clients/{client_id}/bowel-movements", response_class=ORJSONResponse)
+@handle_errors("retrieve bowel movements")
+def get_client_bowel_movements(
     client_id: str,
-    limit: int = Query(50, le=100),
+    limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor or Link header"),
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
-    """Get incident reports for a specific client"""
-    try:
-        org_id = current_user.organization_id
+    """Get bowel movement logs for a specific client"""
+    return _list_client_logs(
+        db, BowelMovementLog, BOWEL_MOVEMENT_LOG_COLUMNS, BowelMovementLog.recorded_at, _serialize_bowel_movement,
+        client_id, current_user.organization_id, limit, offset, cursor
+    )
 
-        client = db.query(Client).filter(
-            Client.id == client_id,
-            Client.organization_id == org_id
-        ).first()
 
-        if not client:
-            raise HTTPException(status_code=404, detail="Client not found")
+@router.get("/clients/{client_id}/activities", response_class=ORJSONResponse)
+@handle_errors("retrieve activities")
+def get_client_activities(
+    client_id: str,
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor or Link header"),
+    current_user: User = Depends(get_manager_or_above),
+    db: Session = Depends(get_org_scoped_db)
+):
+    """Get activity logs for a specific client"""
+    return _list_client_logs(
+        db, ActivityLog, ACTIVITY_LOG_COLUMNS, ActivityLog.activity_date, _serialize_activity,
+        client_id, current_user.organization_id, limit, offset, cursor
+    )
 
-        incidents = db.query(IncidentReport).filter(
-            IncidentReport.client_id == client_id,
-            IncidentReport.organization_id == org_id
-        ).order_by(desc(IncidentReport.incident_date)).offset(offset).limit(limit).all()
 
-        # Get staff names for incidents
-        staff_ids = list(set([str(i.staff_id) for i in incidents if i.staff_id]))
-        staff_map = {}
-        if staff_ids:
-            staff_users = db.query(User).filter(User.id.in_(staff_ids)).all()
-            staff_map = {str(u.id): u.full_name for u in staff_users}
+@router.get("/clients/{client_id}/shift-notes", response_class=ORJSONResponse)
+@handle_errors("retrieve shift notes")
+def get_client_shift_notes(
+    client_id: str,
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor or Link header"),
+    current_user: User = Depends(get_manager_or_above),
+    db: Session = Depends(get_org_scoped_db)
+):
+    """Get shift notes for a specific client"""
+    return _list_client_logs(
+        db, ShiftNote, SHIFT_NOTE_COLUMNS, ShiftNote.created_at, _serialize_shift_note,
+        client_id, current_user.organization_id, limit, offset, cursor
+    )
+
 
-        return [
-            {
-                "id": str(i.id),
-                "client_id": str(i.client_id),
-                "staff_id": str(i.staff_id) if i.staff_id else None,
-                "reporter_name": staff_map.get(str(i.staff_id), "Unknown") if i.staff_id else "Unknown",
-                "incident_date": i.incident_date.isoformat() if i.incident_date else None,
-                "incident_time": i.incident_time,
-                "incident_type": i.incident_type.value if i.incident_type else None,
-                "severity": i.severity.value if i.severity else None,
-                "status": i.status.value if i.status else None,
-                "description": i.description,
-                "action_taken": i.action_taken,
-                "location": i.location,
-                "witnesses": i.witnesses,
-                "follow_up_required": i.follow_up_required,
-                "follow_up_notes": i.follow_up_notes,
-                "created_at": i.created_at.isoformat() if i.created_at else None,
-                "resolved_at": i.resolved_at.isoformat() if i.resolved_at else None
-            }
-            for i in incidents
-        ]
-    except HTTPException:
-        raise
-    except Exception as e:
-        import traceback
-        print(f"ERROR in get_client_incidents: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve incidents: {str(e)}")
+@router.get("/clients/{client_id}/incidents", response_class=ORJSONResponse)
+@handle_errors("retrieve incidents")
+def get_client_incidents(
+    client_id: str,
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor or Link header"),
+    current_user: User = Depends(get_manager_or_above),
+    db: Session = Depends(get_org_scoped_db)
+):
+    """Get incident reports for a specific client"""
+    return _list_client_logs(
+        db, IncidentReport, INCIDENT_REPORT_COLUMNS, IncidentReport.incident_date, _serialize_incident,
+        client_id, current_user.organization_id, limit, offset, cursor
+    )
 
 
 @router.get("/time-off-requests", response_model=List[TimeOffRequestResponse])
-async def get_time_off_requests(
+@handle_errors("retrieve time off requests")
+def get_time_off_requests(
+    request: Request,
+    response: Response,
     status: Optional[str] = Query(None, description="Filter by status"),
     staff_id: Optional[str] = Query(None, description="Filter by staff"),
-    limit: int = Query(50, le=100),
+    limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0),
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
     """
     Get time off requests for review
     """
-    try:
-        org_id = current_user.organization_id
+    org_id = current_user.organization_id
 
-        query = db.query(TimeOffRequest).join(Staff).filter(
-            Staff.organization_id == org_id
-        )
+    query = db.query(TimeOffRequest).join(Staff).filter(
+        Staff.organization_id == org_id
+    )
 
-        if status:
-            query = query.filter(TimeOffRequest.status == status.upper())
-
-        if staff_id:
-            query = query.filter(TimeOffRequest.staff_id == staff_id)
-
-        requests = query.order_by(TimeOffRequest.requested_date.desc()).offset(offset).limit(limit).all()
-
-        results = []
-        for request in requests:
-            days_requested = (request.end_date - request.start_date).days + 1
-
-            results.append(TimeOffRequestResponse(
-                id=str(request.id),
-                staff_id=str(request.staff_id),
-                staff_name=request.staff.full_name if request.staff else "Unknown",
-                type=request.request_type.value,
-                start_date=request.start_date,
-                end_date=request.end_date,
-                days_requested=days_requested,
-                total_hours=float(request.total_hours) if request.total_hours else 0.0,
-                status=request.status.value,
-                reason=request.reason,
-                notes=None,
-                reviewed_by=str(request.approved_by) if request.approved_by else None,
-                reviewed_at=request.approved_date,
-                review_notes=request.denial_reason,
-                created_at=request.requested_date
-            ))
-
-        return results
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve time off requests: {str(e)}"
-        )
+    if status:
+        query = query.filter(TimeOffRequest.status == status.upper())
+
+    if staff_id:
+        query = query.filter(TimeOffRequest.staff_id == staff_id)
+
+    time_off_requests = query.order_by(TimeOffRequest.requested_date.desc()).offset(offset).limit(limit + 1).all()
+    if len(time_off_requests) > limit:
+        time_off_requests = time_off_requests[:limit]
+        response.headers.update(_next_offset_headers(offset, limit, request.query_params))
+
+    results = []
+    for time_off in time_off_requests:
+        days_requested = (time_off.end_date - time_off.start_date).days + 1
+
+        results.append(TimeOffRequestResponse(
+            id=str(time_off.id),
+            staff_id=str(time_off.staff_id),
+            staff_name=time_off.staff.full_name if time_off.staff else "Unknown",
+            type=time_off.request_type.value,
+            start_date=time_off.start_date,
+            end_date=time_off.end_date,
+            days_requested=days_requested,
+            total_hours=float(time_off.total_hours) if time_off.total_hours else 0.0,
+            status=time_off.status.value,
+            reason=time_off.reason,
+            notes=None,
+            reviewed_by=str(time_off.approved_by) if time_off.approved_by else None,
+            reviewed_at=time_off.approved_date,
+            review_notes=time_off.denial_reason,
+            created_at=time_off.requested_date
+        ))
+
+    return results
 
 @router.post("/time-off-requests/{request_id}/approve")
-async def approve_time_off_request(
+@handle_errors("process time off request")
+def approve_time_off_request(
     request_id: str,
     action: ApprovalActionRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
     """
     Approve or reject time off request
     """
-    try:
-        org_id = current_user.organization_id
-
-        time_off_request = db.query(TimeOffRequest).join(Staff).filter(
-            TimeOffRequest.id == request_id,
-            Staff.organization_id == org_id
-        ).first()
-
-        if not time_off_request:
-            raise HTTPException(status_code=404, detail="Time off request not found")
-
-        if time_off_request.status != TimeOffStatus.PENDING:
-            raise HTTPException(status_code=400, detail="Request already reviewed")
-
-        # Check for approval (handle both uppercase and lowercase values)
-        is_approved = action.action.value.upper() == "APPROVED"
-        if is_approved:
-            time_off_request.status = TimeOffStatus.APPROVED
-        else:
-            time_off_request.status = TimeOffStatus.DENIED
-            time_off_request.denial_reason = action.notes
-
-        time_off_request.approved_by = current_user.id
-        time_off_request.approved_date = datetime.utcnow()
-
-        db.commit()
-
-        # Send email notification to the staff member
-        try:
-            # Reload with staff relationship
-            time_off_request = db.query(TimeOffRequest).options(
-                joinedload(TimeOffRequest.staff).joinedload(Staff.user)
-            ).filter(TimeOffRequest.id == request_id).first()
-
-            staff_member = time_off_request.staff
-            staff_user = staff_member.user
-            manager_name = f"{current_user.first_name} {current_user.last_name}"
-
-            # Format dates
-            start_date_str = time_off_request.start_date.strftime("%a, %b %d, %Y")
-            end_date_str = time_off_request.end_date.strftime("%a, %b %d, %Y")
-            total_hours_str = str(time_off_request.total_hours)
-            request_type_str = time_off_request.request_type.value.replace("_", " ").title()
-
-            if is_approved:
-                await EmailService.send_time_off_approved_email(
-                    to_email=staff_user.email,
-                    staff_name=staff_member.full_name,
-                    manager_name=manager_name,
-                    request_type=request_type_str,
-                    start_date=start_date_str,
-                    end_date=end_date_str,
-                    total_hours=total_hours_str,
-                    manager_notes=action.notes
-                )
-            else:
-                await EmailService.send_time_off_denied_email(
-                    to_email=staff_user.email,
-                    staff_name=staff_member.full_name,
-                    manager_name=manager_name,
-                    request_type=request_type_str,
-                    start_date=start_date_str,
-                    end_date=end_date_str,
-                    total_hours=total_hours_str,
-                    denial_reason=action.notes
-                )
-
-            import logging
-            logging.info(f"Time-off {'approved' if is_approved else 'denied'} email sent to {staff_user.email}")
-
-        except Exception as email_error:
-            import logging
-            logging.error(f"Failed to send time-off decision email: {str(email_error)}")
-            # Don't fail the request if email fails
-
-        return {
-            "message": f"Time off request {'approved' if is_approved else 'denied'}",
-            "request_id": request_id,
-            "status": time_off_request.status.value
-        }
+    org_id = current_user.organization_id
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to process time off request: {str(e)}"
+    # Eager-load the staff member and their user in the same SELECT so the
+    # notification email below needs no second round-trip.
+    time_off_request = db.query(TimeOffRequest).options(
+        joinedload(TimeOffRequest.staff).joinedload(Staff.user)
+    ).join(Staff).filter(
+        TimeOffRequest.id == request_id,
+        Staff.organization_id == org_id
+    ).first()
+
+    if not time_off_request:
+        raise HTTPException(status_code=404, detail="Time off request not found")
+
+    if time_off_request.status != TimeOffStatus.PENDING:
+        raise HTTPException(status_code=400, detail="Request already reviewed")
+
+    # Check for approval (handle both uppercase and lowercase values)
+    is_approved = action.action.value.upper() == "APPROVED"
+    if is_approved:
+        time_off_request.status = TimeOffStatus.APPROVED
+    else:
+        time_off_request.status = TimeOffStatus.DENIED
+        time_off_request.denial_reason = action.notes
+
+    time_off_request.approved_by = current_user.id
+    time_off_request.approved_date = datetime.utcnow()
+
+    # Capture everything the email needs before commit expires the instances
+    staff_member = time_off_request.staff
+    staff_email = staff_member.user.email
+    staff_name = staff_member.full_name
+    manager_name = f"{current_user.first_name} {current_user.last_name}"
+    start_date_str = _email_date(time_off_request.start_date)
+    end_date_str = _email_date(time_off_request.end_date)
+    total_hours_str = str(time_off_request.total_hours)
+    request_type_str = time_off_request.request_type.value.replace("_", " ").title()
+    status_value = time_off_request.status.value
+
+    db.commit()
+    invalidate_approval_counts(org_id)
+
+    # Email the staff member once the response has gone out; EmailService
+    # logs and swallows delivery failures itself.
+    if is_approved:
+        background_tasks.add_task(
+            EmailService.send_time_off_approved_email,
+            to_email=staff_email,
+            staff_name=staff_name,
+            manager_name=manager_name,
+            request_type=request_type_str,
+            start_date=start_date_str,
+            end_date=end_date_str,
+            total_hours=total_hours_str,
+            manager_notes=action.notes
+        )
+    else:
+        background_tasks.add_task(
+            EmailService.send_time_off_denied_email,
+            to_email=staff_email,
+            staff_name=staff_name,
+            manager_name=manager_name,
+            request_type=request_type_str,
+            start_date=start_date_str,
+            end_date=end_date_str,
+            total_hours=total_hours_str,
+            denial_reason=action.notes
         )
 
+    return {
+        "message": f"Time off request {'approved' if is_approved else 'denied'}",
+        "request_id": request_id,
+        "status": status_value
+    }
+
 @router.post("/staff-assignments", response_model=StaffAssignmentResponse)
-async def create_staff_assignment(
+@handle_errors("create staff assignment")
+def create_staff_assignment(
     assignment: StaffAssignmentCreate,
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
     """
     Assign staff to client
     """
-    try:
-        org_id = current_user.organization_id
-
-        # Verify staff belongs to organization
-        staff = db.query(Staff).filter(
-            Staff.id == assignment.staff_id,
-            Staff.organization_id == org_id
-        ).first()
+    org_id = current_user.organization_id
 
-        if not staff:
-            raise HTTPException(status_code=404, detail="Staff not found")
+    # Verify staff belongs to organization
+    staff = db.query(Staff).filter(
+        Staff.id == assignment.staff_id,
+        Staff.organization_id == org_id
+    ).first()
+
+    if not staff:
+        raise HTTPException(status_code=404, detail="Staff not found")
+
+    # Verify client belongs to organization
+    client = db.query(Client).filter(
+        Client.id == assignment.client_id,
+        Client.organization_id == org_id
+    ).first()
+
+    if not client:
+        raise HTTPException(status_code=404, detail="Client not found")
+
+    # Create assignment
+    new_assignment = StaffAssignment(
+        staff_id=assignment.staff_id,
+        client_id=assignment.client_id,
+        assignment_type=assignment.assignment_type.upper(),
+        start_date=assignment.start_date,
+        end_date=assignment.end_date,
+        notes=assignment.notes,
+        is_active=True
+    )
 
-        # Verify client belongs to organization
-        client = db.query(Client).filter(
-            Client.id == assignment.client_id,
-            Client.organization_id == org_id
-        ).first()
+    db.add(new_assignment)
+    db.commit()
+    db.refresh(new_assignment)
 
-        if not client:
-            raise HTTPException(status_code=404, detail="Client not found")
-
-        # Create assignment
-        new_assignment = StaffAssignment(
-            staff_id=assignment.staff_id,
-            client_id=assignment.client_id,
-            assignment_type=assignment.assignment_type.upper(),
-            start_date=assignment.start_date,
-            end_date=assignment.end_date,
-            notes=assignment.notes,
-            is_active=True
-        )
+    return StaffAssignmentResponse(
+        id=str(new_assignment.id),
+        staff_id=str(new_assignment.staff_id),
+        staff_name=staff.full_name,
+        client_id=str(new_assignment.client_id),
+        client_name=f"{client.first_name} {client.last_name}",
+        assignment_type=assignment.assignment_type,
+        start_date=new_assignment.start_date,
+        end_date=new_assignment.end_date,
+        is_active=new_assignment.is_active,
+        notes=new_assignment.notes,
+        created_at=new_assignment.created_at
+    )
 
-        db.add(new_assignment)
-        db.commit()
-        db.refresh(new_assignment)
-
-        return StaffAssignmentResponse(
-            id=str(new_assignment.id),
-            staff_id=str(new_assignment.staff_id),
-            staff_name=staff.full_name,
-            client_id=str(new_assignment.client_id),
-            client_name=f"{client.first_name} {client.last_name}",
-            assignment_type=assignment.assignment_type,
-            start_date=new_assignment.start_date,
-            end_date=new_assignment.end_date,
-            is_active=new_assignment.is_active,
-            notes=new_assignment.notes,
-            created_at=new_assignment.created_at
-        )
+CERT_ALERTS_CACHE_TTL = 300  # seconds; expiry dates change at most daily
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to create staff assignment: {str(e)}"
-        )
 
 @router.get("/certification-alerts", response_model=List[CertificationAlert])
-async def get_certification_alerts(
+@handle_errors("retrieve certification alerts")
+def get_certification_alerts(
     days_ahead: int = Query(60, description="Days ahead to check for expiring certifications"),
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
     """
     Get certifications expiring soon
     """
-    try:
-        org_id = current_user.organization_id
-        today = date.today()
-        future_date = today + timedelta(days=days_ahead)
+    org_id = current_user.organization_id
 
-        certifications = db.query(StaffCertification).join(Staff).filter(
+    cache_key = cert_alerts_key(org_id, days_ahead)
+    cached = cache_get_json(cache_key)
+    if cached is not None:
+        return [CertificationAlert(**alert) for alert in cached]
+
+    today = date.today()
+    future_date = today + timedelta(days=days_ahead)
+
+    # Days remaining and the alert status are computed by the database so
+    # rows can be handed straight to the response model.
+    days_left = (StaffCertification.expiry_date - today).label("days_left")
+    alert_status = case(
+        (days_left < 0, "expired"),
+        (days_left <= 30, "expiring_soon"),
+        else_="active"
+    ).label("alert_status")
+
+    rows = db.execute(
+        select(
+            StaffCertification.staff_id,
+            User.full_name.label("staff_name"),
+            StaffCertification.certification_name,
+            StaffCertification.expiry_date,
+            days_left,
+            alert_status
+        ).join(
+            Staff, StaffCertification.staff_id == Staff.id
+        ).join(
+            User, Staff.user_id == User.id
+        ).where(
             Staff.organization_id == org_id,
             StaffCertification.expiry_date.isnot(None),
             StaffCertification.expiry_date <= future_date,
             StaffCertification.status == CertificationStatus.ACTIVE
-        ).order_by(StaffCertification.expiry_date).all()
-
-        results = []
-        for cert in certifications:
-            days_until_expiry = (cert.expiry_date - today).days
-
-            if days_until_expiry < 0:
-                status = "expired"
-            elif days_until_expiry <= 30:
-                status = "expiring_soon"
-            else:
-                status = "active"
-
-            results.append(CertificationAlert(
-                staff_id=str(cert.staff_id),
-                staff_name=cert.staff.full_name if cert.staff else "Unknown",
-                certification_name=cert.certification_name,
-                expiry_date=cert.expiry_date,
-                days_until_expiry=days_until_expiry,
-                status=status
-            ))
-
-        return results
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve certification alerts: {str(e)}"
+        ).order_by(StaffCertification.expiry_date)
+    ).all()
+
+    results = [
+        CertificationAlert(
+            staff_id=str(row.staff_id),
+            staff_name=row.staff_name,
+            certification_name=row.certification_name,
+            expiry_date=row.expiry_date,
+            days_until_expiry=row.days_left,
+            status=row.alert_status
         )
+        for row in rows
+    ]
+
+    cache_set_json(cache_key, [alert.model_dump() for alert in results], CERT_ALERTS_CACHE_TTL)
+
+    return results
 
 @router.get("/training/programs/", response_model=List[TrainingProgramResponse])
-async def get_training_programs(
+@handle_errors("retrieve training programs")
+def get_training_programs(
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_org_scoped_db),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     is_mandatory: Optional[bool] = Query(None, description="Filter by mandatory status"),
     category: Optional[str] = Query(None, description="Filter by category")
 ):
     """Get all training programs for the organization"""
-    try:
-        org_id = current_user.organization_id
-
-        query = db.query(TrainingProgram).filter(
-            TrainingProgram.organization_id == org_id
-        )
+    org_id = current_user.organization_id
 
-        if is_active is not None:
-            query = query.filter(TrainingProgram.is_active == is_active)
+    query = db.query(TrainingProgram).filter(
+        TrainingProgram.organization_id == org_id
+    )
 
-        if is_mandatory is not None:
-            query = query.filter(TrainingProgram.is_mandatory == is_mandatory)
+    if is_active is not None:
+        query = query.filter(TrainingProgram.is_active == is_active)
 
-        if category:
-            query = query.filter(TrainingProgram.category == category)
+    if is_mandatory is not None:
+        query = query.filter(TrainingProgram.is_mandatory == is_mandatory)
 
-        programs = query.order_by(TrainingProgram.program_name).all()
+    if category:
+        query = query.filter(TrainingProgram.category == category)
 
-        return [TrainingProgramResponse.model_validate(program) for program in programs]
+    programs = query.order_by(TrainingProgram.program_name).all()
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve training programs: {str(e)}"
-        )
+    return [TrainingProgramResponse.model_validate(program) for program in programs]
 
 @router.post("/training/programs/", response_model=TrainingProgramResponse)
-async def create_training_program(
+@handle_errors("create training program")
+def create_training_program(
     program_data: TrainingProgramCreate,
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
     """Create a new training program"""
-    try:
-        org_id = current_user.organization_id
-
-        # Check if program with same name already exists
-        existing = db.query(TrainingProgram).filter(
-            TrainingProgram.organization_id == org_id,
-            TrainingProgram.program_name == program_data.program_name
-        ).first()
+    org_id = current_user.organization_id
 
-        if existing:
-            raise HTTPException(
-                status_code=400,
-                detail="A training program with this name already exists"
-            )
+    # Check if program with same name already exists
+    existing = db.query(TrainingProgram).filter(
+        TrainingProgram.organization_id == org_id,
+        TrainingProgram.program_name == program_data.program_name
+    ).first()
 
-        # Create new training program
-        new_program = TrainingProgram(
-            organization_id=org_id,
-            **program_data.model_dump()
+    if existing:
+        raise HTTPException(
+            status_code=400,
+            detail="A training program with this name already exists"
         )
 
-        db.add(new_program)
-        db.commit()
-        db.refresh(new_program)
+    # Create new training program
+    new_program = TrainingProgram(
+        organization_id=org_id,
+        **program_data.model_dump()
+    )
 
-        return TrainingProgramResponse.model_validate(new_program)
+    db.add(new_program)
+    db.commit()
+    db.refresh(new_program)
+
+    return TrainingProgramResponse.model_validate(new_program)
+
+
+TRAINING_DUE_SOON_CACHE_TTL = 300  # seconds; matches the dashboard refresh cadence
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to create training program: {str(e)}"
-        )
 
 @router.get("/training/recent-activity/", response_model=List[TrainingActivityItem])
-async def get_recent_training_activity(
+@handle_errors("retrieve recent training activity")
+def get_recent_training_activity(
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db),
-    limit: int = Query(10, le=20, description="Number of recent activities to return")
+    db: Session = Depends(get_org_scoped_db),
+    limit: int = Query(10, ge=1, le=20, description="Number of recent activities to return")
 ):
     """Get recent training activity (completions, in-progress, and upcoming due dates)"""
-    try:
-        org_id = current_user.organization_id
-        activities = []
+    org_id = current_user.organization_id
+    activities = []
 
-        # Get recent completions (last 7 days)
-        seven_days_ago = date.today() - timedelta(days=7)
-        completed_records = db.query(TrainingRecord).join(
-            Staff, TrainingRecord.staff_id == Staff.id
-        ).join(
-            TrainingProgram, TrainingRecord.training_program_id == TrainingProgram.id
-        ).options(
-            joinedload(TrainingRecord.staff).joinedload(Staff.user),
-            joinedload(TrainingRecord.training_program)
-        ).filter(
-            Staff.organization_id == org_id,
-            TrainingRecord.status == TrainingStatus.COMPLETED,
-            TrainingRecord.completion_date >= seven_days_ago
-        ).order_by(TrainingRecord.completion_date.desc()).limit(5).all()
-
-        for record in completed_records:
-            if record.staff.user and record.training_program:
-                activities.append(TrainingActivityItem(
-                    type="completion",
-                    staff_name=f"{record.staff.user.first_name} {record.staff.user.last_name}",
-                    course_title=record.training_program.program_name,
-                    progress_percentage=100.0,
-                    timestamp=datetime.combine(record.completion_date, datetime.min.time()) if record.completion_date else datetime.now(),
-                    staff_count=None,
-                    days_until_due=None
-                ))
-
-        # Get in-progress training with significant progress (>25%)
-        in_progress_records = db.query(TrainingRecord).join(
-            Staff, TrainingRecord.staff_id == Staff.id
-        ).join(
-            TrainingProgram, TrainingRecord.training_program_id == TrainingProgram.id
-        ).options(
-            joinedload(TrainingRecord.staff).joinedload(Staff.user),
-            joinedload(TrainingRecord.training_program)
-        ).filter(
-            Staff.organization_id == org_id,
-            TrainingRecord.status == TrainingStatus.IN_PROGRESS,
-            TrainingRecord.start_date.isnot(None)
-        ).order_by(TrainingRecord.start_date.desc()).limit(3).all()
-
-        for record in in_progress_records:
-            if record.staff.user and record.training_program:
-                # Calculate progress based on status
-                progress = 50.0  # Default for in-progress
-                activities.append(TrainingActivityItem(
-                    type="in_progress",
-                    staff_name=f"{record.staff.user.first_name} {record.staff.user.last_name}",
-                    course_title=record.training_program.program_name,
-                    progress_percentage=progress,
-                    timestamp=datetime.combine(record.start_date, datetime.min.time()) if record.start_date else datetime.now(),
-                    staff_count=None,
-                    days_until_due=None
-                ))
-
-        # Get upcoming due dates (next 7 days) - group by program
-        today = date.today()
-        seven_days_ahead = today + timedelta(days=7)
+    # Recent completions (last 7 days) and in-progress training in one
+    # round-trip: each branch keeps its own ordering and limit.
+    seven_days_ago = date.today() - timedelta(days=7)
 
-        upcoming_due = db.query(
+    def _record_activity(activity_type, date_col):
+        return select(
+            literal(activity_type).label("type"),
+            User.full_name.label("staff_name"),
             TrainingProgram.program_name,
-            TrainingRecord.due_date,
-            func.count(TrainingRecord.id).label('staff_count')
-        ).join(
+            date_col.label("activity_date")
+        ).select_from(TrainingRecord).join(
             Staff, TrainingRecord.staff_id == Staff.id
+        ).join(
+            User, Staff.user_id == User.id
         ).join(
             TrainingProgram, TrainingRecord.training_program_id == TrainingProgram.id
-        ).filter(
-            Staff.organization_id == org_id,
-            TrainingRecord.status != TrainingStatus.COMPLETED,
-            TrainingRecord.due_date.isnot(None),
-            TrainingRecord.due_date >= today,
-            TrainingRecord.due_date <= seven_days_ahead
-        ).group_by(
-            TrainingProgram.program_name,
-            TrainingRecord.due_date
-        ).order_by(TrainingRecord.due_date).limit(2).all()
-
-        for program_name, due_date, staff_count in upcoming_due:
-            days_until = (due_date - today).days
-            activities.append(TrainingActivityItem(
-                type="due_soon",
-                staff_name="",  # Not applicable for grouped activities
-                course_title=program_name,
-                progress_percentage=None,
-                timestamp=datetime.combine(due_date, datetime.min.time()),
-                staff_count=staff_count,
-                days_until_due=days_until
-            ))
-
-        # Sort all activities by timestamp (most recent first)
-        activities.sort(key=lambda x: x.timestamp, reverse=True)
-
-        return activities[:limit]
-
-    except Exception as e:
-        import traceback
-        print(f"ERROR in recent training activity: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve recent training activity: {str(e)}"
-        )
-
-@router.get("/training/assignments", response_model=List[TrainingAssignmentSummary])
-async def get_training_assignments(
+        ).where(
+            Staff.organization_id == org_id
+        ).order_by(date_col.desc())
+
+    completed = _record_activity("completion", TrainingRecord.completion_date).where(
+        TrainingRecord.status == TrainingStatus.COMPLETED,
+        TrainingRecord.completion_date >= seven_days_ago
+    ).limit(5)
+
+    # In-progress training with a recorded start date
+    in_progress = _record_activity("in_progress", TrainingRecord.start_date).where(
+        TrainingRecord.status == TrainingStatus.IN_PROGRESS,
+        TrainingRecord.start_date.isnot(None)
+    ).limit(3)
+
+    # The database orders the combined branches and keeps only the top
+    # `limit`, so rows that would be sliced off never leave Postgres
+    recent = union_all(completed, in_progress).subquery()
+    recent_rows = db.execute(
+        select(recent).order_by(recent.c.activity_date.desc()).limit(limit)
+    ).all()
+
+    for row in recent_rows:
+        activities.append(TrainingActivityItem(
+            type=row.type,
+            staff_name=row.staff_name,
+            course_title=row.program_name,
+            # In-progress records have no tracked percentage; 50% is the default
+            progress_percentage=100.0 if row.type == "completion" else 50.0,
+            timestamp=datetime.combine(row.activity_date, datetime.min.time()) if row.activity_date else datetime.now(),
+            staff_count=None,
+            days_until_due=None
+        ))
+
+    # Get upcoming due dates (next 7 days) - group by program. The same
+    # window is recomputed for every manager's dashboard load, so it is
+    # cached per organization and day.
+    today = date.today()
+    seven_days_ahead = today + timedelta(days=7)
+
+    cache_key = training_due_soon_key(org_id, today)
+    upcoming_due = cache_get_json(cache_key)
+    if upcoming_due is None:
+        upcoming_due = [
+            {"program_name": program_name, "due_date": due_date.isoformat(), "staff_count": staff_count}
+            for program_name, due_date, staff_count in db.query(
+                TrainingProgram.program_name,
+                TrainingRecord.due_date,
+                func.count(TrainingRecord.id).label('staff_count')
+            ).join(
+                Staff, TrainingRecord.staff_id == Staff.id
+            ).join(
+                TrainingProgram, TrainingRecord.training_program_id == TrainingProgram.id
+            ).filter(
+                Staff.organization_id == org_id,
+                TrainingRecord.status != TrainingStatus.COMPLETED,
+                TrainingRecord.due_date.isnot(None),
+                TrainingRecord.due_date >= today,
+                TrainingRecord.due_date <= seven_days_ahead
+            ).group_by(
+                TrainingProgram.program_name,
+                TrainingRecord.due_date
+            ).order_by(TrainingRecord.due_date).limit(2).all()
+        ]
+        cache_set_json(cache_key, upcoming_due, TRAINING_DUE_SOON_CACHE_TTL)
+
+    for due in upcoming_due:
+        due_date = date.fromisoformat(due["due_date"])
+        activities.append(TrainingActivityItem(
+            type="due_soon",
+            staff_name="",  # Not applicable for grouped activities
+            course_title=due["program_name"],
+            progress_percentage=None,
+            timestamp=datetime.combine(due_date, datetime.min.time()),
+            staff_count=due["staff_count"],
+            days_until_due=(due_date - today).days
+        ))
+
+    # Merge in the (at most two) cached due-soon items, most recent first
+    activities.sort(key=lambda x: x.timestamp, reverse=True)
+
+    return activities[:limit]
+
+@router.get("/training/assignments", response_model=List[TrainingAssignmentSummary], response_class=ORJSONResponse)
+@handle_errors("retrieve training assignments")
+def get_training_assignments(
+    request: Request,
     status: Optional[str] = Query(None, description="Filter by status"),
     staff_id: Optional[str] = Query(None, description="Filter by staff member"),
-    limit: int = Query(50, le=100),
+    limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor or Link header"),
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
     """
     Get training assignments for the organization
     """
-    try:
-        org_id = current_user.organization_id
-
-        # Query training records with eager loading
-        from sqlalchemy.orm import joinedload
+    org_id = current_user.organization_id
 
-        query = db.query(TrainingRecord).join(
-            Staff, TrainingRecord.staff_id == Staff.id
-        ).join(
-            TrainingProgram, TrainingRecord.training_program_id == TrainingProgram.id
-        ).options(
-            joinedload(TrainingRecord.staff).joinedload(Staff.user)
-        ).filter(
-            Staff.organization_id == org_id
-        )
+    # Priority (by days until due) and progress (by status) are derived
+    # in the SELECT; a missing due date falls through to "medium"
+    today = date.today()
+    priority_col = case(
+        (TrainingRecord.due_date < today + timedelta(days=7), "high"),
+        (TrainingRecord.due_date > today + timedelta(days=30), "low"),
+        else_="medium"
+    ).label("priority")
+    progress_col = case(
+        (TrainingRecord.status == TrainingStatus.COMPLETED, 100.0),
+        (TrainingRecord.status == TrainingStatus.IN_PROGRESS, 50.0),  # Default for in-progress
+        else_=0.0
+    ).label("progress_percentage")
+
+    # Only the columns the summary needs, straight from the joins
+    query = db.query(
+        TrainingRecord.id,
+        TrainingRecord.enrollment_date,
+        TrainingRecord.due_date,
+        TrainingRecord.status,
+        TrainingRecord.completion_date,
+        TrainingProgram.program_name,
+        Staff.id.label("staff_id"),
+        User.full_name.label("staff_name"),
+        priority_col,
+        progress_col
+    ).join(
+        Staff, TrainingRecord.staff_id == Staff.id
+    ).join(
+        User, Staff.user_id == User.id
+    ).join(
+        TrainingProgram, TrainingRecord.training_program_id == TrainingProgram.id
+    ).filter(
+        Staff.organization_id == org_id
+    )
 
-        # Apply filters
-        if status:
-            try:
-                status_enum = TrainingStatus[status.upper()]
-                query = query.filter(TrainingRecord.status == status_enum)
-            except KeyError:
-                pass
-
-        if staff_id:
-            query = query.filter(TrainingRecord.staff_id == staff_id)
-
-        # Execute query
-        training_records = query.order_by(TrainingRecord.enrollment_date.desc()).offset(offset).limit(limit).all()
-
-        # Build response
-        results = []
-        for record in training_records:
-            staff = record.staff
-            program = record.training_program
-
-            # Calculate priority based on due date
-            priority = "medium"
-            if record.due_date:
-                days_until_due = (record.due_date - date.today()).days
-                if days_until_due < 7:
-                    priority = "high"
-                elif days_until_due > 30:
-                    priority = "low"
-
-            # Calculate progress percentage based on status
-            progress_percentage = 0.0
-            if record.status == TrainingStatus.COMPLETED:
-                progress_percentage = 100.0
-            elif record.status == TrainingStatus.IN_PROGRESS:
-                progress_percentage = 50.0  # Default for in-progress
-
-            results.append(TrainingAssignmentSummary(
-                id=str(record.id),
-                course_title=program.title,
-                staff_name=f"{staff.user.first_name} {staff.user.last_name}" if staff.user else "Unknown",
-                staff_id=str(staff.id),
-                assigned_date=record.enrollment_date,
-                due_date=record.due_date,
-                completion_status=record.status.value if isinstance(record.status, TrainingStatus) else record.status,
-                completed_date=record.completion_date,
-                progress_percentage=progress_percentage,
-                priority=priority
-            ))
-
-        return results
-
-    except Exception as e:
-        import traceback
-        print(f"ERROR in training assignments: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve training assignments: {str(e)}"
+    # Apply filters
+    if status:
+        try:
+            status_enum = TrainingStatus[status.upper()]
+            query = query.filter(TrainingRecord.status == status_enum)
+        except KeyError:
+            pass
+
+    if staff_id:
+        query = query.filter(TrainingRecord.staff_id == staff_id)
+
+    # Keyset pagination on (enrollment_date, id) DESC; OFFSET stays for
+    # callers that have not moved to the cursor yet
+    if cursor:
+        enrollment_date, record_id = _decode_cursor(cursor, date.fromisoformat, uuid.UUID)
+        query = query.filter(
+            tuple_(TrainingRecord.enrollment_date, TrainingRecord.id) < tuple_(enrollment_date, record_id)
         )
+    else:
+        query = query.offset(offset)
+
+    training_records = query.order_by(
+        TrainingRecord.enrollment_date.desc(), TrainingRecord.id.desc()
+    ).limit(limit + 1).all()
+
+    headers = {}
+    if len(training_records) > limit:
+        training_records = training_records[:limit]
+        last = training_records[-1]
+        headers = _next_page_headers((last.enrollment_date, last.id), limit, request.query_params)
+
+    # Rows are already in TrainingAssignmentSummary shape; orjson encodes
+    # UUIDs, dates and enums (as their values) without a Pydantic pass
+    return ORJSONResponse([
+        {
+            "id": record.id,
+            "course_title": record.program_name,
+            "staff_name": record.staff_name,
+            "staff_id": record.staff_id,
+            "assigned_date": record.enrollment_date,
+            "due_date": record.due_date,
+            "completion_status": record.status,
+            "completed_date": record.completion_date,
+            "progress_percentage": float(record.progress_percentage),
+            "priority": record.priority
+        }
+        for record in training_records
+    ], headers=headers)
 
-@router.get("/shifts", response_model=List[ShiftSummary])
-async def get_shifts(
+@router.get("/shifts", response_model=List[ShiftSummary], response_class=ORJSONResponse)
+@handle_errors("retrieve shifts")
+def get_shifts(
+    request: Request,
     start_date: Optional[date] = Query(None, description="Start date filter"),
     end_date: Optional[date] = Query(None, description="End date filter"),
     staff_id: Optional[str] = Query(None, description="Filter by staff member"),
     status: Optional[str] = Query(None, description="Filter by status"),
-    limit: int = Query(50, le=100),
+    limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor or Link header"),
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
     """
     Get shifts for the organization
     """
-    try:
-        org_id = current_user.organization_id
-
-        # Default to current week if no dates provided
-        if not start_date:
-            start_date = date.today() - timedelta(days=date.today().weekday())
-        if not end_date:
-            end_date = start_date + timedelta(days=6)
-
-        # Query shifts with eager loading
-        query = db.query(Shift).options(
-            joinedload(Shift.staff).joinedload(Staff.user),
-            joinedload(Shift.client)
-        ).join(
-            Staff, Shift.staff_id == Staff.id
-        ).filter(
-            Staff.organization_id == org_id,
-            Shift.shift_date >= start_date,
-            Shift.shift_date <= end_date
-        )
+    org_id = current_user.organization_id
 
-        # Apply filters
-        if staff_id:
-            query = query.filter(Shift.staff_id == staff_id)
-
-        if status:
-            query = query.filter(Shift.status == status)
-
-        # Execute query
-        shifts = query.order_by(Shift.shift_date, Shift.start_time).offset(offset).limit(limit).all()
-
-        # Build response
-        results = []
-        for shift in shifts:
-            staff = shift.staff
-            client = shift.client
-
-            # Fetch location if location_id exists
-            location = None
-            location_name = None
-            if shift.location_id:
-                from app.models.location import Location
-                location = db.query(Location).filter(Location.id == shift.location_id).first()
-                if location:
-                    location_name = location.name
-
-            # Combine date and time
-            start_datetime = datetime.combine(shift.shift_date, shift.start_time)
-            end_datetime = datetime.combine(shift.shift_date, shift.end_time)
-
-            results.append(ShiftSummary(
-                id=str(shift.id),
-                staff_name=staff.full_name,
-                staff_id=str(staff.id),
-                client_name=f"{client.first_name} {client.last_name}" if client else None,
-                client_id=str(client.id) if client else None,
-                location_name=location_name,
-                location_id=str(shift.location_id) if shift.location_id else None,
-                start_time=start_datetime,
-                end_time=end_datetime,
-                status=shift.status.value if hasattr(shift.status, 'value') else shift.status,
-                shift_type=shift.shift_type.value if hasattr(shift.shift_type, 'value') else shift.shift_type
-            ))
-
-        return results
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve shifts: {str(e)}"
+    # Default to current week if no dates provided
+    if not start_date:
+        start_date = date.today() - timedelta(days=date.today().weekday())
+    if not end_date:
+        end_date = start_date + timedelta(days=6)
+
+    # Only the columns the summary needs; client and location are optional
+    query = db.query(
+        Shift.id,
+        Shift.shift_date,
+        Shift.start_time,
+        Shift.end_time,
+        Shift.status,
+        Shift.shift_type,
+        Shift.client_id,
+        Shift.location_id,
+        Staff.id.label("staff_id"),
+        User.full_name.label("staff_name"),
+        Client.full_name.label("client_name"),
+        Location.name.label("location_name")
+    ).join(
+        Staff, Shift.staff_id == Staff.id
+    ).join(
+        User, Staff.user_id == User.id
+    ).outerjoin(
+        Client, Shift.client_id == Client.id
+    ).outerjoin(
+        Location, Shift.location_id == Location.id
+    ).filter(
+        Staff.organization_id == org_id,
+        Shift.shift_date >= start_date,
+        Shift.shift_date <= end_date
+    )
+
+    # Apply filters
+    if staff_id:
+        query = query.filter(Shift.staff_id == staff_id)
+
+    if status:
+        query = query.filter(Shift.status == status)
+
+    # Keyset pagination on (shift_date, start_time, id)
+    if cursor:
+        shift_date, start_time, shift_id = _decode_cursor(
+            cursor, date.fromisoformat, time.fromisoformat, uuid.UUID
         )
+        query = query.filter(
+            tuple_(Shift.shift_date, Shift.start_time, Shift.id) > tuple_(shift_date, start_time, shift_id)
+        )
+    else:
+        query = query.offset(offset)
+
+    shifts = query.order_by(Shift.shift_date, Shift.start_time, Shift.id).limit(limit + 1).all()
+
+    headers = {}
+    if len(shifts) > limit:
+        shifts = shifts[:limit]
+        last = shifts[-1]
+        headers = _next_page_headers((last.shift_date, last.start_time, last.id), limit, request.query_params)
+
+    # Serialized by orjson directly in ShiftSummary shape
+    return ORJSONResponse([
+        {
+            "id": shift.id,
+            "staff_name": shift.staff_name,
+            "staff_id": shift.staff_id,
+            "client_name": shift.client_name,
+            "client_id": shift.client_id,
+            "location_name": shift.location_name,
+            "location_id": shift.location_id,
+            "start_time": datetime.combine(shift.shift_date, shift.start_time),
+            "end_time": datetime.combine(shift.shift_date, shift.end_time),
+            "status": shift.status,
+            "shift_type": shift.shift_type
+        }
+        for shift in shifts
+    ], headers=headers)
 
-@router.get("/appointments", response_model=List[AppointmentSummary])
-async def get_appointments(
+@router.get("/appointments", response_model=List[AppointmentSummary], response_class=ORJSONResponse)
+@handle_errors("retrieve appointments")
+def get_appointments(
+    request: Request,
     start_date: Optional[date] = Query(None, description="Start date filter"),
     end_date: Optional[date] = Query(None, description="End date filter"),
     client_id: Optional[str] = Query(None, description="Filter by client"),
     status: Optional[str] = Query(None, description="Filter by status"),
-    limit: int = Query(50, le=100),
+    limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor or Link header"),
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
     """
     Get appointments for the organization
     """
-    try:
-        org_id = current_user.organization_id
-
-        # Default to current week if no dates provided
-        if not start_date:
-            start_date = date.today() - timedelta(days=date.today().weekday())
-        if not end_date:
-            end_date = start_date + timedelta(days=6)
-
-        # Convert dates to datetime for comparison
-        start_datetime = datetime.combine(start_date, datetime.min.time())
-        end_datetime = datetime.combine(end_date, datetime.max.time())
-
-        # Query appointments
-        query = db.query(Appointment).join(
-            Client, Appointment.client_id == Client.id
-        ).filter(
-            Client.organization_id == org_id,
-            Appointment.start_datetime >= start_datetime,
-            Appointment.start_datetime <= end_datetime
-        )
+    org_id = current_user.organization_id
 
-        # Apply filters
-        if client_id:
-            query = query.filter(Appointment.client_id == client_id)
-
-        if status:
-            query = query.filter(Appointment.status == status)
-
-        # Execute query
-        appointments = query.order_by(Appointment.start_datetime).offset(offset).limit(limit).all()
-
-        # Build response
-        results = []
-        for apt in appointments:
-            client = apt.client
-            staff = apt.staff
-
-            results.append(AppointmentSummary(
-                id=str(apt.id),
-                client_name=f"{client.first_name} {client.last_name}",
-                client_id=str(client.id),
-                staff_name=f"{staff.first_name} {staff.last_name}" if staff else None,
-                staff_id=str(staff.id) if staff else None,
-                appointment_type=apt.appointment_type.value if hasattr(apt.appointment_type, 'value') else apt.appointment_type,
-                start_time=apt.start_datetime,
-                end_time=apt.end_datetime,
-                status=apt.status.value if hasattr(apt.status, 'value') else apt.status,
-                location=apt.location
-            ))
-
-        return results
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve appointments: {str(e)}"
+    # Default to current week if no dates provided
+    if not start_date:
+        start_date = date.today() - timedelta(days=date.today().weekday())
+    if not end_date:
+        end_date = start_date + timedelta(days=6)
+
+    # Convert dates to datetime for comparison
+    start_datetime = datetime.combine(start_date, datetime.min.time())
+    end_datetime = datetime.combine(end_date, datetime.max.time())
+
+    # Only the columns the summary needs; staff is optional on the row
+    query = db.query(
+        Appointment.id,
+        Appointment.appointment_type,
+        Appointment.start_datetime,
+        Appointment.end_datetime,
+        Appointment.status,
+        Appointment.location,
+        Appointment.client_id,
+        Appointment.staff_id,
+        Client.full_name.label("client_name"),
+        User.full_name.label("staff_name")
+    ).join(
+        Client, Appointment.client_id == Client.id
+    ).outerjoin(
+        Staff, Appointment.staff_id == Staff.id
+    ).outerjoin(
+        User, Staff.user_id == User.id
+    ).filter(
+        # Appointments carry their own organization_id, so tenant scoping
+        # and the date window are both served by ix_appointments_org_start
+        Appointment.organization_id == org_id,
+        Appointment.start_datetime >= start_datetime,
+        Appointment.start_datetime <= end_datetime
+    )
+
+    # Apply filters
+    if client_id:
+        query = query.filter(Appointment.client_id == client_id)
+
+    if status:
+        query = query.filter(Appointment.status == status)
+
+    # Keyset pagination on (start_datetime, id)
+    if cursor:
+        start_at, appointment_id = _decode_cursor(cursor, datetime.fromisoformat, uuid.UUID)
+        query = query.filter(
+            tuple_(Appointment.start_datetime, Appointment.id) > tuple_(start_at, appointment_id)
         )
+    else:
+        query = query.offset(offset)
+
+    appointments = query.order_by(Appointment.start_datetime, Appointment.id).limit(limit + 1).all()
+
+    headers = {}
+    if len(appointments) > limit:
+        appointments = appointments[:limit]
+        last = appointments[-1]
+        headers = _next_page_headers((last.start_datetime, last.id), limit, request.query_params)
+
+    # Serialized by orjson directly in AppointmentSummary shape
+    return ORJSONResponse([
+        {
+            "id": apt.id,
+            "client_name": apt.client_name,
+            "client_id": apt.client_id,
+            "staff_name": apt.staff_name,
+            "staff_id": apt.staff_id,
+            "appointment_type": apt.appointment_type,
+            "start_time": apt.start_datetime,
+            "end_time": apt.end_datetime,
+            "status": apt.status,
+            "location": apt.location
+        }
+        for apt in appointments
+    ], headers=headers)
 
 @router.post("/training/assign")
-async def assign_training(
+@handle_errors("assign training")
+def assign_training(
     assignment: TrainingAssignmentRequest,
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
     """
     Assign training course to staff members
     """
-    try:
-        org_id = current_user.organization_id
-
-        # Verify training course exists and belongs to organization
-        course = db.query(TrainingProgram).filter(
-            TrainingProgram.id == assignment.course_id,
-            TrainingProgram.organization_id == org_id
-        ).first()
-
-        if not course:
-            raise HTTPException(status_code=404, detail="Training course not found")
-
-        assigned_count = 0
-        for staff_id in assignment.staff_ids:
-            # Verify staff belongs to organization
-            staff = db.query(Staff).filter(
-                Staff.id == staff_id,
-                Staff.organization_id == org_id
-            ).first()
-
-            if not staff:
-                continue
-
-            # Check if already enrolled
-            existing = db.query(TrainingRecord).filter(
-                TrainingRecord.staff_id == staff_id,
-                TrainingRecord.training_program_id == assignment.course_id
-            ).first()
+    org_id = current_user.organization_id
 
-            if existing:
-                continue
-
-            # Create training record
-            training_record = TrainingRecord(
-                staff_id=staff_id,
-                training_program_id=assignment.course_id,
-                enrollment_date=date.today(),
-                due_date=assignment.due_date,
-                status="NOT_STARTED",
-                notes=assignment.notes
-            )
+    # A single INSERT ... SELECT enrolls the organization's staff from the
+    # request who are not enrolled yet. The course check is folded in as a
+    # join, and the statement also reports whether the course matched so a
+    # missing course is still a 404 rather than "0 assigned".
+    today = date.today()
+    already_enrolled = select(TrainingRecord.id).where(
+        TrainingRecord.staff_id == Staff.id,
+        TrainingRecord.training_program_id == TrainingProgram.id
+    ).exists()
+
+    # Column defaults on a multi-row INSERT ... SELECT are evaluated once per
+    # statement, so each record's id comes from the database instead
+    enrollable = select(
+        func.gen_random_uuid(),
+        Staff.id,
+        TrainingProgram.id,
+        literal(today, TrainingRecord.enrollment_date.type),
+        literal(assignment.due_date, TrainingRecord.due_date.type),
+        literal(TrainingStatus.NOT_STARTED, TrainingRecord.status.type),
+        literal(assignment.notes, TrainingRecord.notes.type)
+    ).where(
+        TrainingProgram.id == assignment.course_id,
+        TrainingProgram.organization_id == org_id,
+        Staff.id.in_(assignment.staff_ids),
+        Staff.organization_id == org_id,
+        ~already_enrolled
+    )
 
-            db.add(training_record)
-            assigned_count += 1
+    inserted = insert(TrainingRecord).from_select(
+        ["id", "staff_id", "training_program_id", "enrollment_date", "due_date", "status", "notes"],
+        enrollable
+    ).returning(TrainingRecord.staff_id).cte("inserted")
+
+    course_found, assigned_count = db.execute(
+        select(
+            select(TrainingProgram.id).where(
+                TrainingProgram.id == assignment.course_id,
+                TrainingProgram.organization_id == org_id
+            ).exists(),
+            select(func.count()).select_from(inserted).scalar_subquery()
+        )
+    ).one()
 
-        db.commit()
+    if not course_found:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Training course not found")
 
-        return {
-            "message": f"Training assigned to {assigned_count} staff members",
-            "course_id": assignment.course_id,
-            "assigned_count": assigned_count
-        }
+    db.commit()
+    invalidate_training_due_soon(org_id, today)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to assign training: {str(e)}"
-        )
+    return {
+        "message": f"Training assigned to {assigned_count} staff members",
+        "course_id": assignment.course_id,
+        "assigned_count": assigned_count
+    }
 
 @router.post("/notices")
-async def create_notice(
+@handle_errors("create notice")
+def create_notice(
     notice_data: NoticeCreateRequest,
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
     """
     Create notice for team
     """
-    try:
-        org_id = current_user.organization_id
-
-        new_notice = Notice(
-            organization_id=org_id,
-            title=notice_data.title,
-            content=notice_data.content,
-            author_id=current_user.id,
-            priority=notice_data.priority,
-            category=notice_data.category,
-            published=True,
-            published_at=datetime.utcnow(),
-            expires_at=notice_data.expires_at,
-            requires_acknowledgment=notice_data.requires_acknowledgment
-        )
+    org_id = current_user.organization_id
 
-        db.add(new_notice)
-        db.commit()
-        db.refresh(new_notice)
+    new_notice = Notice(
+        organization_id=org_id,
+        title=notice_data.title,
+        content=notice_data.content,
+        author_id=current_user.id,
+        priority=notice_data.priority,
+        category=notice_data.category,
+        published=True,
+        published_at=datetime.utcnow(),
+        expires_at=notice_data.expires_at,
+        requires_acknowledgment=notice_data.requires_acknowledgment
+    )
 
-        return {
-            "message": "Notice created successfully",
-            "notice_id": str(new_notice.id),
-            "title": new_notice.title
-        }
+    db.add(new_notice)
+    db.commit()
+    db.refresh(new_notice)
 
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to create notice: {str(e)}"
-        )
+    return {
+        "message": "Notice created successfully",
+        "notice_id": str(new_notice.id),
+        "title": new_notice.title
+    }
 
 
 # ============================================================================
 # SHIFT EXCHANGE MANAGEMENT ENDPOINTS
 # ============================================================================
 
-def _build_staff_shift_info(shift: Shift, staff: Staff, db: Session) -> StaffShiftInfo:
+# Everything _build_exchange_response reads. Staff, users and shifts come in
+# as small IN queries for the page rather than one ten-way join; each shift
+# still joins its client and location, which are single narrow rows.
+EXCHANGE_RESPONSE_LOAD_OPTIONS = (
+    selectinload(ShiftExchangeRequest.requester_staff).selectinload(Staff.user),
+    selectinload(ShiftExchangeRequest.target_staff).selectinload(Staff.user),
+    selectinload(ShiftExchangeRequest.requester_shift).joinedload(Shift.client),
+    selectinload(ShiftExchangeRequest.requester_shift).joinedload(Shift.location),
+    selectinload(ShiftExchangeRequest.target_shift).joinedload(Shift.client),
+    selectinload(ShiftExchangeRequest.target_shift).joinedload(Shift.location)
+)
+
+# In development, any other relationship the builders touch raises instead of
+# quietly issuing a query per exchange
+if settings.DEBUG:
+    EXCHANGE_RESPONSE_LOAD_OPTIONS += (
+        raiseload("*", sql_only=True),
+        defaultload(ShiftExchangeRequest.requester_staff).raiseload("*", sql_only=True),
+        defaultload(ShiftExchangeRequest.target_staff).raiseload("*", sql_only=True),
+        defaultload(ShiftExchangeRequest.requester_shift).raiseload("*", sql_only=True),
+        defaultload(ShiftExchangeRequest.target_shift).raiseload("*", sql_only=True)
+    )
+
+
+def _build_staff_shift_info(shift: Shift, staff: Staff) -> StaffShiftInfo:
     """Helper function to build StaffShiftInfo from shift and staff objects"""
     client_name = None
     if shift.client:
         client_name = f"{shift.client.first_name} {shift.client.last_name}"
 
-    location_name = None
-    if shift.location_id:
-        location = db.query(Location).filter(Location.id == shift.location_id).first()
-        if location:
-            location_name = location.name
+    location_name = shift.location.name if shift.location else None
 
-    return StaffShiftInfo(
+    return StaffShiftInfo.model_construct(
         staff_id=staff.id,
         staff_name=staff.full_name,
         staff_email=staff.user.email if staff.user else None,
@@ -1944,19 +2208,25 @@ def _build_staff_shift_info(shift: Shift, staff: Staff, db: Session) -> StaffShi
     )
 
 
-def _build_exchange_response(exchange: ShiftExchangeRequest, db: Session) -> ShiftExchangeRequestResponse:
+def _manager_names(db: Session, exchanges: List[ShiftExchangeRequest]) -> dict:
+    """Names of the managers who responded to any of the exchanges, in one query"""
+    manager_ids = {exchange.manager_responded_by for exchange in exchanges if exchange.manager_responded_by}
+    if not manager_ids:
+        return {}
+    return dict(db.execute(
+        select(User.id, User.full_name).where(User.id.in_(manager_ids))
+    ).all())
+
+
+def _build_exchange_response(exchange: ShiftExchangeRequest, manager_names: dict) -> ShiftExchangeRequestResponse:
     """Helper function to build ShiftExchangeRequestResponse from exchange request"""
-    requester_info = _build_staff_shift_info(exchange.requester_shift, exchange.requester_staff, db)
-    target_info = _build_staff_shift_info(exchange.target_shift, exchange.target_staff, db)
+    requester_info = _build_staff_shift_info(exchange.requester_shift, exchange.requester_staff)
+    target_info = _build_staff_shift_info(exchange.target_shift, exchange.target_staff)
 
-    manager_name = None
-    if exchange.manager_responded_by:
-        from app.models.user import User
-        manager = db.query(User).filter(User.id == exchange.manager_responded_by).first()
-        if manager:
-            manager_name = f"{manager.first_name} {manager.last_name}"
+    manager_name = manager_names.get(exchange.manager_responded_by)
 
-    return ShiftExchangeRequestResponse(
+    # Every field comes straight off typed columns, so skip re-validation
+    return ShiftExchangeRequestResponse.model_construct(
         id=exchange.id,
         organization_id=exchange.organization_id,
         status=exchange.status,
@@ -1975,208 +2245,205 @@ def _build_exchange_response(exchange: ShiftExchangeRequest, db: Session) -> Shi
     )
 
 
-@router.get("/shift-exchange-requests", response_model=List[ShiftExchangeRequestResponse])
-async def get_shift_exchange_requests(
+@router.get("/shift-exchange-requests", response_model=List[ShiftExchangeRequestResponse], response_class=ORJSONResponse)
+@handle_errors("retrieve shift exchange requests")
+def get_shift_exchange_requests(
     status: Optional[str] = Query(None, description="Filter by status (pending_peer, pending_manager, approved, denied, cancelled)"),
     limit: int = Query(50, le=100),
     offset: int = Query(0),
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
     """
     Get shift exchange requests for the organization.
     Managers typically filter by 'pending_manager' to see requests awaiting their approval.
     """
-    try:
-        org_id = current_user.organization_id
-
-        query = db.query(ShiftExchangeRequest).options(
-            joinedload(ShiftExchangeRequest.requester_staff).joinedload(Staff.user),
-            joinedload(ShiftExchangeRequest.target_staff).joinedload(Staff.user),
-            joinedload(ShiftExchangeRequest.requester_shift).joinedload(Shift.client),
-            joinedload(ShiftExchangeRequest.target_shift).joinedload(Shift.client)
-        ).filter(
-            ShiftExchangeRequest.organization_id == org_id
-        )
+    org_id = current_user.organization_id
 
-        if status:
-            try:
-                status_enum = ShiftExchangeStatus(status.lower())
-                query = query.filter(ShiftExchangeRequest.status == status_enum)
-            except ValueError:
-                raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
+    query = db.query(ShiftExchangeRequest).options(*EXCHANGE_RESPONSE_LOAD_OPTIONS).filter(
+        ShiftExchangeRequest.organization_id == org_id
+    )
 
-        exchanges = query.order_by(ShiftExchangeRequest.requested_at.desc()).offset(offset).limit(limit).all()
+    if status:
+        status_enum = SHIFT_EXCHANGE_STATUSES.get(status.lower())
+        if status_enum is None:
+            raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
+        query = query.filter(ShiftExchangeRequest.status == status_enum)
 
-        return [_build_exchange_response(exchange, db) for exchange in exchanges]
+    exchanges = query.order_by(ShiftExchangeRequest.requested_at.desc()).offset(offset).limit(limit).all()
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        import traceback
-        print(f"ERROR in get_shift_exchange_requests: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve shift exchange requests: {str(e)}"
-        )
+    manager_names = _manager_names(db, exchanges)
+    return ORJSONResponse([
+        _build_exchange_response(exchange, manager_names).model_dump()
+        for exchange in exchanges
+    ])
 
 
-@router.get("/shift-exchange-requests/pending", response_model=List[ShiftExchangeRequestResponse])
-async def get_pending_shift_exchange_requests(
+@router.get("/shift-exchange-requests/pending", response_model=List[ShiftExchangeRequestResponse], response_class=ORJSONResponse)
+@handle_errors("retrieve pending shift exchange requests")
+def get_pending_shift_exchange_requests(
     limit: int = Query(50, le=100),
     offset: int = Query(0),
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
     """
     Get shift exchange requests pending manager approval.
     Convenience endpoint that filters to only show requests in PENDING_MANAGER status.
     """
-    try:
-        org_id = current_user.organization_id
-
-        query = db.query(ShiftExchangeRequest).options(
-            joinedload(ShiftExchangeRequest.requester_staff).joinedload(Staff.user),
-            joinedload(ShiftExchangeRequest.target_staff).joinedload(Staff.user),
-            joinedload(ShiftExchangeRequest.requester_shift).joinedload(Shift.client),
-            joinedload(ShiftExchangeRequest.target_shift).joinedload(Shift.client)
-        ).filter(
-            ShiftExchangeRequest.organization_id == org_id,
-            ShiftExchangeRequest.status == ShiftExchangeStatus.PENDING_MANAGER
-        )
+    org_id = current_user.organization_id
 
-        exchanges = query.order_by(ShiftExchangeRequest.requested_at.desc()).offset(offset).limit(limit).all()
+    query = db.query(ShiftExchangeRequest).options(*EXCHANGE_RESPONSE_LOAD_OPTIONS).filter(
+        ShiftExchangeRequest.organization_id == org_id,
+        ShiftExchangeRequest.status == ShiftExchangeStatus.PENDING_MANAGER
+    )
 
-        return [_build_exchange_response(exchange, db) for exchange in exchanges]
+    exchanges = query.order_by(ShiftExchangeRequest.requested_at.desc()).offset(offset).limit(limit).all()
 
-    except Exception as e:
-        import traceback
-        print(f"ERROR in get_pending_shift_exchange_requests: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve pending shift exchange requests: {str(e)}"
-        )
+    manager_names = _manager_names(db, exchanges)
+    return ORJSONResponse([
+        _build_exchange_response(exchange, manager_names).model_dump()
+        for exchange in exchanges
+    ])
 
 
 @router.get("/shift-exchange-requests/{exchange_id}", response_model=ShiftExchangeRequestResponse)
-async def get_shift_exchange_request(
+@handle_errors("retrieve shift exchange request")
+def get_shift_exchange_request(
     exchange_id: str,
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
     """
     Get a specific shift exchange request by ID
     """
-    try:
-        org_id = current_user.organization_id
-
-        exchange = db.query(ShiftExchangeRequest).options(
-            joinedload(ShiftExchangeRequest.requester_staff).joinedload(Staff.user),
-            joinedload(ShiftExchangeRequest.target_staff).joinedload(Staff.user),
-            joinedload(ShiftExchangeRequest.requester_shift).joinedload(Shift.client),
-            joinedload(ShiftExchangeRequest.target_shift).joinedload(Shift.client)
-        ).filter(
-            ShiftExchangeRequest.id == exchange_id,
-            ShiftExchangeRequest.organization_id == org_id
-        ).first()
+    org_id = current_user.organization_id
 
-        if not exchange:
-            raise HTTPException(status_code=404, detail="Shift exchange request not found")
+    exchange = db.query(ShiftExchangeRequest).options(*EXCHANGE_RESPONSE_LOAD_OPTIONS).filter(
+        ShiftExchangeRequest.id == exchange_id,
+        ShiftExchangeRequest.organization_id == org_id
+    ).first()
 
-        return _build_exchange_response(exchange, db)
+    if not exchange:
+        raise HTTPException(status_code=404, detail="Shift exchange request not found")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve shift exchange request: {str(e)}"
-        )
+    return _build_exchange_response(exchange, _manager_names(db, [exchange]))
+
+
+@lru_cache(maxsize=1024)
+def _email_date(value: date) -> str:
+    """Date as shown in notification emails, e.g. Mon, Jan 06, 2025"""
+    return value.strftime("%a, %b %d, %Y")
+
+
+@lru_cache(maxsize=256)
+def _email_time_range(start: time, end: time) -> str:
+    """Shift hours as shown in notification emails; shifts reuse a few patterns"""
+    return f"{start.strftime('%I:%M %p')} - {end.strftime('%I:%M %p')}"
+
+
+def _shift_email_details(shift: Shift) -> tuple:
+    """Date, time range and client name of a shift, formatted for exchange emails"""
+    shift_date = _email_date(shift.shift_date)
+    shift_time = _email_time_range(shift.start_time, shift.end_time)
+    client_name = None
+    if shift.client:
+        client_name = f"{shift.client.first_name} {shift.client.last_name}"
+    return shift_date, shift_time, client_name
 
 
 @router.post("/shift-exchange-requests/{exchange_id}/approve")
-async def approve_shift_exchange_request(
+@handle_errors("approve shift exchange request")
+def approve_shift_exchange_request(
     exchange_id: str,
     action: ShiftExchangeRequestManagerResponse,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
     """
     Approve a shift exchange request (Step 3 of 3-step workflow).
     Only requests in PENDING_MANAGER status can be approved.
     Upon approval, the shifts are swapped between the two staff members.
     """
-    try:
-        org_id = current_user.organization_id
-
-        exchange = db.query(ShiftExchangeRequest).options(
-            joinedload(ShiftExchangeRequest.requester_shift),
-            joinedload(ShiftExchangeRequest.target_shift)
-        ).filter(
-            ShiftExchangeRequest.id == exchange_id,
-            ShiftExchangeRequest.organization_id == org_id
-        ).first()
+    org_id = current_user.organization_id
 
-        if not exchange:
-            raise HTTPException(status_code=404, detail="Shift exchange request not found")
+    # Load everything the notification emails need up front; commit expires
+    # the instances, so nothing is read from them afterwards
+    exchange = db.query(ShiftExchangeRequest).options(
+        joinedload(ShiftExchangeRequest.requester_staff).joinedload(Staff.user),
+        joinedload(ShiftExchangeRequest.target_staff).joinedload(Staff.user),
+        joinedload(ShiftExchangeRequest.requester_shift).joinedload(Shift.client),
+        joinedload(ShiftExchangeRequest.target_shift).joinedload(Shift.client)
+    ).filter(
+        ShiftExchangeRequest.id == exchange_id,
+        ShiftExchangeRequest.organization_id == org_id
+    ).first()
+
+    if not exchange:
+        raise HTTPException(status_code=404, detail="Shift exchange request not found")
+
+    if exchange.status != ShiftExchangeStatus.PENDING_MANAGER:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot approve request in {exchange.status.value} status. Only requests in pending_manager status can be approved."
+        )
 
-        if exchange.status != ShiftExchangeStatus.PENDING_MANAGER:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Cannot approve request in {exchange.status.value} status. Only requests in pending_manager status can be approved."
-            )
+    requester_shift = exchange.requester_shift
+    target_shift = exchange.target_shift
+
+    # Update exchange status, guarded on it still being pending so a
+    # concurrent approval or cancellation can't apply the swap twice
+    approved = db.execute(
+        update(ShiftExchangeRequest)
+        .where(
+            ShiftExchangeRequest.id == exchange.id,
+            ShiftExchangeRequest.status == ShiftExchangeStatus.PENDING_MANAGER
+        )
+        .values(
+            status=ShiftExchangeStatus.APPROVED,
+            manager_responded_by=current_user.id,
+            manager_responded_at=datetime.utcnow(),
+            manager_response_notes=action.notes
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if approved.rowcount == 0:
+        db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail="Shift exchange request is no longer pending manager approval"
+        )
 
-        # Perform the shift swap
-        requester_shift = exchange.requester_shift
-        target_shift = exchange.target_shift
+    # Swap staff assignments in a single UPDATE
+    db.execute(
+        update(Shift)
+        .where(Shift.id.in_([requester_shift.id, target_shift.id]))
+        .values(staff_id=case(
+            {
+                requester_shift.id: target_shift.staff_id,
+                target_shift.id: requester_shift.staff_id
+            },
+            value=Shift.id
+        ))
+        .execution_options(synchronize_session=False)
+    )
 
-        # Swap staff assignments
-        temp_staff_id = requester_shift.staff_id
-        requester_shift.staff_id = target_shift.staff_id
-        target_shift.staff_id = temp_staff_id
+    # Email both staff members about their new shift
+    emails = []
+    try:
+        manager_name = f"{current_user.first_name} {current_user.last_name}"
+        requester_staff = exchange.requester_staff
+        target_staff_obj = exchange.target_staff
 
-        # Update exchange status
-        exchange.status = ShiftExchangeStatus.APPROVED
-        exchange.manager_responded_by = current_user.id
-        exchange.manager_responded_at = datetime.utcnow()
-        exchange.manager_response_notes = action.notes
+        # After swap: requester now has target's original shift
+        requester_new_shift_date, requester_new_shift_time, requester_new_client = _shift_email_details(target_shift)
 
-        db.commit()
+        # After swap: target now has requester's original shift
+        target_new_shift_date, target_new_shift_time, target_new_client = _shift_email_details(requester_shift)
 
-        # Send email notifications to both staff members
-        try:
-            # Reload exchange with all relationships
-            exchange = db.query(ShiftExchangeRequest).options(
-                joinedload(ShiftExchangeRequest.requester_staff).joinedload(Staff.user),
-                joinedload(ShiftExchangeRequest.target_staff).joinedload(Staff.user),
-                joinedload(ShiftExchangeRequest.requester_shift).joinedload(Shift.client),
-                joinedload(ShiftExchangeRequest.target_shift).joinedload(Shift.client)
-            ).filter(ShiftExchangeRequest.id == exchange_id).first()
-
-            manager_name = f"{current_user.first_name} {current_user.last_name}"
-            requester_staff = exchange.requester_staff
-            target_staff_obj = exchange.target_staff
-            requester_shift_obj = exchange.requester_shift
-            target_shift_obj = exchange.target_shift
-
-            # After swap: requester now has target's original shift
-            requester_new_shift_date = target_shift_obj.shift_date.strftime("%a, %b %d, %Y")
-            requester_new_shift_time = f"{target_shift_obj.start_time.strftime('%I:%M %p')} - {target_shift_obj.end_time.strftime('%I:%M %p')}"
-            requester_new_client = None
-            if target_shift_obj.client:
-                requester_new_client = f"{target_shift_obj.client.first_name} {target_shift_obj.client.last_name}"
-
-            # After swap: target now has requester's original shift
-            target_new_shift_date = requester_shift_obj.shift_date.strftime("%a, %b %d, %Y")
-            target_new_shift_time = f"{requester_shift_obj.start_time.strftime('%I:%M %p')} - {requester_shift_obj.end_time.strftime('%I:%M %p')}"
-            target_new_client = None
-            if requester_shift_obj.client:
-                target_new_client = f"{requester_shift_obj.client.first_name} {requester_shift_obj.client.last_name}"
-
-            # Email requester about their new shift
-            await EmailService.send_shift_exchange_approved_email(
+        emails = [
+            dict(
                 to_email=requester_staff.user.email,
                 recipient_name=requester_staff.full_name,
                 manager_name=manager_name,
@@ -2184,10 +2451,8 @@ async def approve_shift_exchange_request(
                 new_shift_time=requester_new_shift_time,
                 new_client=requester_new_client,
                 manager_notes=action.notes
-            )
-
-            # Email target about their new shift
-            await EmailService.send_shift_exchange_approved_email(
+            ),
+            dict(
                 to_email=target_staff_obj.user.email,
                 recipient_name=target_staff_obj.full_name,
                 manager_name=manager_name,
@@ -2196,101 +2461,84 @@ async def approve_shift_exchange_request(
                 new_client=target_new_client,
                 manager_notes=action.notes
             )
-
-        except Exception as email_error:
-            import logging
-            logging.error(f"Failed to send shift exchange approved emails: {str(email_error)}")
-            # Don't fail the request if email fails
-
-        return {
-            "message": "Shift exchange approved successfully",
-            "exchange_id": str(exchange.id),
-            "status": exchange.status.value,
-            "requester_shift_id": str(requester_shift.id),
-            "target_shift_id": str(target_shift.id)
-        }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        import traceback
-        print(f"ERROR in approve_shift_exchange_request: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to approve shift exchange request: {str(e)}"
+        ]
+    except Exception as email_error:
+        logger.error(f"Failed to queue shift exchange approved emails: {str(email_error)}")
+        # Don't fail the request if email fails
+
+    response = {
+        "message": "Shift exchange approved successfully",
+        "exchange_id": str(exchange.id),
+        "status": ShiftExchangeStatus.APPROVED.value,
+        "requester_shift_id": str(requester_shift.id),
+        "target_shift_id": str(target_shift.id)
+    }
+
+    db.commit()
+    invalidate_approval_counts(org_id)
+
+    if emails:
+        background_tasks.add_task(
+            EmailService.send_concurrently, EmailService.send_shift_exchange_approved_email, emails
         )
 
+    return response
+
 
 @router.post("/shift-exchange-requests/{exchange_id}/deny")
-async def deny_shift_exchange_request(
+@handle_errors("deny shift exchange request")
+def deny_shift_exchange_request(
     exchange_id: str,
     action: ShiftExchangeRequestManagerResponse,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_manager_or_above),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_org_scoped_db)
 ):
     """
     Deny a shift exchange request.
     Only requests in PENDING_MANAGER status can be denied by manager.
     """
-    try:
-        org_id = current_user.organization_id
-
-        exchange = db.query(ShiftExchangeRequest).filter(
-            ShiftExchangeRequest.id == exchange_id,
-            ShiftExchangeRequest.organization_id == org_id
-        ).first()
+    org_id = current_user.organization_id
 
-        if not exchange:
-            raise HTTPException(status_code=404, detail="Shift exchange request not found")
+    # Load everything the notification emails need up front; commit expires
+    # the instances, so nothing is read from them afterwards
+    exchange = db.query(ShiftExchangeRequest).options(
+        joinedload(ShiftExchangeRequest.requester_staff).joinedload(Staff.user),
+        joinedload(ShiftExchangeRequest.target_staff).joinedload(Staff.user),
+        joinedload(ShiftExchangeRequest.requester_shift).joinedload(Shift.client),
+        joinedload(ShiftExchangeRequest.target_shift).joinedload(Shift.client)
+    ).filter(
+        ShiftExchangeRequest.id == exchange_id,
+        ShiftExchangeRequest.organization_id == org_id
+    ).first()
+
+    if not exchange:
+        raise HTTPException(status_code=404, detail="Shift exchange request not found")
+
+    if exchange.status != ShiftExchangeStatus.PENDING_MANAGER:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot deny request in {exchange.status.value} status. Only requests in pending_manager status can be denied."
+        )
 
-        if exchange.status != ShiftExchangeStatus.PENDING_MANAGER:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Cannot deny request in {exchange.status.value} status. Only requests in pending_manager status can be denied."
-            )
+    # Update exchange status
+    exchange.status = ShiftExchangeStatus.DENIED
+    exchange.manager_responded_by = current_user.id
+    exchange.manager_responded_at = datetime.utcnow()
+    exchange.manager_response_notes = action.notes
 
-        # Update exchange status
-        exchange.status = ShiftExchangeStatus.DENIED
-        exchange.manager_responded_by = current_user.id
-        exchange.manager_responded_at = datetime.utcnow()
-        exchange.manager_response_notes = action.notes
+    # Email both staff members about the denial (their shifts stay the same)
+    emails = []
+    try:
+        manager_name = f"{current_user.first_name} {current_user.last_name}"
+        requester_staff = exchange.requester_staff
+        target_staff_obj = exchange.target_staff
 
-        db.commit()
+        requester_shift_date, requester_shift_time, requester_client = _shift_email_details(exchange.requester_shift)
+        target_shift_date, target_shift_time, target_client = _shift_email_details(exchange.target_shift)
 
-        # Send email notifications to both staff members
-        try:
-            # Reload exchange with all relationships
-            exchange = db.query(ShiftExchangeRequest).options(
-                joinedload(ShiftExchangeRequest.requester_staff).joinedload(Staff.user),
-                joinedload(ShiftExchangeRequest.target_staff).joinedload(Staff.user),
-                joinedload(ShiftExchangeRequest.requester_shift).joinedload(Shift.client),
-                joinedload(ShiftExchangeRequest.target_shift).joinedload(Shift.client)
-            ).filter(ShiftExchangeRequest.id == exchange_id).first()
-
-            manager_name = f"{current_user.first_name} {current_user.last_name}"
-            requester_staff = exchange.requester_staff
-            target_staff_obj = exchange.target_staff
-            requester_shift_obj = exchange.requester_shift
-            target_shift_obj = exchange.target_shift
-
-            # Format shift details for requester
-            requester_shift_date = requester_shift_obj.shift_date.strftime("%a, %b %d, %Y")
-            requester_shift_time = f"{requester_shift_obj.start_time.strftime('%I:%M %p')} - {requester_shift_obj.end_time.strftime('%I:%M %p')}"
-            requester_client = None
-            if requester_shift_obj.client:
-                requester_client = f"{requester_shift_obj.client.first_name} {requester_shift_obj.client.last_name}"
-
-            # Format shift details for target
-            target_shift_date = target_shift_obj.shift_date.strftime("%a, %b %d, %Y")
-            target_shift_time = f"{target_shift_obj.start_time.strftime('%I:%M %p')} - {target_shift_obj.end_time.strftime('%I:%M %p')}"
-            target_client = None
-            if target_shift_obj.client:
-                target_client = f"{target_shift_obj.client.first_name} {target_shift_obj.client.last_name}"
-
-            # Email requester about denial (their shift stays the same)
-            await EmailService.send_shift_exchange_denied_by_manager_email(
+        emails = [
+            dict(
                 to_email=requester_staff.user.email,
                 recipient_name=requester_staff.full_name,
                 manager_name=manager_name,
@@ -2298,10 +2546,8 @@ async def deny_shift_exchange_request(
                 your_shift_time=requester_shift_time,
                 your_client=requester_client,
                 manager_notes=action.notes
-            )
-
-            # Email target about denial (their shift stays the same)
-            await EmailService.send_shift_exchange_denied_by_manager_email(
+            ),
+            dict(
                 to_email=target_staff_obj.user.email,
                 recipient_name=target_staff_obj.full_name,
                 manager_name=manager_name,
@@ -2310,23 +2556,23 @@ async def deny_shift_exchange_request(
                 your_client=target_client,
                 manager_notes=action.notes
             )
-
-        except Exception as email_error:
-            import logging
-            logging.error(f"Failed to send shift exchange denied emails: {str(email_error)}")
-            # Don't fail the request if email fails
-
-        return {
-            "message": "Shift exchange denied",
-            "exchange_id": str(exchange.id),
-            "status": exchange.status.value
-        }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to deny shift exchange request: {str(e)}"
+        ]
+    except Exception as email_error:
+        logger.error(f"Failed to queue shift exchange denied emails: {str(email_error)}")
+        # Don't fail the request if email fails
+
+    response = {
+        "message": "Shift exchange denied",
+        "exchange_id": str(exchange.id),
+        "status": exchange.status.value
+    }
+
+    db.commit()
+    invalidate_approval_counts(org_id)
+
+    if emails:
+        background_tasks.add_task(
+            EmailService.send_concurrently, EmailService.send_shift_exchange_denied_by_manager_email, emails
         )
+
+    return response
@@ -2,13 +2,18 @@
 Notices API Endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session, contains_eager, raiseload
+from sqlalchemy import and_, case, cast, exists, func, literal, or_, select, union_all
+from sqlalchemy.dialects.postgresql import JSONB, insert
 from typing import List, Optional
-from datetime import datetime, timezone
+from uuid import UUID
 
+from app.core.cache import cache_get_json, cache_set_json, notice_targets_key
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.dependencies import get_current_user, get_manager_or_above
-from app.models.user import User, UserStatus
+from app.models.user import Role, User, UserStatus
 from app.models.notice import Notice, NoticeReadReceipt, NoticePriority, NoticeCategory, NoticeTargetType
 from app.models.staff import Staff, StaffAssignment
 from app.models.client import Client
@@ -29,181 +34,218 @@ from app.schemas.notice import (
 
 router = APIRouter()
 
+# Appended to list queries: in development, a relationship that wasn't
+# eagerly loaded raises instead of quietly issuing a query per row
+LIST_LOAD_OPTIONS = (raiseload("*", sql_only=True),) if settings.DEBUG else ()
 
-def _check_if_user_should_see_notice(notice: Notice, user: User, db: Session) -> bool:
-    """Check if user should see this notice based on targeting"""
 
-    # Check if notice is active and published
-    if not notice.is_active:
-        return False
+def _utc_now():
+    """The database clock as naive UTC, matching how notice timestamps are stored"""
+    return func.timezone("UTC", func.now())
 
-    now = datetime.now(timezone.utc).replace(tzinfo=None)
-    if notice.publish_date and notice.publish_date > now:
-        return False
 
-    if notice.expire_date and notice.expire_date < now:
-        return False
+def _parse_notice_id(notice_id: str) -> UUID:
+    """Notice ID path parameter as a UUID; a malformed ID is simply not found"""
+    try:
+        return UUID(notice_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Notice not found")
 
-    # Exclude clients from all notices
-    if user.role and user.role.name.lower() == "client":
-        return False
 
-    # Handle targeting based on target_type
-    target_type = notice.target_type
+def _is_client_user(user: User) -> bool:
+    """Clients are excluded from all notices"""
+    return bool(user.role and user.role.name.lower() == "client")
 
-    if target_type == NoticeTargetType.ALL_USERS:
-        return True  # All non-client users
 
-    elif target_type == NoticeTargetType.SPECIFIC_USERS:
-        if notice.target_users:
-            return str(user.id) in notice.target_users
-        return False
+def _not_client_role():
+    """
+    SQL counterpart of _is_client_user, for queries outer-joined to Role;
+    users without a role are not clients
+    """
+    return or_(Role.id.is_(None), func.lower(Role.name) != "client")
 
-    elif target_type == NoticeTargetType.CLIENT_ASSIGNMENT:
-        if notice.target_client_id:
-            # Get staff record for this user
-            staff = db.query(Staff).filter(
-                Staff.user_id == user.id,
-                Staff.organization_id == user.organization_id
-            ).first()
-
-            if not staff:
-                return False
-
-            # Check if staff is assigned to the target client
-            assignment = db.query(StaffAssignment).filter(
-                StaffAssignment.staff_id == staff.id,
-                StaffAssignment.client_id == notice.target_client_id,
-                StaffAssignment.is_active == True
-            ).first()
 
-            return assignment is not None
-        return False
+def _get_org_notice(db: Session, notice_id: str, user: User) -> Notice:
+    """
+    Notice by primary key within the user's organization, or 404. Goes
+    through the identity map, so a notice already loaded in this session
+    is not fetched again.
+    """
+    notice = db.get(Notice, _parse_notice_id(notice_id))
+    if not notice or notice.organization_id != user.organization_id:
+        raise HTTPException(status_code=404, detail="Notice not found")
+    return notice
+
+
+def _get_visible_notice(db: Session, notice_id: str, user: User) -> Notice:
+    """
+    Notice by ID for a reader, with the list's targeting rules evaluated in
+    the same query: 404 if it isn't in the user's organization, 403 if the
+    user isn't in its audience
+    """
+    row = db.query(Notice, and_(*_visible_notice_filter(user)).label("visible")).filter(
+        Notice.id == _parse_notice_id(notice_id),
+        Notice.organization_id == user.organization_id
+    ).first()
 
-    elif target_type == NoticeTargetType.LOCATION:
-        if notice.target_location_id:
-            # Get staff record for this user
-            staff = db.query(Staff).filter(
-                Staff.user_id == user.id,
-                Staff.organization_id == user.organization_id
-            ).first()
-
-            if not staff:
-                return False
-
-            # Check direct location assignment
-            direct_assignment = db.query(StaffAssignment).filter(
-                StaffAssignment.staff_id == staff.id,
-                StaffAssignment.location_id == notice.target_location_id,
-                StaffAssignment.is_active == True
-            ).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Notice not found")
+
+    notice, visible = row
+    if not visible or _is_client_user(user):
+        raise HTTPException(status_code=403, detail="You don't have access to this notice")
 
-            if direct_assignment:
-                return True
+    return notice
 
-            # Check via clients at location
-            clients_at_location = db.query(Client.id).filter(
-                Client.location_id == notice.target_location_id,
-                Client.organization_id == user.organization_id
-            ).all()
 
-            if clients_at_location:
-                client_ids = [c[0] for c in clients_at_location]
-                client_assignment = db.query(StaffAssignment).filter(
-                    StaffAssignment.staff_id == staff.id,
-                    StaffAssignment.client_id.in_(client_ids),
-                    StaffAssignment.is_active == True
-                ).first()
-                return client_assignment is not None
-        return False
+def _assignment_targeting(user: User) -> tuple:
+    """
+    EXISTS clauses, correlated to Notice, for whether the user's active staff
+    assignments cover the notice's target client and its target location
+    (directly, or through a client at that location)
+    """
+    user_staff_ids = select(Staff.id).where(
+        Staff.user_id == user.id,
+        Staff.organization_id == user.organization_id
+    )
+    assigned_to_target_client = exists().where(
+        StaffAssignment.staff_id.in_(user_staff_ids),
+        StaffAssignment.client_id == Notice.target_client_id,
+        StaffAssignment.is_active == True
+    )
+    assigned_at_target_location = exists().where(
+        StaffAssignment.staff_id.in_(user_staff_ids),
+        StaffAssignment.is_active == True,
+        or_(
+            StaffAssignment.location_id == Notice.target_location_id,
+            StaffAssignment.client_id.in_(
+                select(Client.id).where(
+                    Client.location_id == Notice.target_location_id,
+                    Client.organization_id == user.organization_id
+                ).correlate(Notice)
+            )
+        )
+    )
+    return assigned_to_target_client, assigned_at_target_location
+
+
+def _visible_notice_filter(user: User) -> list:
+    """
+    Filters for the notices a user may see: active, published, unexpired and
+    targeted at them. Callers handle client users, who see no notices.
+    """
+    now = _utc_now()
+    assigned_to_target_client, assigned_at_target_location = _assignment_targeting(user)
+
+    return [
+        Notice.organization_id == user.organization_id,
+        Notice.is_active == True,
+        or_(Notice.publish_date.is_(None), Notice.publish_date <= now),
+        or_(Notice.expire_date.is_(None), Notice.expire_date >= now),
+        or_(
+            Notice.target_type == NoticeTargetType.ALL_USERS,
+            and_(
+                Notice.target_type == NoticeTargetType.SPECIFIC_USERS,
+                cast(Notice.target_users, JSONB).contains([str(user.id)])
+            ),
+            and_(
+                Notice.target_type == NoticeTargetType.CLIENT_ASSIGNMENT,
+                assigned_to_target_client
+            ),
+            and_(
+                Notice.target_type == NoticeTargetType.LOCATION,
+                assigned_at_target_location
+            )
+        )
+    ]
 
-    # Legacy support for target_roles (if target_type is not set properly)
-    if notice.target_roles:
-        return str(user.role_id) in notice.target_roles
 
-    return True
+NOTICE_TARGETS_CACHE_TTL = 300  # seconds; edits change the key, assignment changes wait out the TTL
 
 
 def _get_targeted_user_ids(notice: Notice, db: Session) -> List[str]:
+    """Get list of all user IDs targeted by a notice, cached per notice revision"""
+    if notice.target_type == NoticeTargetType.SPECIFIC_USERS:
+        return list(notice.target_user_ids)
+
+    cache_key = notice_targets_key(notice.id, notice.updated_at)
+    cached = cache_get_json(cache_key)
+    if cached is not None:
+        return cached
+
+    user_ids = _query_targeted_user_ids(notice, db)
+    cache_set_json(cache_key, user_ids, NOTICE_TARGETS_CACHE_TTL)
+    return user_ids
+
+
+def _query_targeted_user_ids(notice: Notice, db: Session) -> List[str]:
     """Get list of all user IDs targeted by a notice"""
     org_id = notice.organization_id
     target_type = notice.target_type
 
     if target_type == NoticeTargetType.ALL_USERS:
         # All active users in organization excluding clients
-        users = db.query(User).filter(
+        rows = db.query(User.id).outerjoin(Role, Role.id == User.role_id).filter(
             User.organization_id == org_id,
-            User.status == UserStatus.ACTIVE
+            User.status == UserStatus.ACTIVE,
+            _not_client_role()
         ).all()
-        # Filter out clients
-        return [str(u.id) for u in users if not (u.role and u.role.name.lower() == "client")]
+        return [str(user_id) for (user_id,) in rows]
 
     elif target_type == NoticeTargetType.SPECIFIC_USERS:
-        return notice.target_users or []
+        return list(notice.target_user_ids)
 
     elif target_type == NoticeTargetType.CLIENT_ASSIGNMENT:
         if notice.target_client_id:
-            # Get staff assigned to this client
-            assignments = db.query(StaffAssignment).filter(
+            # Users of the staff actively assigned to this client
+            rows = db.query(Staff.user_id).join(
+                StaffAssignment, StaffAssignment.staff_id == Staff.id
+            ).filter(
                 StaffAssignment.client_id == notice.target_client_id,
                 StaffAssignment.is_active == True
-            ).all()
-
-            # Get user IDs from staff records
-            staff_ids = [a.staff_id for a in assignments]
-            if staff_ids:
-                staff_records = db.query(Staff).filter(Staff.id.in_(staff_ids)).all()
-                return [str(s.user_id) for s in staff_records]
+            ).distinct().all()
+            return [str(user_id) for (user_id,) in rows]
         return []
 
     elif target_type == NoticeTargetType.LOCATION:
         if notice.target_location_id:
-            user_ids = set()
-
-            # Get staff directly assigned to location
-            direct_assignments = db.query(StaffAssignment).filter(
-                StaffAssignment.location_id == notice.target_location_id,
-                StaffAssignment.is_active == True
-            ).all()
-
-            for a in direct_assignments:
-                staff = db.query(Staff).filter(Staff.id == a.staff_id).first()
-                if staff:
-                    user_ids.add(str(staff.user_id))
-
-            # Get staff assigned to clients at location
-            clients_at_location = db.query(Client.id).filter(
-                Client.location_id == notice.target_location_id,
-                Client.organization_id == org_id
-            ).all()
-
-            if clients_at_location:
-                client_ids = [c[0] for c in clients_at_location]
-                client_assignments = db.query(StaffAssignment).filter(
-                    StaffAssignment.client_id.in_(client_ids),
-                    StaffAssignment.is_active == True
-                ).all()
+            # Users of the staff assigned to the location directly or to a
+            # client at the location
+            rows = db.query(Staff.user_id).join(
+                StaffAssignment, StaffAssignment.staff_id == Staff.id
+            ).filter(
+                StaffAssignment.is_active == True,
+                or_(
+                    StaffAssignment.location_id == notice.target_location_id,
+                    StaffAssignment.client_id.in_(
+                        select(Client.id).where(
+                            Client.location_id == notice.target_location_id,
+                            Client.organization_id == org_id
+                        )
+                    )
+                )
+            ).distinct().all()
+            return [str(user_id) for (user_id,) in rows]
 
-                for a in client_assignments:
-                    staff = db.query(Staff).filter(Staff.id == a.staff_id).first()
-                    if staff:
-                        user_ids.add(str(staff.user_id))
+    return []
 
-            return list(user_ids)
 
-    return []
+def _creator_names(db: Session, notices: List[Notice]) -> dict:
+    """Names of the users who created any of the notices, in one query"""
+    creator_ids = {notice.created_by for notice in notices if notice.created_by}
+    if not creator_ids:
+        return {}
+    return dict(db.execute(
+        select(User.id, User.full_name).where(User.id.in_(creator_ids))
+    ).all())
 
 
-def _build_notice_response(notice: Notice, read_notice_ids: set, acknowledged_notice_ids: set, db: Session = None) -> NoticeResponse:
+def _build_notice_response(notice: Notice, read_notice_ids: set, acknowledged_notice_ids: set, creator_names: dict) -> NoticeResponse:
     """Helper to build NoticeResponse from Notice model"""
-    # Get creator name if db is provided
-    created_by_name = None
-    if db and notice.created_by:
-        creator = db.query(User).filter(User.id == notice.created_by).first()
-        if creator:
-            created_by_name = f"{creator.first_name} {creator.last_name}"
-
-    return NoticeResponse(
+    created_by_name = creator_names.get(notice.created_by)
+
+    # Every field comes straight off typed columns, so skip re-validation
+    return NoticeResponse.model_construct(
         id=str(notice.id),
         organization_id=str(notice.organization_id),
         title=notice.title,
@@ -232,7 +274,7 @@ def _build_notice_response(notice: Notice, read_notice_ids: set, acknowledged_no
 
 # ============== List & Read Endpoints ==============
 
-@router.get("", response_model=NoticesList)
+@router.get("", response_model=NoticesList, response_class=ORJSONResponse)
 def get_notices(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
@@ -244,71 +286,90 @@ def get_notices(
 ):
     """Get notices for current user (filtered by targeting rules)"""
 
-    # Get all notices for user's organization
-    query = db.query(Notice).filter(
-        Notice.organization_id == current_user.organization_id,
-        Notice.is_active == True
-    )
+    # Clients are excluded from all notices
+    if _is_client_user(current_user):
+        return ORJSONResponse({
+            "notices": [],
+            "total": 0,
+            "page": page,
+            "page_size": page_size,
+            "unread_count": 0
+        })
+
+    filters = _visible_notice_filter(current_user)
 
     # Filter by priority
     if priority:
-        query = query.filter(Notice.priority == priority)
+        filters.append(Notice.priority == priority)
 
     # Filter by category
     if category:
-        query = query.filter(Notice.category == category)
-
-    # Get all notices (we'll filter by targeting in Python)
-    all_notices = query.order_by(Notice.created_at.desc()).all()
-
-    # Filter notices based on targeting rules
-    filtered_notices = [
-        notice for notice in all_notices
-        if _check_if_user_should_see_notice(notice, current_user, db)
-    ]
-
-    # Get user's read receipts
-    read_notice_ids = db.query(NoticeReadReceipt.notice_id).filter(
-        NoticeReadReceipt.user_id == str(current_user.id)
-    ).all()
-    read_notice_ids = {str(nid[0]) for nid in read_notice_ids}
+        filters.append(Notice.category == category)
 
-    # Get user's acknowledged notices
-    acknowledged_notice_ids = db.query(NoticeReadReceipt.notice_id).filter(
-        NoticeReadReceipt.user_id == str(current_user.id),
-        NoticeReadReceipt.acknowledged_at.isnot(None)
-    ).all()
-    acknowledged_notice_ids = {str(nid[0]) for nid in acknowledged_notice_ids}
+    # Correlated to Notice only, as the page query also joins the receipts
+    is_read = exists().where(
+        NoticeReadReceipt.notice_id == Notice.id,
+        NoticeReadReceipt.user_id == current_user.id
+    ).correlate(Notice)
 
     # Filter for unread only if requested
     if unread_only:
-        filtered_notices = [
-            notice for notice in filtered_notices
-            if str(notice.id) not in read_notice_ids
-        ]
-
-    # Count unread
-    unread_count = sum(1 for notice in filtered_notices if str(notice.id) not in read_notice_ids)
-
-    # Pagination
-    total = len(filtered_notices)
-    start = (page - 1) * page_size
-    end = start + page_size
-    paginated_notices = filtered_notices[start:end]
+        filters.append(~is_read)
+
+    created_by_name = select(User.full_name).where(
+        User.id == Notice.created_by
+    ).correlate(Notice).scalar_subquery()
+
+    # Pagination, with the user's read and acknowledged flags and the
+    # creator's name on each row. A user has at most one receipt per notice,
+    # so both flags come from a single outer join to it.
+    page_rows = db.query(
+        Notice,
+        NoticeReadReceipt.id.isnot(None).label("read"),
+        NoticeReadReceipt.acknowledged_at.isnot(None).label("acknowledged"),
+        created_by_name.label("created_by_name")
+    ).outerjoin(
+        NoticeReadReceipt,
+        and_(
+            NoticeReadReceipt.notice_id == Notice.id,
+            NoticeReadReceipt.user_id == current_user.id
+        )
+    ).options(*LIST_LOAD_OPTIONS).filter(*filters).order_by(
+        Notice.created_at.desc()
+    ).offset((page - 1) * page_size).limit(page_size).all()
+
+    # A first page that isn't full already holds the whole filtered set, so
+    # its totals come from the rows; otherwise count in one aggregate
+    if page == 1 and len(page_rows) < page_size:
+        total = len(page_rows)
+        unread_count = sum(1 for row in page_rows if not row.read)
+    else:
+        total, unread_count = db.execute(
+            select(
+                func.count(),
+                func.count().filter(~is_read)
+            ).select_from(Notice).where(*filters)
+        ).one()
+
+    paginated_notices = [row.Notice for row in page_rows]
+    read_notice_ids = {str(row.Notice.id) for row in page_rows if row.read}
+    acknowledged_notice_ids = {str(row.Notice.id) for row in page_rows if row.acknowledged}
+
+    creator_names = {row.Notice.created_by: row.created_by_name for row in page_rows}
 
     # Build response
     notices_response = [
-        _build_notice_response(notice, read_notice_ids, acknowledged_notice_ids, db)
+        _build_notice_response(notice, read_notice_ids, acknowledged_notice_ids, creator_names)
         for notice in paginated_notices
     ]
 
-    return NoticesList(
-        notices=notices_response,
-        total=total,
-        page=page,
-        page_size=page_size,
-        unread_count=unread_count
-    )
+    return ORJSONResponse({
+        "notices": [notice.model_dump() for notice in notices_response],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "unread_count": unread_count
+    })
 
 
 @router.get("/{notice_id}", response_model=NoticeResponse)
@@ -319,16 +380,7 @@ def get_notice_by_id(
 ):
     """Get a specific notice by ID"""
 
-    notice = db.query(Notice).filter(
-        Notice.id == notice_id,
-        Notice.organization_id == current_user.organization_id
-    ).first()
-
-    if not notice:
-        raise HTTPException(status_code=404, detail="Notice not found")
-
-    if not _check_if_user_should_see_notice(notice, current_user, db):
-        raise HTTPException(status_code=403, detail="You don't have access to this notice")
+    notice = _get_visible_notice(db, notice_id, current_user)
 
     # Check if user has read this notice
     read_receipt = db.query(NoticeReadReceipt).filter(
@@ -336,20 +388,24 @@ def get_notice_by_id(
         NoticeReadReceipt.user_id == str(current_user.id)
     ).first()
 
-    read_notice_ids = {str(notice_id)} if read_receipt else set()
-    acknowledged_notice_ids = {str(notice_id)} if read_receipt and read_receipt.acknowledged_at else set()
+    acknowledged_notice_ids = {str(notice.id)} if read_receipt and read_receipt.acknowledged_at else set()
+
+    # Opening a notice marks it as read; build the response before the
+    # commit expires the notice so it isn't loaded a second time
+    response = _build_notice_response(
+        notice, {str(notice.id)}, acknowledged_notice_ids, _creator_names(db, [notice])
+    )
 
-    # Automatically mark as read if not already
     if not read_receipt:
-        receipt = NoticeReadReceipt(
-            notice_id=notice_id,
-            user_id=str(current_user.id)
+        # A concurrent open of the same notice may have just inserted it
+        db.execute(
+            insert(NoticeReadReceipt)
+            .values(notice_id=notice.id, user_id=current_user.id)
+            .on_conflict_do_nothing(index_elements=["notice_id", "user_id"])
         )
-        db.add(receipt)
         db.commit()
-        read_notice_ids = {str(notice_id)}
 
-    return _build_notice_response(notice, read_notice_ids, acknowledged_notice_ids, db)
+    return response
 
 
 # ============== Create, Update, Delete Endpoints (Manager+ Only) ==============
@@ -420,7 +476,7 @@ def create_notice(
     db.commit()
     db.refresh(notice)
 
-    return _build_notice_response(notice, set(), set(), db)
+    return _build_notice_response(notice, set(), set(), {current_user.id: current_user.full_name})
 
 
 @router.put("/{notice_id}", response_model=NoticeResponse)
@@ -432,13 +488,7 @@ def update_notice(
 ):
     """Update a notice (Managers and Admins only)"""
 
-    notice = db.query(Notice).filter(
-        Notice.id == notice_id,
-        Notice.organization_id == current_user.organization_id
-    ).first()
-
-    if not notice:
-        raise HTTPException(status_code=404, detail="Notice not found")
+    notice = _get_org_notice(db, notice_id, current_user)
 
     # Update fields if provided
     update_data = notice_data.model_dump(exclude_unset=True)
@@ -474,7 +524,7 @@ def update_notice(
     db.commit()
     db.refresh(notice)
 
-    return _build_notice_response(notice, set(), set(), db)
+    return _build_notice_response(notice, set(), set(), _creator_names(db, [notice]))
 
 
 @router.delete("/{notice_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -485,13 +535,7 @@ def delete_notice(
 ):
     """Delete (deactivate) a notice (Managers and Admins only)"""
 
-    notice = db.query(Notice).filter(
-        Notice.id == notice_id,
-        Notice.organization_id == current_user.organization_id
-    ).first()
-
-    if not notice:
-        raise HTTPException(status_code=404, detail="Notice not found")
+    notice = _get_org_notice(db, notice_id, current_user)
 
     # Soft delete by setting is_active to False
     notice.is_active = False
@@ -510,35 +554,27 @@ def mark_notice_as_read(
 ):
     """Mark a notice as read"""
 
-    notice = db.query(Notice).filter(
-        Notice.id == notice_id,
-        Notice.organization_id == current_user.organization_id
-    ).first()
-
-    if not notice:
-        raise HTTPException(status_code=404, detail="Notice not found")
-
-    if not _check_if_user_should_see_notice(notice, current_user, db):
-        raise HTTPException(status_code=403, detail="You don't have access to this notice")
-
-    # Check if already read
-    existing_receipt = db.query(NoticeReadReceipt).filter(
-        NoticeReadReceipt.notice_id == notice_id,
-        NoticeReadReceipt.user_id == str(current_user.id)
-    ).first()
-
-    if existing_receipt:
-        return {"message": "Notice already marked as read"}
+    if not _is_client_user(current_user):
+        # Insert the receipt only if the notice is visible to the user and
+        # not yet read: visibility check, duplicate check and write in one
+        # statement
+        inserted = db.execute(
+            insert(NoticeReadReceipt).from_select(
+                ["notice_id", "user_id"],
+                select(Notice.id, literal(current_user.id, User.id.type)).where(
+                    Notice.id == _parse_notice_id(notice_id),
+                    *_visible_notice_filter(current_user)
+                )
+            ).on_conflict_do_nothing(index_elements=["notice_id", "user_id"])
+        )
+        if inserted.rowcount:
+            db.commit()
+            return {"message": "Notice marked as read"}
 
-    # Create read receipt
-    receipt = NoticeReadReceipt(
-        notice_id=notice_id,
-        user_id=str(current_user.id)
-    )
-    db.add(receipt)
-    db.commit()
+    # Nothing inserted: the lookup raises 404/403 unless it was already read
+    _get_visible_notice(db, notice_id, current_user)
 
-    return {"message": "Notice marked as read"}
+    return {"message": "Notice already marked as read"}
 
 
 @router.post("/{notice_id}/acknowledge", response_model=dict)
@@ -549,32 +585,18 @@ def acknowledge_notice(
 ):
     """Acknowledge a notice"""
 
-    notice = db.query(Notice).filter(
-        Notice.id == notice_id,
-        Notice.organization_id == current_user.organization_id
-    ).first()
-
-    if not notice:
-        raise HTTPException(status_code=404, detail="Notice not found")
-
-    if not _check_if_user_should_see_notice(notice, current_user, db):
-        raise HTTPException(status_code=403, detail="You don't have access to this notice")
-
-    # Get or create read receipt
-    receipt = db.query(NoticeReadReceipt).filter(
-        NoticeReadReceipt.notice_id == notice_id,
-        NoticeReadReceipt.user_id == str(current_user.id)
-    ).first()
+    notice = _get_visible_notice(db, notice_id, current_user)
 
-    if not receipt:
-        receipt = NoticeReadReceipt(
-            notice_id=notice_id,
-            user_id=str(current_user.id)
+    # Create the read receipt or update the existing one, acknowledged now
+    acknowledged_at = _utc_now()
+    db.execute(
+        insert(NoticeReadReceipt)
+        .values(notice_id=notice.id, user_id=current_user.id, acknowledged_at=acknowledged_at)
+        .on_conflict_do_update(
+            index_elements=["notice_id", "user_id"],
+            set_={"acknowledged_at": acknowledged_at}
         )
-        db.add(receipt)
-
-    # Mark as acknowledged
-    receipt.acknowledged_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    )
     db.commit()
 
     return {"message": "Notice acknowledged"}
@@ -590,26 +612,23 @@ def get_notice_statistics(
 ):
     """Get notice statistics (Managers and Admins only)"""
 
-    notice = db.query(Notice).filter(
-        Notice.id == notice_id,
-        Notice.organization_id == current_user.organization_id
-    ).first()
-
-    if not notice:
-        raise HTTPException(status_code=404, detail="Notice not found")
+    notice = _get_org_notice(db, notice_id, current_user)
 
     # Get targeted user IDs
     targeted_user_ids = _get_targeted_user_ids(notice, db)
     total_recipients = len(targeted_user_ids)
 
-    # Get read receipts for this notice
-    read_receipts = db.query(NoticeReadReceipt).filter(
-        NoticeReadReceipt.notice_id == notice_id,
-        NoticeReadReceipt.user_id.in_(targeted_user_ids) if targeted_user_ids else False
-    ).all()
-
-    read_count = len(read_receipts)
-    acknowledged_count = sum(1 for r in read_receipts if r.acknowledged_at is not None)
+    # Count this notice's receipts from targeted users; COUNT of a column
+    # skips NULLs, so the second count is the acknowledged ones
+    read_count, acknowledged_count = db.execute(
+        select(
+            func.count(NoticeReadReceipt.id),
+            func.count(NoticeReadReceipt.acknowledged_at)
+        ).where(
+            NoticeReadReceipt.notice_id == notice.id,
+            NoticeReadReceipt.user_id.in_(targeted_user_ids)
+        )
+    ).one() if targeted_user_ids else (0, 0)
     unread_count = total_recipients - read_count
     pending_acknowledgment_count = read_count - acknowledged_count if notice.requires_acknowledgment else 0
 
@@ -628,7 +647,10 @@ def get_notice_statistics(
     )
 
 
-@router.get("/{notice_id}/acknowledgments", response_model=List[NoticeAcknowledgmentDetail])
+ACKNOWLEDGMENT_STATUSES = ("pending", "read", "acknowledged")  # indexed by the query's status rank
+
+
+@router.get("/{notice_id}/acknowledgments", response_model=List[NoticeAcknowledgmentDetail], response_class=ORJSONResponse)
 def get_notice_acknowledgments(
     notice_id: str,
     current_user: User = Depends(get_manager_or_above),
@@ -636,53 +658,56 @@ def get_notice_acknowledgments(
 ):
     """Get detailed acknowledgment tracking (Managers and Admins only)"""
 
-    notice = db.query(Notice).filter(
-        Notice.id == notice_id,
-        Notice.organization_id == current_user.organization_id
-    ).first()
-
-    if not notice:
-        raise HTTPException(status_code=404, detail="Notice not found")
+    notice = _get_org_notice(db, notice_id, current_user)
 
     # Get targeted user IDs
     targeted_user_ids = _get_targeted_user_ids(notice, db)
+    if not targeted_user_ids:
+        return ORJSONResponse([])
+
+    # Status ordering: pending first, then read, then acknowledged
+    status_rank = case(
+        (NoticeReadReceipt.id.is_(None), 0),
+        (NoticeReadReceipt.acknowledged_at.is_(None), 1),
+        else_=2
+    )
 
-    # Get all targeted users with their read receipts
-    acknowledgments = []
-
-    for user_id in targeted_user_ids:
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            continue
-
-        receipt = db.query(NoticeReadReceipt).filter(
-            NoticeReadReceipt.notice_id == notice_id,
-            NoticeReadReceipt.user_id == user_id
-        ).first()
-
-        # Determine status
-        if receipt and receipt.acknowledged_at:
-            status = "acknowledged"
-        elif receipt:
-            status = "read"
-        else:
-            status = "pending"
-
-        acknowledgments.append(NoticeAcknowledgmentDetail(
-            user_id=str(user.id),
-            user_name=f"{user.first_name} {user.last_name}",
-            user_email=user.email,
-            role_name=user.role.name if user.role else None,
-            read_at=receipt.read_at if receipt else None,
-            acknowledged_at=receipt.acknowledged_at if receipt else None,
-            status=status
-        ))
-
-    # Sort by status (pending first, then read, then acknowledged)
-    status_order = {"pending": 0, "read": 1, "acknowledged": 2}
-    acknowledgments.sort(key=lambda x: status_order.get(x.status, 3))
+    # Targeted users with their role and this notice's receipt, projected
+    # as plain rows so no ORM objects are built for the audience
+    rows = db.execute(
+        select(
+            User.id,
+            User.full_name,
+            User.email,
+            Role.name.label("role_name"),
+            NoticeReadReceipt.read_at,
+            NoticeReadReceipt.acknowledged_at,
+            status_rank.label("status_rank")
+        ).outerjoin(
+            Role, Role.id == User.role_id
+        ).outerjoin(
+            NoticeReadReceipt,
+            and_(
+                NoticeReadReceipt.notice_id == notice.id,
+                NoticeReadReceipt.user_id == User.id
+            )
+        ).where(
+            User.id.in_(targeted_user_ids)
+        ).order_by(status_rank)
+    ).all()
 
-    return acknowledgments
+    return ORJSONResponse([
+        {
+            "user_id": str(row.id),
+            "user_name": row.full_name,
+            "user_email": row.email,
+            "role_name": row.role_name,
+            "read_at": row.read_at,
+            "acknowledged_at": row.acknowledged_at,
+            "status": ACKNOWLEDGMENT_STATUSES[row.status_rank]
+        }
+        for row in rows
+    ])
 
 
 # ============== Targeting Helper Endpoints (Manager+ Only) ==============
@@ -695,22 +720,24 @@ def get_targetable_users(
 ):
     """Get list of users that can be targeted (excluding clients)"""
 
-    query = db.query(User).filter(
+    query = db.query(User).outerjoin(Role, Role.id == User.role_id).options(
+        contains_eager(User.role), *LIST_LOAD_OPTIONS
+    ).filter(
         User.organization_id == current_user.organization_id,
-        User.status == UserStatus.ACTIVE
+        User.status == UserStatus.ACTIVE,
+        _not_client_role()
     )
 
     if search:
         search_term = f"%{search}%"
         query = query.filter(
-            (User.first_name.ilike(search_term)) |
-            (User.last_name.ilike(search_term)) |
-            (User.email.ilike(search_term))
+            # full_name matches ix_users_full_name_trgm; email has its own trigram index
+            User.full_name.ilike(search_term) |
+            User.email.ilike(search_term)
         )
 
     users = query.all()
 
-    # Filter out clients
     return [
         TargetableUser(
             id=str(u.id),
@@ -719,7 +746,6 @@ def get_targetable_users(
             role_name=u.role.name if u.role else None
         )
         for u in users
-        if not (u.role and u.role.name.lower() == "client")
     ]
 
 
@@ -731,7 +757,7 @@ def get_targetable_clients(
 ):
     """Get list of clients for targeting staff assignments"""
 
-    query = db.query(Client).filter(
+    query = db.query(Client).options(*LIST_LOAD_OPTIONS).filter(
         Client.organization_id == current_user.organization_id,
         Client.status == "active"
     )
@@ -739,9 +765,8 @@ def get_targetable_clients(
     if search:
         search_term = f"%{search}%"
         query = query.filter(
-            (Client.first_name.ilike(search_term)) |
-            (Client.last_name.ilike(search_term)) |
-            (Client.client_id.ilike(search_term))
+            Client.full_name.ilike(search_term) |
+            Client.client_id.ilike(search_term)
         )
 
     clients = query.all()
@@ -763,57 +788,57 @@ def get_recent_notice_activity(
     db: Session = Depends(get_db)
 ):
     """Get recent notice activity (reads, acknowledgments, creations)"""
-    from sqlalchemy import desc, union_all, literal
-
-    activities = []
-
-    # Get recently created notices
-    recent_notices = db.query(Notice).filter(
-        Notice.organization_id == current_user.organization_id,
+    org_id = current_user.organization_id
+
+    # The five latest creations and five latest acknowledgments, merged and
+    # ordered in one statement
+    recent_created = select(
+        literal("created").label("type"),
+        Notice.id.label("notice_id"),
+        Notice.title,
+        Notice.priority,
+        func.coalesce(User.full_name, "Unknown").label("user_name"),
+        Notice.created_at.label("timestamp")
+    ).outerjoin(
+        User, User.id == Notice.created_by
+    ).where(
+        Notice.organization_id == org_id,
         Notice.is_active == True
-    ).order_by(desc(Notice.created_at)).limit(5).all()
-
-    for notice in recent_notices:
-        creator = db.query(User).filter(User.id == notice.created_by).first()
-        creator_name = f"{creator.first_name} {creator.last_name}" if creator else "Unknown"
-
-        activities.append({
-            "type": "created",
-            "notice_id": str(notice.id),
-            "notice_title": notice.title,
-            "user_name": creator_name,
-            "priority": notice.priority.value if notice.priority else "medium",
-            "timestamp": notice.created_at.isoformat(),
-            "message": f"created notice"
-        })
-
-    # Get recent read receipts
-    recent_reads = db.query(NoticeReadReceipt).join(
+    ).order_by(Notice.created_at.desc()).limit(5)
+
+    recent_acknowledged = select(
+        literal("acknowledged").label("type"),
+        Notice.id.label("notice_id"),
+        Notice.title,
+        Notice.priority,
+        User.full_name.label("user_name"),
+        NoticeReadReceipt.acknowledged_at.label("timestamp")
+    ).select_from(NoticeReadReceipt).join(
         Notice, Notice.id == NoticeReadReceipt.notice_id
-    ).filter(
-        Notice.organization_id == current_user.organization_id,
+    ).join(
+        User, User.id == NoticeReadReceipt.user_id
+    ).where(
+        Notice.organization_id == org_id,
         NoticeReadReceipt.acknowledged_at.isnot(None)
-    ).order_by(desc(NoticeReadReceipt.acknowledged_at)).limit(5).all()
-
-    for receipt in recent_reads:
-        notice = db.query(Notice).filter(Notice.id == receipt.notice_id).first()
-        user = db.query(User).filter(User.id == receipt.user_id).first()
+    ).order_by(NoticeReadReceipt.acknowledged_at.desc()).limit(5)
 
-        if notice and user:
-            activities.append({
-                "type": "acknowledged",
-                "notice_id": str(notice.id),
-                "notice_title": notice.title,
-                "user_name": f"{user.first_name} {user.last_name}",
-                "priority": notice.priority.value if notice.priority else "medium",
-                "timestamp": receipt.acknowledged_at.isoformat() if receipt.acknowledged_at else receipt.read_at.isoformat(),
-                "message": f"acknowledged notice"
-            })
-
-    # Sort all activities by timestamp descending
-    activities.sort(key=lambda x: x["timestamp"], reverse=True)
+    activity = union_all(recent_created, recent_acknowledged).subquery()
+    rows = db.execute(
+        select(activity).order_by(activity.c.timestamp.desc()).limit(limit)
+    ).all()
 
-    return activities[:limit]
+    return [
+        {
+            "type": row.type,
+            "notice_id": str(row.notice_id),
+            "notice_title": row.title,
+            "user_name": row.user_name,
+            "priority": row.priority.value if row.priority else "medium",
+            "timestamp": row.timestamp.isoformat(),
+            "message": f"{row.type} notice"
+        }
+        for row in rows
+    ]
 
 
 @router.get("/targeting/locations", response_model=List[TargetableLocation])
@@ -824,7 +849,7 @@ def get_targetable_locations(
 ):
     """Get list of locations for targeting"""
 
-    query = db.query(Location).filter(
+    query = db.query(Location).options(*LIST_LOAD_OPTIONS).filter(
         Location.organization_id == current_user.organization_id,
         Location.is_active == True
     )
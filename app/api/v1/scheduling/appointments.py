@@ -27,7 +27,7 @@ router = APIRouter()
 # Regular Appointments
 
 @router.post("/", response_model=AppointmentResponse)
-async def create_appointment(
+def create_appointment(
     appointment_data: AppointmentCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_permission("appointments", "create"))
@@ -117,7 +117,7 @@ async def create_appointment(
         )
 
 @router.get("/")
-async def get_appointments(
+def get_appointments(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     client_id: Optional[UUID] = None,
@@ -210,7 +210,7 @@ async def get_appointments(
     )
 
 @router.get("/{appointment_id}", response_model=AppointmentResponse)
-async def get_appointment(
+def get_appointment(
     appointment_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_permission("appointments", "read"))
@@ -231,7 +231,7 @@ async def get_appointment(
     return AppointmentResponse.model_validate(appointment)
 
 @router.put("/{appointment_id}", response_model=AppointmentResponse)
-async def update_appointment(
+def update_appointment(
     appointment_id: UUID,
     appointment_update: AppointmentUpdate,
     db: Session = Depends(get_db),
@@ -304,7 +304,7 @@ async def update_appointment(
         )
 
 @router.delete("/{appointment_id}", response_model=MessageResponse)
-async def cancel_appointment(
+def cancel_appointment(
     appointment_id: UUID,
     reason: Optional[str] = Query(None, description="Cancellation reason"),
     db: Session = Depends(get_db),
@@ -342,7 +342,7 @@ async def cancel_appointment(
     )
 
 @router.get("/clients/{client_id}/appointments", response_model=List[AppointmentResponse])
-async def get_client_appointments(
+def get_client_appointments(
     client_id: UUID,
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
@@ -386,7 +386,7 @@ async def get_client_appointments(
 # Recurring Appointments
 
 @router.post("/recurring", response_model=RecurringAppointmentResponse)
-async def create_recurring_appointment(
+def create_recurring_appointment(
     recurring_data: RecurringAppointmentCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_permission("appointments", "create"))
@@ -450,7 +450,7 @@ async def create_recurring_appointment(
         )
 
 @router.get("/recurring", response_model=List[RecurringAppointmentResponse])
-async def get_recurring_appointments(
+def get_recurring_appointments(
     client_id: Optional[UUID] = None,
     staff_id: Optional[UUID] = None,
     active_only: bool = Query(True, description="Only return active recurring appointments"),
@@ -477,7 +477,7 @@ async def get_recurring_appointments(
     return [RecurringAppointmentResponse.model_validate(ra) for ra in recurring_appointments]
 
 @router.put("/recurring/{recurring_id}", response_model=RecurringAppointmentResponse)
-async def update_recurring_appointment(
+def update_recurring_appointment(
     recurring_id: UUID,
     recurring_update: RecurringAppointmentUpdate,
     db: Session = Depends(get_db),
@@ -517,7 +517,7 @@ async def update_recurring_appointment(
         )
 
 @router.post("/recurring/{recurring_id}/generate", response_model=List[AppointmentResponse])
-async def generate_appointment_instances(
+def generate_appointment_instances(
     recurring_id: UUID,
     start_date: date = Query(..., description="Start date for generation"),
     end_date: date = Query(..., description="End date for generation"),
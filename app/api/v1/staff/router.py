@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import or_
 from typing import List, Optional
 from uuid import UUID
 from app.core.database import get_db
+from app.core.cache import invalidate_approval_counts
 from app.core.security import get_password_hash, generate_random_password
 from app.models.user import User, Organization, Role, UserStatus, Permission
 from app.models.staff import Staff, EmploymentStatus, StaffAssignment, AssignmentType
@@ -26,7 +27,7 @@ from app.schemas.staff import (
     TimeOffRequestResponse
 )
 from app.models.staff import TimeOffRequest, TimeOffStatus, TimeOffType
-from app.models.scheduling import Shift, ShiftExchangeRequest, ShiftExchangeStatus, ShiftStatus
+from app.models.scheduling import Shift, ShiftExchangeRequest, ShiftExchangeStatus, ShiftStatus, SHIFT_EXCHANGE_STATUSES
 from app.schemas.scheduling import (
     ShiftExchangeRequestCreate,
     ShiftExchangeRequestPeerResponse,
@@ -1474,6 +1475,7 @@ async def create_my_time_off_request(
 
         db.add(new_request)
         db.commit()
+        invalidate_approval_counts(current_user.organization_id)
         db.refresh(new_request)
 
         logger.info(f"Time-off request created by {current_user.email}: {new_request.id}")
@@ -1572,6 +1574,7 @@ async def cancel_my_time_off_request(
         time_off_request.status = TimeOffStatus.CANCELLED
         time_off_request.updated_at = datetime.now(timezone.utc)
         db.commit()
+        invalidate_approval_counts(current_user.organization_id)
 
         logger.info(f"Time-off request {request_id} cancelled by {current_user.email}")
 
@@ -1591,6 +1594,7 @@ async def cancel_my_time_off_request(
 
 # ==================== DSP Shift Exchange Request Endpoints ====================
 
+
 def _build_staff_shift_info(shift: Shift, staff: Staff, db: Session) -> StaffShiftInfo:
     """Helper function to build StaffShiftInfo from shift and staff"""
     client_name = None
@@ -1866,14 +1870,13 @@ async def get_my_shift_exchange_requests(
 
     # Apply status filter
     if status_filter:
-        try:
-            status_enum = ShiftExchangeStatus(status_filter.lower())
-            query = query.filter(ShiftExchangeRequest.status == status_enum)
-        except ValueError:
+        status_enum = SHIFT_EXCHANGE_STATUSES.get(status_filter.lower())
+        if status_enum is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid status filter. Valid values: pending_peer, pending_manager, approved, denied, cancelled"
+                detail=f"Invalid status filter. Valid values: {', '.join(SHIFT_EXCHANGE_STATUSES)}"
             )
+        query = query.filter(ShiftExchangeRequest.status == status_enum)
 
     exchanges = query.order_by(ShiftExchangeRequest.requested_at.desc()).all()
 
@@ -1916,6 +1919,7 @@ async def get_incoming_shift_exchange_requests(
 @router.post("/me/shift-exchange-requests", response_model=ShiftExchangeRequestResponse, status_code=status.HTTP_201_CREATED)
 async def create_shift_exchange_request(
     request_data: ShiftExchangeRequestCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -2053,7 +2057,8 @@ async def create_shift_exchange_request(
                 if client:
                     target_client = f"{client.first_name} {client.last_name}"
 
-            await EmailService.send_shift_exchange_request_email(
+            background_tasks.add_task(
+                EmailService.send_shift_exchange_request_email,
                 to_email=target_user.email,
                 recipient_name=target_name,
                 requester_name=requester_name,
@@ -2065,9 +2070,9 @@ async def create_shift_exchange_request(
                 target_client=target_client,
                 reason=request_data.reason
             )
-            logger.info(f"Shift exchange request email sent to {target_user.email}")
+            logger.info(f"Shift exchange request email queued for {target_user.email}")
         except Exception as email_error:
-            logger.error(f"Failed to send shift exchange request email: {str(email_error)}")
+            logger.error(f"Failed to queue shift exchange request email: {str(email_error)}")
             # Don't fail the request if email fails
 
         return _build_exchange_response(new_request, db)
@@ -2085,6 +2090,7 @@ async def create_shift_exchange_request(
 async def accept_shift_exchange_request(
     request_id: UUID,
     response_data: ShiftExchangeRequestPeerResponse,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -2133,6 +2139,7 @@ async def accept_shift_exchange_request(
         exchange.updated_at = datetime.now(timezone.utc)
 
         db.commit()
+        invalidate_approval_counts(current_user.organization_id)
         db.refresh(exchange)
 
         logger.info(f"Shift exchange request {request_id} accepted by {current_user.email}")
@@ -2163,7 +2170,8 @@ async def accept_shift_exchange_request(
                     target_client = f"{client.first_name} {client.last_name}"
 
             # 1. Notify the requester that their request was accepted
-            await EmailService.send_shift_exchange_accepted_email(
+            background_tasks.add_task(
+                EmailService.send_shift_exchange_accepted_email,
                 to_email=requester_staff.user.email,
                 recipient_name=requester_staff.full_name,
                 accepter_name=target_staff.full_name,
@@ -2174,7 +2182,7 @@ async def accept_shift_exchange_request(
                 requester_client=requester_client,
                 target_client=target_client
             )
-            logger.info(f"Shift exchange acceptance email sent to requester {requester_staff.user.email}")
+            logger.info(f"Shift exchange acceptance email queued for requester {requester_staff.user.email}")
 
             # 2. Notify manager(s) that a shift exchange needs approval
             # Find managers in the organization
@@ -2188,24 +2196,30 @@ async def accept_shift_exchange_request(
                 )
             ).all()
 
-            for manager in managers:
-                await EmailService.send_shift_exchange_pending_manager_email(
-                    to_email=manager.email,
-                    manager_name=f"{manager.first_name} {manager.last_name}",
-                    requester_name=requester_staff.full_name,
-                    target_name=target_staff.full_name,
-                    requester_shift_date=requester_shift_date,
-                    requester_shift_time=requester_shift_time,
-                    target_shift_date=target_shift_date,
-                    target_shift_time=target_shift_time,
-                    requester_client=requester_client,
-                    target_client=target_client,
-                    reason=exchange.reason
-                )
-                logger.info(f"Shift exchange pending approval email sent to manager {manager.email}")
+            background_tasks.add_task(
+                EmailService.send_concurrently,
+                EmailService.send_shift_exchange_pending_manager_email,
+                [
+                    dict(
+                        to_email=manager.email,
+                        manager_name=f"{manager.first_name} {manager.last_name}",
+                        requester_name=requester_staff.full_name,
+                        target_name=target_staff.full_name,
+                        requester_shift_date=requester_shift_date,
+                        requester_shift_time=requester_shift_time,
+                        target_shift_date=target_shift_date,
+                        target_shift_time=target_shift_time,
+                        requester_client=requester_client,
+                        target_client=target_client,
+                        reason=exchange.reason
+                    )
+                    for manager in managers
+                ]
+            )
+            logger.info(f"Shift exchange pending approval emails queued for {len(managers)} managers")
 
         except Exception as email_error:
-            logger.error(f"Failed to send shift exchange acceptance emails: {str(email_error)}")
+            logger.error(f"Failed to queue shift exchange acceptance emails: {str(email_error)}")
             # Don't fail the request if email fails
 
         return _build_exchange_response(exchange, db)
@@ -2223,6 +2237,7 @@ async def accept_shift_exchange_request(
 async def decline_shift_exchange_request(
     request_id: UUID,
     response_data: ShiftExchangeRequestPeerResponse,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -2300,7 +2315,8 @@ async def decline_shift_exchange_request(
                 if client:
                     target_client = f"{client.first_name} {client.last_name}"
 
-            await EmailService.send_shift_exchange_declined_email(
+            background_tasks.add_task(
+                EmailService.send_shift_exchange_declined_email,
                 to_email=requester_staff.user.email,
                 recipient_name=requester_staff.full_name,
                 decliner_name=target_staff.full_name,
@@ -2312,10 +2328,10 @@ async def decline_shift_exchange_request(
                 target_client=target_client,
                 notes=response_data.notes
             )
-            logger.info(f"Shift exchange declined email sent to requester {requester_staff.user.email}")
+            logger.info(f"Shift exchange declined email queued for requester {requester_staff.user.email}")
 
         except Exception as email_error:
-            logger.error(f"Failed to send shift exchange declined email: {str(email_error)}")
+            logger.error(f"Failed to queue shift exchange declined email: {str(email_error)}")
             # Don't fail the request if email fails
 
         return _build_exchange_response(exchange, db)
@@ -2371,6 +2387,7 @@ async def cancel_shift_exchange_request(
         exchange.status = ShiftExchangeStatus.CANCELLED
         exchange.updated_at = datetime.now(timezone.utc)
         db.commit()
+        invalidate_approval_counts(current_user.organization_id)
 
         logger.info(f"Shift exchange request {request_id} cancelled by {current_user.email}")
 
@@ -0,0 +1,75 @@
+import json
+import logging
+from typing import Any, Optional
+
+import redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+redis_client = redis.Redis(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    db=settings.REDIS_DB,
+    password=settings.REDIS_PASSWORD,
+    decode_responses=True,
+    socket_connect_timeout=1,
+    socket_timeout=1
+)
+
+# Redis is an optimization only: every helper fails open so a cache outage
+# degrades to hitting the database instead of failing the request.
+
+
+def cache_get_json(key: str) -> Optional[Any]:
+    """Fetch and decode a JSON value, or None on miss"""
+    try:
+        value = redis_client.get(key)
+    except redis.RedisError as e:
+        logger.warning(f"Redis GET failed for {key}: {str(e)}")
+        return None
+    return json.loads(value) if value is not None else None
+
+
+def cache_set_json(key: str, value: Any, ttl: int) -> None:
+    """Encode and store a JSON value with a TTL"""
+    try:
+        redis_client.set(key, json.dumps(value, default=str), ex=ttl)
+    except redis.RedisError as e:
+        logger.warning(f"Redis SET failed for {key}: {str(e)}")
+
+
+def cache_delete(*keys: str) -> None:
+    """Invalidate one or more keys"""
+    if not keys:
+        return
+    try:
+        redis_client.delete(*keys)
+    except redis.RedisError as e:
+        logger.warning(f"Redis DEL failed: {str(e)}")
+
+
+def approval_count_key(org_id: Any) -> str:
+    return f"mgr:appcount:{org_id}"
+
+
+def invalidate_approval_counts(org_id: Any) -> None:
+    cache_delete(approval_count_key(org_id))
+
+
+def cert_alerts_key(org_id: Any, days_ahead: int) -> str:
+    return f"mgr:certalerts:{org_id}:{days_ahead}"
+
+
+def training_due_soon_key(org_id: Any, day: Any) -> str:
+    return f"mgr:trainingdue:{org_id}:{day.isoformat()}"
+
+
+def invalidate_training_due_soon(org_id: Any, day: Any) -> None:
+    cache_delete(training_due_soon_key(org_id, day))
+
+
+def notice_targets_key(notice_id: Any, updated_at: Any) -> str:
+    # Keyed on the notice revision, so an edit to its targeting is a new key
+    return f"notice:targets:{notice_id}:{updated_at.isoformat()}"
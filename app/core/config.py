@@ -18,7 +18,10 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 360  # 6 hours
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     API_HOST: str = os.getenv("API_HOST", "0.0.0.0")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text")  # "json" for one JSON object per line
+    DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"  # Development checks, never in production
     API_PORT: int = int(os.getenv("API_PORT", "8000"))
+    THREADPOOL_SIZE: int = int(os.getenv("THREADPOOL_SIZE", "40"))  # Worker threads for sync endpoints
 
     # Database Settings
     POSTGRES_USER: str = os.getenv("POSTGRES_USER", "starline")
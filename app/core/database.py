@@ -1,6 +1,7 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, DDL
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from typing import Generator
 import os
 from dotenv import load_dotenv
@@ -15,21 +16,55 @@ POSTGRES_HOST = os.getenv("POSTGRES_HOST", "localhost")
 
 SQLALCHEMY_DATABASE_URL = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    pool_size=20,
-    max_overflow=40,
-    pool_pre_ping=True,
-    pool_recycle=3600
-)
+# Behind PgBouncer in transaction pooling mode the bouncer owns connection
+# multiplexing, so the app must not hold its own pool of server connections.
+DB_USE_PGBOUNCER = os.getenv("DB_USE_PGBOUNCER", "false").lower() == "true"
+
+# SQLAlchemy caches compiled SQL per distinct statement shape and recompiles
+# anything evicted. Every optional filter combination is its own shape, so the
+# default of 500 entries is sized up to keep hot statements resident.
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
+
+if DB_USE_PGBOUNCER:
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        poolclass=NullPool,
+        query_cache_size=DB_QUERY_CACHE_SIZE
+    )
+else:
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        pool_pre_ping=True,
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        query_cache_size=DB_QUERY_CACHE_SIZE
+    )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# Trigram indexes on name columns need pg_trgm before create_all builds them
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
 def get_db() -> Generator:
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def begin_read_only_snapshot(db) -> None:
+    """
+    Restart the session's transaction as REPEATABLE READ READ ONLY so a
+    group of aggregate queries share one consistent MVCC snapshot.
+    Any work already done in the session's current transaction is rolled back.
+    """
+    db.rollback()
+    db.connection(execution_options={
+        "isolation_level": "REPEATABLE READ",
+        "postgresql_readonly": True
+    })
@@ -1,8 +1,10 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import event
+from sqlalchemy.orm import Session, with_loader_criteria
 from typing import Union, List
-from app.core.database import get_db
+from functools import lru_cache
+from app.core.database import Base, get_db
 from app.models.user import User, UserStatus
 from app.core.config import settings
 from jose import JWTError, jwt
@@ -80,4 +82,44 @@ async def get_manager_or_above(current_user: User = Depends(require_role(["super
 
 async def get_staff_or_above(current_user: User = Depends(require_role(["super_admin", "organization_admin", "billing_admin", "hr_manager", "manager", "supervisor", "support_staff", "staff"]))):
     """Dependency for staff level access and above"""
-    return current_user
\ No newline at end of file
+    return current_user
+
+
+@lru_cache(maxsize=None)
+def _org_scoped_models() -> tuple:
+    """Mapped classes whose rows always belong to exactly one organization"""
+    return tuple(
+        mapper.class_
+        for mapper in Base.registry.mappers
+        if "organization_id" in mapper.local_table.c
+        and not mapper.local_table.c.organization_id.nullable
+    )
+
+async def get_org_scoped_db(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> Session:
+    """
+    Request session whose ORM SELECTs are restricted to the current user's
+    organization for every tenant-owned model, including relationship loads
+    """
+    org_id = current_user.organization_id
+    criteria = [
+        with_loader_criteria(
+            model,
+            lambda cls: cls.organization_id == org_id,
+            include_aliases=True
+        )
+        for model in _org_scoped_models()
+    ]
+
+    @event.listens_for(db, "do_orm_execute")
+    def _scope_to_organization(execute_state):
+        if (
+            execute_state.is_select
+            and not execute_state.is_column_load
+            and not execute_state.is_relationship_load
+        ):
+            execute_state.statement = execute_state.statement.options(*criteria)
+
+    return db
@@ -0,0 +1,50 @@
+import functools
+import inspect
+import logging
+from fastapi import HTTPException
+
+
+def handle_errors(action: str):
+    """
+    Wrap an endpoint in the standard error handling: HTTPExceptions pass
+    through, anything else rolls back the request session (when the endpoint
+    takes one as ``db``), is logged with its traceback on the endpoint
+    module's logger and becomes a 500 "Failed to <action>" response.
+
+    Sync endpoints stay sync so FastAPI still runs them in the threadpool.
+    """
+    def decorator(func):
+        logger = logging.getLogger(func.__module__)
+
+        def _fail(kwargs, e: Exception) -> HTTPException:
+            db = kwargs.get("db")
+            if db is not None:
+                db.rollback()
+            logger.exception("Error in %s", func.__name__)
+            return HTTPException(
+                status_code=500,
+                detail=f"Failed to {action}: {str(e)}"
+            )
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except HTTPException:
+                    raise
+                except Exception as e:
+                    raise _fail(kwargs, e)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                raise _fail(kwargs, e)
+        return wrapper
+
+    return decorator
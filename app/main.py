@@ -5,7 +5,13 @@ from contextlib import asynccontextmanager
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+import anyio.to_thread
+import atexit
 import logging
+import logging.handlers
+import queue
+import orjson
+from sqlalchemy import text
 from app.core.config import settings
 from app.core.database import engine, Base
 from app.middleware.audit_middleware import AuditMiddleware
@@ -32,7 +38,36 @@ from app.api.v1 import special_requirements as special_requirements_api
 
 
 
+class JsonLogFormatter(logging.Formatter):
+    """Render each record as a single JSON line for log shippers"""
+
+    def format(self, record):
+        entry = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry).decode()
+
+
 logging.basicConfig(level=logging.INFO)
+root_logger = logging.getLogger()
+log_formatter = JsonLogFormatter() if settings.LOG_FORMAT == "json" else root_logger.handlers[0].formatter
+
+# Records are formatted where they are logged, then handed to a background
+# thread that does the stream I/O, so a slow stdout never stalls a request.
+log_queue = queue.SimpleQueue()
+queue_handler = logging.handlers.QueueHandler(log_queue)
+queue_handler.setFormatter(log_formatter)
+for handler in root_logger.handlers:
+    handler.setFormatter(logging.Formatter("%(message)s"))
+log_listener = logging.handlers.QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+root_logger.handlers = [queue_handler]
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
 limiter = Limiter(key_func=get_remote_address)
@@ -42,6 +77,10 @@ async def lifespan(app: FastAPI):
     import os
     logger.info("Starting up Starline Backend...")
 
+    # Sync endpoints run on anyio's worker threads; size that pool to match
+    # the database pool so requests wait for a thread rather than a connection
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+
     # Create uploads directory if it doesn't exist
     upload_dir = settings.UPLOAD_DIR
     if not os.path.exists(upload_dir):
@@ -114,6 +153,24 @@ async def health_check():
         "version": settings.VERSION
     }
 
+@app.get("/health/db")
+def database_health_check():
+    """Round-trip a SELECT 1 through the pool; also warms a connection after deploys"""
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    except Exception as e:
+        logger.error(f"Database health check failed: {str(e)}")
+        return JSONResponse(
+            status_code=503,
+            content={"status": "unhealthy", "database": "unreachable"}
+        )
+    return {
+        "status": "healthy",
+        "database": "connected",
+        "pool": engine.pool.status()
+    }
+
 app.include_router(
     login.router,
     prefix=f"{settings.API_V1_STR}/auth",
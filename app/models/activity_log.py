@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, Text, Integer, Boolean, Enum as SQLEnum
+from sqlalchemy import Column, String, ForeignKey, DateTime, Text, Integer, Boolean, Enum as SQLEnum, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
@@ -115,3 +115,9 @@ class ActivityLog(Base):
     client = relationship("Client")
     staff = relationship("User")
     organization = relationship("Organization")
+
+    # Indexes for performance
+    __table_args__ = (
+        Index("ix_activity_logs_org_date", "organization_id", "activity_date"),
+        Index("ix_activity_logs_client_org_date", "client_id", "organization_id", activity_date.desc(), id.desc()),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -29,6 +29,11 @@ class BowelMovementLog(PHIAuditMixin, Base):
     staff = relationship("User", foreign_keys=[staff_id])
     organization = relationship("Organization")
 
+    # Indexes for performance
+    __table_args__ = (
+        Index("ix_bowel_movement_logs_client_org_recorded", "client_id", "organization_id", recorded_at.desc(), id.desc()),
+    )
+
     def __repr__(self):
         return f"<BowelMovementLog(id={self.id}, client_id={self.client_id}, recorded_at={self.recorded_at})>"
 
@@ -1,6 +1,7 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Date, JSON, Integer, DECIMAL, CheckConstraint
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Date, JSON, Integer, DECIMAL, CheckConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 from app.core.database import Base
 from app.core.audit_mixins import PHIAuditMixin
 from datetime import datetime, timezone
@@ -47,12 +48,26 @@ class Client(PHIAuditMixin, Base):
     __table_args__ = (
         CheckConstraint(f"gender IN {GENDER_VALUES}", name="check_client_gender"),
         CheckConstraint(f"status IN {CLIENT_STATUS_VALUES}", name="check_client_status"),
+        # Trigram index over the full name for ilike search (requires pg_trgm)
+        Index(
+            "ix_clients_full_name_trgm",
+            (first_name + " " + last_name).label("full_name"),
+            postgresql_using="gin",
+            postgresql_ops={"full_name": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_clients_client_id_trgm",
+            client_id,
+            postgresql_using="gin",
+            postgresql_ops={"client_id": "gin_trgm_ops"}
+        ),
     )
 
     # Relationships
     organization = relationship("Organization", foreign_keys=[organization_id])
     user = relationship("User", foreign_keys=[user_id], backref="client_profile")
     creator = relationship("User", foreign_keys=[created_by])
+    location = relationship("Location", foreign_keys=[location_id])
     contacts = relationship("ClientContact", back_populates="client", cascade="all, delete-orphan")
     assignments = relationship("ClientAssignment", back_populates="client", cascade="all, delete-orphan")
     programs = relationship("ClientProgram", back_populates="client", cascade="all, delete-orphan")
@@ -72,10 +87,15 @@ class Client(PHIAuditMixin, Base):
     # meal_logs and activity_logs relationships are accessed via queries, not ORM relationships
     # to avoid circular import issues
 
-    @property
+    @hybrid_property
     def full_name(self):
         return f"{self.first_name} {self.last_name}"
 
+    @full_name.expression
+    def full_name(cls):
+        # Must match the trigram expression index so name searches can use it
+        return cls.first_name + " " + cls.last_name
+
     # Audit configuration
     __audit_resource_type__ = "client"
     __audit_phi_fields__ = [
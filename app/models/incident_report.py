@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Date, DateTime, Text, ForeignKey, Boolean, Enum
+from sqlalchemy import Column, String, Date, DateTime, Text, ForeignKey, Boolean, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -68,5 +68,11 @@ class IncidentReport(Base):
     staff = relationship("User", foreign_keys=[staff_id])
     organization = relationship("Organization")
 
+    # Indexes for performance
+    __table_args__ = (
+        Index("ix_incident_reports_org_date_status_severity", "organization_id", "incident_date", "status", "severity"),
+        Index("ix_incident_reports_client_org_date", "client_id", "organization_id", incident_date.desc(), id.desc()),
+    )
+
     def __repr__(self):
         return f"<IncidentReport(id={self.id}, type={self.incident_type}, severity={self.severity})>"
\ No newline at end of file
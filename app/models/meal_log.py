@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, Text, Float, Integer, Boolean, Enum as SQLEnum
+from sqlalchemy import Column, String, ForeignKey, DateTime, Text, Float, Integer, Boolean, Enum as SQLEnum, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
@@ -76,3 +76,9 @@ class MealLog(Base):
     client = relationship("Client")
     staff = relationship("User")
     organization = relationship("Organization")
+
+    # Indexes for performance
+    __table_args__ = (
+        Index("ix_meal_logs_org_date", "organization_id", "meal_date"),
+        Index("ix_meal_logs_client_org_date", "client_id", "organization_id", meal_date.desc(), id.desc()),
+    )
@@ -1,7 +1,7 @@
 """
 Notice/Announcement Models
 """
-from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Enum as SQLEnum, JSON
+from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Enum as SQLEnum, JSON, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
@@ -81,6 +81,22 @@ class Notice(Base):
     target_client = relationship("Client", foreign_keys=[target_client_id])
     target_location = relationship("Location", foreign_keys=[target_location_id])
 
+    # Indexes for performance
+    __table_args__ = (
+        # Every reader-facing query filters on is_active and pages by newest
+        Index(
+            "ix_notices_org_active_created",
+            "organization_id",
+            created_at.desc(),
+            postgresql_where=(is_active == True)
+        ),
+    )
+
+    @property
+    def target_user_ids(self) -> frozenset:
+        """Targeted user IDs as a set, for O(1) membership checks"""
+        return frozenset(self.target_users or ())
+
 
 class NoticeReadReceipt(Base):
     """Track which users have read which notices"""
@@ -97,3 +113,8 @@ class NoticeReadReceipt(Base):
     # Relationships
     notice = relationship("Notice", back_populates="read_receipts")
     user = relationship("User")
+
+    # Indexes for performance
+    __table_args__ = (
+        Index("uq_notice_read_receipts_notice_user", "notice_id", "user_id", unique=True),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Enum, Integer, DECIMAL, Date, Time, ARRAY
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Enum, Integer, DECIMAL, Date, Time, ARRAY, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -76,6 +76,9 @@ class ShiftExchangeStatus(enum.Enum):
     DENIED = "denied"                  # Either peer declined or manager denied
     CANCELLED = "cancelled"            # Requester cancelled
 
+# Status filter values accepted by the exchange lists, by their lowercase value
+SHIFT_EXCHANGE_STATUSES = {s.value: s for s in ShiftExchangeStatus}
+
 class AppointmentType(enum.Enum):
     MEDICAL = "medical"
     THERAPY = "therapy"
@@ -200,9 +203,16 @@ class Shift(Base):
     schedule = relationship("Schedule", back_populates="shifts")
     staff = relationship("Staff", foreign_keys=[staff_id])
     client = relationship("Client", foreign_keys=[client_id])
+    location = relationship("Location", foreign_keys=[location_id])
     assignments = relationship("ShiftAssignment", back_populates="shift", cascade="all, delete-orphan")
     time_entries = relationship("TimeClockEntry", back_populates="shift", cascade="all, delete-orphan")
 
+    # Indexes for performance
+    __table_args__ = (
+        Index("ix_shifts_date_status", "shift_date", "status"),
+        Index("ix_shifts_staff_date_start", "staff_id", "shift_date", "start_time"),
+    )
+
 
 class ShiftAssignment(Base):
     __tablename__ = "shift_assignments"
@@ -324,6 +334,12 @@ class Appointment(Base):
     staff = relationship("Staff", foreign_keys=[staff_id])
     transport_staff = relationship("Staff", foreign_keys=[transport_staff_id])
 
+    # Indexes for performance
+    __table_args__ = (
+        Index("ix_appointments_org_start", "organization_id", "start_datetime"),
+        Index("ix_appointments_client_start", "client_id", "start_datetime"),
+    )
+
 
 class RecurringAppointment(Base):
     __tablename__ = "recurring_appointments"
@@ -482,4 +498,15 @@ class ShiftExchangeRequest(Base):
     requester_shift = relationship("Shift", foreign_keys=[requester_shift_id])
     target_staff = relationship("Staff", foreign_keys=[target_staff_id])
     target_shift = relationship("Shift", foreign_keys=[target_shift_id])
-    manager_responder = relationship("User", foreign_keys=[manager_responded_by])
\ No newline at end of file
+    manager_responder = relationship("User", foreign_keys=[manager_responded_by])
+
+    # Indexes for performance
+    __table_args__ = (
+        Index("ix_shift_exchange_requests_org_status_requested", "organization_id", "status", requested_at.desc()),
+        Index(
+            "ix_shift_exchange_requests_pending_manager",
+            "organization_id",
+            requested_at.desc(),
+            postgresql_where=(status == ShiftExchangeStatus.PENDING_MANAGER)
+        ),
+    )
\ No newline at end of file
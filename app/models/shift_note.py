@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Date, DateTime, Text, ForeignKey
+from sqlalchemy import Column, String, Date, DateTime, Text, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -35,5 +35,11 @@ class ShiftNote(Base):
     staff = relationship("User", foreign_keys=[staff_id])
     organization = relationship("Organization")
 
+    # Indexes for performance
+    __table_args__ = (
+        Index("ix_shift_notes_org_created", "organization_id", "created_at"),
+        Index("ix_shift_notes_client_org_created", "client_id", "organization_id", created_at.desc(), id.desc()),
+    )
+
     def __repr__(self):
         return f"<ShiftNote(id={self.id}, client_id={self.client_id}, shift_date={self.shift_date})>"
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Date, Integer, JSON
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Date, Integer, JSON, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -30,6 +30,11 @@ class SleepLog(PHIAuditMixin, Base):
     staff = relationship("User", foreign_keys=[staff_id])
     organization = relationship("Organization")
 
+    # Indexes for performance
+    __table_args__ = (
+        Index("ix_sleep_logs_client_org_recorded", "client_id", "organization_id", recorded_at.desc(), id.desc()),
+    )
+
     def __repr__(self):
         return f"<SleepLog(id={self.id}, client_id={self.client_id}, shift_date={self.shift_date}, total_sleep_minutes={self.total_sleep_minutes})>"
 
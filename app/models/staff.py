@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Enum, Integer, DECIMAL, Date
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Enum, Integer, DECIMAL, Date, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -77,6 +77,11 @@ class Staff(Base):
     time_off_requests = relationship("TimeOffRequest", back_populates="staff", cascade="all, delete-orphan")
     payroll_info = relationship("StaffPayroll", back_populates="staff", uselist=False, cascade="all, delete-orphan")
 
+    # Indexes for performance
+    __table_args__ = (
+        Index("ix_staff_org_employment_status", "organization_id", "employment_status"),
+    )
+
     @property
     def full_name(self):
         if self.user:
@@ -173,6 +178,11 @@ class StaffCertification(Base):
 
     staff = relationship("Staff", back_populates="certifications")
 
+    # Indexes for performance
+    __table_args__ = (
+        Index("ix_cert_staff_expiry_status", "staff_id", "status", "expiry_date"),
+    )
+
 class TrainingProgram(Base):
     __tablename__ = "training_programs"
 
@@ -227,6 +237,17 @@ class TrainingRecord(Base):
     staff = relationship("Staff", back_populates="training_records")
     training_program = relationship("TrainingProgram", back_populates="training_records")
 
+    # Indexes for performance
+    __table_args__ = (
+        Index("ix_training_records_staff_enrolled", "staff_id", enrollment_date.desc(), id.desc()),
+        Index("ix_training_records_program_staff", "training_program_id", "staff_id"),
+        Index(
+            "ix_training_records_open_due",
+            "due_date",
+            postgresql_where=(status != TrainingStatus.COMPLETED) & due_date.isnot(None)
+        ),
+    )
+
 class ProficiencyLevel(enum.Enum):
     BEGINNER = "beginner"
     INTERMEDIATE = "intermediate"
@@ -342,6 +363,12 @@ class StaffAssignment(Base):
     staff = relationship("Staff", back_populates="assignments")
     client = relationship("Client", foreign_keys=[client_id])
 
+    # Indexes for performance
+    __table_args__ = (
+        Index("ix_staff_assignments_staff_active", "staff_id", "is_active"),
+        Index("ix_staff_assignments_client_active", "client_id", "is_active"),
+    )
+
 class TimeOffType(enum.Enum):
     VACATION = "vacation"
     SICK = "sick"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Boolean, Enum
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Boolean, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -55,5 +55,10 @@ class Task(Base):
     created_by_user = relationship("User", foreign_keys=[created_by])
     organization = relationship("Organization")
 
+    # Indexes for performance
+    __table_args__ = (
+        Index("ix_tasks_org_status_due", "organization_id", "status", "due_date"),
+    )
+
     def __repr__(self):
         return f"<Task(id={self.id}, title={self.title}, status={self.status})>"
\ No newline at end of file
@@ -1,6 +1,7 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Enum, Integer, Table
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Enum, Integer, Table, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, backref
+from sqlalchemy.ext.hybrid import hybrid_property
 from app.core.database import Base
 from app.core.audit_mixins import AuditMixin
 from datetime import datetime, timezone
@@ -94,10 +95,31 @@ class User(AuditMixin, Base):
     custom_permissions = relationship("Permission", secondary=user_permissions, backref="users_with_custom")
     notifications = relationship("Notification", back_populates="user", cascade="all, delete-orphan")
 
-    @property
+    __table_args__ = (
+        # Trigram index over the full name for ilike search (requires pg_trgm)
+        Index(
+            "ix_users_full_name_trgm",
+            (first_name + " " + last_name).label("full_name"),
+            postgresql_using="gin",
+            postgresql_ops={"full_name": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_users_email_trgm",
+            email,
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"}
+        ),
+    )
+
+    @hybrid_property
     def full_name(self):
         return f"{self.first_name} {self.last_name}"
 
+    @full_name.expression
+    def full_name(cls):
+        # Must match the trigram expression index so name searches can use it
+        return cls.first_name + " " + cls.last_name
+
     # Audit configuration
     __audit_resource_type__ = "user"
     __audit_phi_fields__ = ["first_name", "last_name", "email", "phone_number"]
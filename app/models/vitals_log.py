@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, Integer, DateTime, Text, ForeignKey, Boolean
+from sqlalchemy import Column, String, Float, Integer, DateTime, Text, ForeignKey, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -37,6 +37,12 @@ class VitalsLog(PHIAuditMixin, Base):
     staff = relationship("User", foreign_keys=[staff_id])
     organization = relationship("Organization")
 
+    # Indexes for performance
+    __table_args__ = (
+        Index("ix_vitals_logs_org_recorded", "organization_id", "recorded_at"),
+        Index("ix_vitals_logs_client_org_recorded", "client_id", "organization_id", recorded_at.desc(), id.desc()),
+    )
+
     def __repr__(self):
         return f"<VitalsLog(id={self.id}, client_id={self.client_id}, recorded_at={self.recorded_at})>"
 
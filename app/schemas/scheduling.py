@@ -633,6 +633,7 @@ class ShiftExchangeRequestResponse(BaseModel):
     manager_responded_by: Optional[UUID] = None
     manager_responded_at: Optional[datetime] = None
     manager_response_notes: Optional[str] = None
+    manager_name: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
@@ -1,7 +1,10 @@
 import resend
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Callable, Awaitable
 from jinja2 import Environment, FileSystemLoader
+from starlette.concurrency import run_in_threadpool
 from app.core.config import settings
+import asyncio
+import logging
 import os
 
 resend.api_key = settings.RESEND_API_KEY
@@ -9,6 +12,8 @@ resend.api_key = settings.RESEND_API_KEY
 template_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "emails", "templates")
 env = Environment(loader=FileSystemLoader(template_dir))
 
+logger = logging.getLogger(__name__)
+
 class EmailService:
     @staticmethod
     def render_template(template_name: str, context: Dict[str, Any]) -> str:
@@ -33,13 +38,29 @@ class EmailService:
                 "html": html_content
             }
 
-            response = resend.Emails.send(params)
+            # The Resend client is blocking; keep it off the event loop
+            response = await run_in_threadpool(resend.Emails.send, params)
             return response.get("id") is not None
 
-        except Exception as e:
-            print(f"Error sending email: {str(e)}")
+        except Exception:
+            logger.exception("Error sending %s email to %s", template_name, to)
             return False
 
+    @staticmethod
+    async def send_concurrently(
+        send: Callable[..., Awaitable[bool]],
+        messages: List[Dict[str, Any]]
+    ) -> List[bool]:
+        """Send one email per kwargs dict in `messages` with `send`, all at once rather than in turn"""
+        results = await asyncio.gather(
+            *(send(**message) for message in messages),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error sending email: {str(result)}")
+        return [result is True for result in results]
+
     @staticmethod
     async def send_verification_email(
         email: str,
@@ -0,0 +1,129 @@
+"""
+Query-count regression guard for the manager oversight endpoints.
+
+Runs the app in-process with FastAPI's TestClient against the database
+configured in .env, counts the SQL statements each request sends through
+the engine, and fails if an endpoint exceeds its budget. List endpoints
+get a fixed budget plus an allowance per returned row, so a newly
+introduced N+1 shows up as soon as the page has more than a few rows.
+
+Seed the database first (e.g. 100 staff and 100 clients) so the list
+pages are full, then run:
+
+    python tests/verify_manager_query_counts.py
+"""
+import sys
+from contextlib import contextmanager
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.main import app
+from app.core.config import settings
+from app.core.database import engine
+
+BASE_URL = settings.API_V1_STR
+ADMIN_EMAIL = "support@starline.com"
+ADMIN_PASSWORD = "Admin123!!"
+PAGE_SIZE = 100
+
+# endpoint -> (fixed statements, statements per returned row)
+# Authentication accounts for two statements (user lookup + role load).
+# Lower these as the remaining per-row counts are batched; never raise them
+# without understanding which new query pushed the endpoint over.
+QUERY_BUDGETS = {
+    "dashboard": (30, 0),
+    "staff": (5, 3),
+    "clients": (7, 4),
+    "client_details": (15, 0),
+    "client_vitals": (6, 0),
+    # Exchange page + four staff/user IN loads + two shift loads + manager names
+    "shift_exchanges": (10, 0),
+}
+
+
+@contextmanager
+def count_queries():
+    """Collect every statement executed on the engine inside the block"""
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def login(client):
+    print(f"Logging in as {ADMIN_EMAIL}...")
+    response = client.post(
+        f"{BASE_URL}/auth/login",
+        json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD}
+    )
+    if response.status_code != 200:
+        print(f"Login failed: {response.text}")
+        sys.exit(1)
+    return response.json()["access_token"]
+
+
+def check(client, headers, name, path, rows_of=None):
+    with count_queries() as statements:
+        response = client.get(f"{BASE_URL}{path}", headers=headers)
+
+    if response.status_code != 200:
+        print(f"FAIL {name}: {response.status_code} {response.text}")
+        return False, None
+
+    body = response.json()
+    rows = len(rows_of(body)) if rows_of else 0
+    fixed, per_row = QUERY_BUDGETS[name]
+    budget = fixed + per_row * rows
+
+    if len(statements) > budget:
+        print(f"FAIL {name}: {len(statements)} queries for {rows} rows (budget {budget})")
+        for statement in statements:
+            print(f"    {' '.join(statement.split())[:160]}")
+        return False, body
+
+    print(f"OK   {name}: {len(statements)} queries for {rows} rows (budget {budget})")
+    return True, body
+
+
+def main():
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {login(client)}"}
+
+    results = []
+
+    ok, _ = check(client, headers, "dashboard", "/manager/dashboard")
+    results.append(ok)
+
+    ok, _ = check(client, headers, "staff", f"/manager/staff?limit={PAGE_SIZE}", rows_of=lambda body: body)
+    results.append(ok)
+
+    ok, clients = check(client, headers, "clients", f"/manager/clients?limit={PAGE_SIZE}", rows_of=lambda body: body)
+    results.append(ok)
+
+    if clients:
+        client_id = clients[0]["id"]
+        ok, _ = check(client, headers, "client_details", f"/manager/clients/{client_id}")
+        results.append(ok)
+
+        ok, _ = check(client, headers, "client_vitals", f"/manager/clients/{client_id}/vitals?limit={PAGE_SIZE}")
+        results.append(ok)
+    else:
+        print("No clients returned; skipping per-client endpoints")
+
+    ok, _ = check(client, headers, "shift_exchanges", f"/manager/shift-exchange-requests?limit={PAGE_SIZE}")
+    results.append(ok)
+
+    if not all(results):
+        sys.exit(1)
+    print("All manager endpoints are within their query budgets")
+
+
+if __name__ == "__main__":
+    main()